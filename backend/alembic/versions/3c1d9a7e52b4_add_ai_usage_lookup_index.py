@@ -0,0 +1,30 @@
+"""add_ai_usage_lookup_index
+
+Revision ID: 3c1d9a7e52b4
+Revises: 7bf85a2821dd
+Create Date: 2026-10-17 14:21:08.316274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1d9a7e52b4'
+down_revision = '7bf85a2821dd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the per-(user, feature) window reads that warm the rate limiter
+    op.create_index(
+        'ix_ai_usage_user_feature_timestamp',
+        'ai_usage',
+        ['user_id', 'feature', 'timestamp'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ai_usage_user_feature_timestamp', table_name='ai_usage')
@@ -0,0 +1,41 @@
+"""add_story_pool_table
+
+Revision ID: 5e3f81b6a4c2
+Revises: 9d4a6c3e1f27
+Create Date: 2026-10-17 19:04:41.518230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e3f81b6a4c2'
+down_revision = '9d4a6c3e1f27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'story_pool',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('hsk_level', sa.Integer(), nullable=False),
+        sa.Column('topic', sa.String(), nullable=False),
+        sa.Column('length', sa.String(), nullable=False),
+        sa.Column('story_data', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Oldest ready story of a combination, for the claim in StoryPool.take
+    op.create_index(
+        'ix_story_pool_combination',
+        'story_pool',
+        ['hsk_level', 'topic', 'length', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_story_pool_combination', table_name='story_pool')
+    op.drop_table('story_pool')
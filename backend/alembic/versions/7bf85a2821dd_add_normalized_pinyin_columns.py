@@ -0,0 +1,71 @@
+"""add_normalized_pinyin_columns
+
+Revision ID: 7bf85a2821dd
+Revises: e966d2ff69c5
+Create Date: 2026-10-17 11:03:27.540913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.pinyin import numbered_key, toneless_key
+
+
+# revision identifiers, used by Alembic.
+revision = '7bf85a2821dd'
+down_revision = 'e966d2ff69c5'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# Expression index from e966d2ff69c5 (keep identical to it), superseded by the
+# pinyin_toneless column
+TONED_VOWELS = "āáǎàēéěèīíǐìōóǒòūúǔùǖǘǚǜ"
+PLAIN_VOWELS = "aaaaeeeeiiiioooouuuuüüüü"
+
+
+def upgrade() -> None:
+    op.add_column('hanzi_words', sa.Column('pinyin_toneless', sa.String(), nullable=True))
+    op.add_column('hanzi_words', sa.Column('pinyin_numbered', sa.String(), nullable=True))
+
+    # Backfill existing rows in batches (new rows are filled by the ORM on insert)
+    connection = op.get_bind()
+    rows = connection.execute(sa.text("SELECT id, pinyin FROM hanzi_words")).fetchall()
+    update = sa.text(
+        "UPDATE hanzi_words SET pinyin_toneless = :toneless, pinyin_numbered = :numbered "
+        "WHERE id = :id"
+    )
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(update, [
+            {"id": row.id, "toneless": toneless_key(row.pinyin), "numbered": numbered_key(row.pinyin)}
+            for row in rows[start:start + BATCH_SIZE]
+        ])
+
+    # varchar_pattern_ops lets btree serve both '=' and 'prefix%' lookups in any locale
+    op.execute(
+        "CREATE INDEX ix_hanzi_words_pinyin_toneless ON hanzi_words "
+        "(pinyin_toneless varchar_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_hanzi_words_pinyin_numbered ON hanzi_words "
+        "(pinyin_numbered varchar_pattern_ops)"
+    )
+    # Substring search moves from the expression index to the stored column
+    op.execute(
+        "CREATE INDEX ix_hanzi_words_pinyin_toneless_trgm ON hanzi_words "
+        "USING gin (pinyin_toneless gin_trgm_ops)"
+    )
+    op.drop_index('ix_hanzi_words_pinyin_key_trgm', table_name='hanzi_words')
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_hanzi_words_pinyin_key_trgm ON hanzi_words "
+        f"USING gin ((replace(translate(lower(pinyin), '{TONED_VOWELS}', '{PLAIN_VOWELS}'), ' ', '')) gin_trgm_ops)"
+    )
+    op.drop_index('ix_hanzi_words_pinyin_toneless_trgm', table_name='hanzi_words')
+    op.drop_index('ix_hanzi_words_pinyin_numbered', table_name='hanzi_words')
+    op.drop_index('ix_hanzi_words_pinyin_toneless', table_name='hanzi_words')
+
+    op.drop_column('hanzi_words', 'pinyin_numbered')
+    op.drop_column('hanzi_words', 'pinyin_toneless')
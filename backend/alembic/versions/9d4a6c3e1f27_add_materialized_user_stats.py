@@ -0,0 +1,73 @@
+"""add_materialized_user_stats
+
+Revision ID: 9d4a6c3e1f27
+Revises: b52e8f0c7d19
+Create Date: 2026-10-17 17:12:09.204518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4a6c3e1f27'
+down_revision = 'b52e8f0c7d19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_learning_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('hsk_level', sa.Integer(), nullable=False),
+        sa.Column('words_learning', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('mastered_words', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('mastery_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('correct_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('incorrect_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'hsk_level')
+    )
+    op.create_table(
+        'user_writing_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('hsk_level', sa.Integer(), nullable=False),
+        sa.Column('characters_practiced', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('attempts_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('accuracy_total', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('mastered_characters', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('characters_in_progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('new_characters', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id', 'hsk_level')
+    )
+
+    # Backfill from the progress tables (same aggregates as StatsService.rebuild_*)
+    op.execute(
+        "INSERT INTO user_learning_stats "
+        "(user_id, hsk_level, words_learning, mastered_words, mastery_total, correct_total, incorrect_total) "
+        "SELECT p.user_id, w.hsk_level, count(*), "
+        "sum(CASE WHEN COALESCE(p.mastery_level, 0) >= 8 THEN 1 ELSE 0 END), "
+        "sum(COALESCE(p.mastery_level, 0)), sum(COALESCE(p.correct_count, 0)), "
+        "sum(COALESCE(p.incorrect_count, 0)) "
+        "FROM user_progress p JOIN hanzi_words w ON w.id = p.word_id "
+        "GROUP BY p.user_id, w.hsk_level"
+    )
+    op.execute(
+        "INSERT INTO user_writing_stats "
+        "(user_id, hsk_level, characters_practiced, attempts_total, accuracy_total, "
+        "mastered_characters, characters_in_progress, new_characters) "
+        "SELECT p.user_id, w.hsk_level, count(*), sum(COALESCE(p.total_attempts, 0)), "
+        "sum(COALESCE(p.accuracy_score, 0)), "
+        "sum(CASE WHEN COALESCE(p.mastery_level, 0) >= 8 THEN 1 ELSE 0 END), "
+        "sum(CASE WHEN COALESCE(p.mastery_level, 0) BETWEEN 3 AND 7 THEN 1 ELSE 0 END), "
+        "sum(CASE WHEN COALESCE(p.mastery_level, 0) < 3 THEN 1 ELSE 0 END) "
+        "FROM writing_progress p JOIN hanzi_words w ON w.id = p.word_id "
+        "GROUP BY p.user_id, w.hsk_level"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_writing_stats')
+    op.drop_table('user_learning_stats')
@@ -0,0 +1,27 @@
+"""add_story_pinyin_columns
+
+Revision ID: a81c4f2d9b36
+Revises: 5e3f81b6a4c2
+Create Date: 2026-10-17 19:48:12.730415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a81c4f2d9b36'
+down_revision = '5e3f81b6a4c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Pinyin returned with generated stories, kept so reads need no LLM call
+    op.add_column('stories', sa.Column('title_pinyin', sa.String(), nullable=True))
+    op.add_column('stories', sa.Column('content_pinyin', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('stories', 'content_pinyin')
+    op.drop_column('stories', 'title_pinyin')
@@ -0,0 +1,42 @@
+"""add_user_progress_review_index
+
+Revision ID: b52e8f0c7d19
+Revises: 3c1d9a7e52b4
+Create Date: 2026-10-17 16:05:42.871203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b52e8f0c7d19'
+down_revision = '3c1d9a7e52b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep only the most recently reviewed row of any duplicated (user, word) pair
+    op.execute(
+        "DELETE FROM user_progress p USING user_progress q "
+        "WHERE p.user_id = q.user_id AND p.word_id = q.word_id "
+        "AND (COALESCE(p.last_reviewed, '-infinity'), p.id) "
+        "< (COALESCE(q.last_reviewed, '-infinity'), q.id)"
+    )
+    op.create_unique_constraint('unique_user_word_progress', 'user_progress', ['user_id', 'word_id'])
+
+    # Due-review queue: range scan on next_review per user, word_id included so
+    # counting and listing due words can be answered from the index alone
+    op.create_index(
+        'ix_user_progress_user_next_review',
+        'user_progress',
+        ['user_id', 'next_review'],
+        unique=False,
+        postgresql_include=['word_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_progress_user_next_review', table_name='user_progress')
+    op.drop_constraint('unique_user_word_progress', 'user_progress', type_='unique')
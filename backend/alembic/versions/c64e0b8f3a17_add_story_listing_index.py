@@ -0,0 +1,30 @@
+"""add_story_listing_index
+
+Revision ID: c64e0b8f3a17
+Revises: a81c4f2d9b36
+Create Date: 2026-10-17 20:21:37.094862
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c64e0b8f3a17'
+down_revision = 'a81c4f2d9b36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the keyset-paginated GET /stories/ listing
+    op.create_index(
+        'ix_stories_published_level_id',
+        'stories',
+        ['is_published', 'hsk_level', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stories_published_level_id', table_name='stories')
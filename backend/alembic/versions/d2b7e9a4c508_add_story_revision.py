@@ -0,0 +1,25 @@
+"""add_story_revision
+
+Revision ID: d2b7e9a4c508
+Revises: c64e0b8f3a17
+Create Date: 2026-10-17 20:58:03.461127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2b7e9a4c508'
+down_revision = 'c64e0b8f3a17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Revision counter behind the ETag of GET /stories/{id}
+    op.add_column('stories', sa.Column('revision', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    op.drop_column('stories', 'revision')
@@ -0,0 +1,84 @@
+"""add_hanzi_word_level_unique
+
+Revision ID: e3a9c71f5d20
+Revises: d2b7e9a4c508
+Create Date: 2026-10-17 22:14:37.508391
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a9c71f5d20'
+down_revision = 'd2b7e9a4c508'
+branch_labels = None
+depends_on = None
+
+# Tables referencing hanzi_words, with the column each word is unique under
+WORD_REFERENCES = (
+    ('user_progress', 'user_id'),
+    ('writing_progress', 'user_id'),
+    ('story_words', 'story_id'),
+    ('vocabulary_set_words', 'vocabulary_set_id'),
+)
+
+
+def upgrade() -> None:
+    # The seed scripts could insert a word twice for one level; keep the
+    # oldest row of every (simplified, hsk_level) and point references at it
+    op.execute(
+        "CREATE TEMPORARY TABLE hanzi_word_merge AS "
+        "SELECT id, keep_id FROM ("
+        "SELECT id, MIN(id) OVER (PARTITION BY simplified, hsk_level) AS keep_id FROM hanzi_words"
+        ") w WHERE id <> keep_id"
+    )
+    for table, owner in WORD_REFERENCES:
+        # Where an owner has several copies of a word, keep the reference to the oldest copy
+        op.execute(
+            f"DELETE FROM {table} r USING hanzi_word_merge m "
+            f"WHERE r.word_id = m.id AND EXISTS ("
+            f"SELECT 1 FROM {table} o LEFT JOIN hanzi_word_merge n ON n.id = o.word_id "
+            f"WHERE o.{owner} = r.{owner} AND o.word_id < r.word_id "
+            f"AND COALESCE(n.keep_id, o.word_id) = m.keep_id)"
+        )
+        op.execute(
+            f"UPDATE {table} r SET word_id = m.keep_id FROM hanzi_word_merge m WHERE r.word_id = m.id"
+        )
+    op.execute("DELETE FROM hanzi_words w USING hanzi_word_merge m WHERE w.id = m.id")
+
+    # Progress rows may have been dropped above: recompute the materialized
+    # stats (same aggregates as StatsService.rebuild_*)
+    merged = op.get_bind().execute(sa.text("SELECT count(*) FROM hanzi_word_merge")).scalar()
+    op.execute("DROP TABLE hanzi_word_merge")
+    if merged:
+        op.execute("DELETE FROM user_learning_stats")
+        op.execute(
+            "INSERT INTO user_learning_stats "
+            "(user_id, hsk_level, words_learning, mastered_words, mastery_total, correct_total, incorrect_total) "
+            "SELECT p.user_id, w.hsk_level, count(*), "
+            "sum(CASE WHEN COALESCE(p.mastery_level, 0) >= 8 THEN 1 ELSE 0 END), "
+            "sum(COALESCE(p.mastery_level, 0)), sum(COALESCE(p.correct_count, 0)), "
+            "sum(COALESCE(p.incorrect_count, 0)) "
+            "FROM user_progress p JOIN hanzi_words w ON w.id = p.word_id "
+            "GROUP BY p.user_id, w.hsk_level"
+        )
+        op.execute("DELETE FROM user_writing_stats")
+        op.execute(
+            "INSERT INTO user_writing_stats "
+            "(user_id, hsk_level, characters_practiced, attempts_total, accuracy_total, "
+            "mastered_characters, characters_in_progress, new_characters) "
+            "SELECT p.user_id, w.hsk_level, count(*), sum(COALESCE(p.total_attempts, 0)), "
+            "sum(COALESCE(p.accuracy_score, 0)), "
+            "sum(CASE WHEN COALESCE(p.mastery_level, 0) >= 8 THEN 1 ELSE 0 END), "
+            "sum(CASE WHEN COALESCE(p.mastery_level, 0) BETWEEN 3 AND 7 THEN 1 ELSE 0 END), "
+            "sum(CASE WHEN COALESCE(p.mastery_level, 0) < 3 THEN 1 ELSE 0 END) "
+            "FROM writing_progress p JOIN hanzi_words w ON w.id = p.word_id "
+            "GROUP BY p.user_id, w.hsk_level"
+        )
+
+    op.create_unique_constraint('unique_hanzi_word_level', 'hanzi_words', ['simplified', 'hsk_level'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('unique_hanzi_word_level', 'hanzi_words', type_='unique')
@@ -0,0 +1,47 @@
+"""add_vocabulary_search_indexes
+
+Revision ID: e966d2ff69c5
+Revises: 6421228aa32f
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e966d2ff69c5'
+down_revision = '6421228aa32f'
+branch_labels = None
+depends_on = None
+
+# Tone-stripping expression of the pinyin trigram index. 7bf85a2821dd replaces
+# the index with one on hanzi_words.pinyin_toneless, which the ORM fills from
+# app.pinyin.toneless_key and app.services.search_service.search_words queries;
+# its downgrade recreates this index and must keep the expression identical.
+TONED_VOWELS = "āáǎàēéěèīíǐìōóǒòūúǔùǖǘǚǜ"
+PLAIN_VOWELS = "aaaaeeeeiiiioooouuuuüüüü"
+
+
+def upgrade() -> None:
+    # Trigram indexes serve the '%q%' LIKE predicates used by /vocabulary/search
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute(
+        "CREATE INDEX ix_hanzi_words_simplified_trgm ON hanzi_words "
+        "USING gin (simplified gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_hanzi_words_english_trgm ON hanzi_words "
+        "USING gin (lower(english) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_hanzi_words_pinyin_key_trgm ON hanzi_words "
+        f"USING gin ((replace(translate(lower(pinyin), '{TONED_VOWELS}', '{PLAIN_VOWELS}'), ' ', '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hanzi_words_pinyin_key_trgm', table_name='hanzi_words')
+    op.drop_index('ix_hanzi_words_english_trgm', table_name='hanzi_words')
+    op.drop_index('ix_hanzi_words_simplified_trgm', table_name='hanzi_words')
@@ -0,0 +1,166 @@
+"""
+Key-value cache backends shared by the response caches
+
+The memory backend is per worker process. The Redis backend shares entries
+across workers and needs the optional `redis` package (CACHE_BACKEND=redis).
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from starlette.concurrency import run_in_threadpool
+from .config import settings
+
+
+class MemoryCacheBackend:
+    """LRU cache with per-entry TTL, safe to use from worker threads"""
+
+    blocking = False  # no I/O: safe to call on the event loop
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self, prefix: str = ""):
+        """Remove every entry whose key starts with prefix (all entries by default)"""
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed cache; eviction is left to Redis (TTL + maxmemory policy)
+    Keys are stored under KEY_PREFIX, so clear() never touches other data in
+    the same database (such as the rate limiter's windows).
+    """
+
+    KEY_PREFIX = "cache:"
+    CLEAR_BATCH = 500
+    blocking = True  # network round trips: keep off the event loop
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(self.KEY_PREFIX + key)
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None):
+        self._client.set(self.KEY_PREFIX + key, value, ex=ttl or None)
+
+    def delete(self, key: str):
+        self._client.delete(self.KEY_PREFIX + key)
+
+    def clear(self, prefix: str = ""):
+        """Remove every cache key starting with prefix (SCAN, so Redis is never blocked)"""
+        pattern = self.KEY_PREFIX + _glob_escape(prefix) + "*"
+        batch = []
+        for key in self._client.scan_iter(match=pattern, count=self.CLEAR_BATCH):
+            batch.append(key)
+            if len(batch) >= self.CLEAR_BATCH:
+                self._client.unlink(*batch)
+                batch = []
+        if batch:
+            self._client.unlink(*batch)
+
+
+def _glob_escape(text: str) -> str:
+    """Escape Redis MATCH pattern characters"""
+    return "".join("\\" + ch if ch in "*?[]\\" else ch for ch in text)
+
+
+def create_backend(max_entries: int = 10000):
+    """Backend selected by CACHE_BACKEND"""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.REDIS_URL)
+    return MemoryCacheBackend(max_entries=max_entries)
+
+
+class ResponseCache:
+    """JSON value cache in one key namespace, with hit/miss counters"""
+
+    def __init__(self, namespace: str, backend, ttl: Optional[int] = None):
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.backend.get(self._key(key))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any):
+        self.backend.set(self._key(key), json.dumps(value, ensure_ascii=False), ttl=self.ttl)
+
+    def delete(self, key: str):
+        self.backend.delete(self._key(key))
+
+    async def get_async(self, key: str) -> Optional[Any]:
+        """get() for async handlers; a blocking backend runs in the threadpool"""
+        if self.backend.blocking:
+            return await run_in_threadpool(self.get, key)
+        return self.get(key)
+
+    async def set_async(self, key: str, value: Any):
+        """set() for async handlers; a blocking backend runs in the threadpool"""
+        if self.backend.blocking:
+            await run_in_threadpool(self.set, key, value)
+        else:
+            self.set(key, value)
+
+    def clear(self):
+        """Remove every entry in this cache's namespace"""
+        self.backend.clear(prefix=self._key(""))
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -6,9 +6,60 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_CACHE_TTL_SECONDS: int = 60  # verified token -> user, per worker (0 disables)
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+    # Password hashing (bcrypt cost changes are applied to each user on next login)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # dedicated threads per worker process
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # waiting jobs before /auth answers 503 (0 = unbounded)
+
+    # Database connection pool (per worker process)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
 
     # Gemini AI
     GEMINI_API_KEY: str = ""
+    GEMINI_MAX_CONCURRENCY: int = 4  # in-flight calls per worker
+    GEMINI_TIMEOUT_SECONDS: float = 30.0
+
+    # Response caches: "memory" (per worker) or "redis" (shared, needs the redis package)
+    CACHE_BACKEND: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    VALIDATION_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    VALIDATION_CACHE_MAX_ENTRIES: int = 10000
+
+    # AI rate limit windows: "memory" or "redis" (shared across workers). "memory"
+    # is only correct with a single worker process: with N uvicorn workers every
+    # limit is effectively N times higher (a warning is logged at startup)
+    RATE_LIMIT_BACKEND: str = "memory"
+
+    # Pre-generated story pool, served by /stories/generate before live generation
+    STORY_POOL_COMBINATIONS: str = "1::short,2::short,3::short"  # hsk_level:topic:length, comma separated
+    STORY_POOL_DEPTH: int = 3  # ready stories kept per combination (0 disables the pool)
+    STORY_POOL_REFILL_PER_MINUTE: float = 4.0  # generations by the refill worker
+    # Run the refill worker in this process (needs GEMINI_API_KEY). Enable it in
+    # exactly one process: every enabled worker refills on its own
+    STORY_POOL_WORKER: bool = False
+
+    # Due-review push stream (/learning/review-count/stream)
+    REVIEW_STREAM_RESYNC_SECONDS: int = 300  # recount even without local changes
+    REVIEW_STREAM_KEEPALIVE_SECONDS: int = 25
+
+    # Vocabulary catalog cache (0 = only reload when invalidated)
+    VOCABULARY_CACHE_TTL_SECONDS: int = 300
+    VOCABULARY_BUNDLE_DIR: str = ""  # prebuilt bundles from build_vocabulary_bundles.py ("" = build in memory)
+
+    # Response compression (brotli needs the optional brotli package)
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller responses are sent as they are
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0-11; higher is much slower for dynamic responses
+
+    # Browser/proxy caching of ETag-versioned responses (vocabulary lists, stories)
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 60  # served without revalidating for this long
 
     class Config:
         env_file = ".env"
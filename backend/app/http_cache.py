@@ -0,0 +1,70 @@
+"""
+Conditional GET support for rarely changing responses
+
+Endpoints derive a strong ETag from a content revision (the vocabulary
+catalog digest, a story's revision counter) before loading or encoding
+anything. A client that sends the same tag back in If-None-Match gets an
+empty 304 instead of the payload.
+"""
+import hashlib
+from typing import Optional, Tuple
+from fastapi import Request, Response
+from .config import settings
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag for a response identified by `parts` (revision first)"""
+    return '"%s"' % hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """Strong ETag of one content coding of a response: "tag" -> "tag-gzip" """
+    return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 specifies for it)"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Tuple[str, ...]) -> Optional[str]:
+    """First of the `available` content codings the client accepts (q=0 excluded)"""
+    accepted = set()
+    for item in (accept_encoding or "").lower().split(","):
+        coding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip())
+    for encoding in available:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def cache_headers(etag: str) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}, must-revalidate",
+    }
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Set the caching headers on `response`; return the 304 response to send
+    instead when the client's copy is current
+    """
+    headers = cache_headers(etag)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
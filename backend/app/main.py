@@ -2,14 +2,25 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routers import auth, stories, vocabulary, progress, vocabulary_sets, exercises, learning, writing, quiz
-from .database import engine, Base
+from .database import engine, async_engine, Base, get_pool_status, get_async_pool_status
+from .services.gemini_service import validation_cache
+from .services.vocabulary_catalog import vocabulary_catalog
+from .rate_limit import audit_log
+from .auth import token_cache, password_pool
+from .services.review_notifier import review_counts
+from .services.story_pool import story_pool
+from .services.vocabulary_bundles import vocabulary_bundles
+from .config import settings
+from .compression import CompressionMiddleware
+from .responses import DefaultJSONResponse
 
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="HanziNarrative API",
     description="API for interactive HSK learning through stories",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultJSONResponse
 )
 
 # Get CORS origins from environment variable or use defaults
@@ -22,6 +33,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
+)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
 )
 
 app.include_router(auth.router)
@@ -35,6 +54,34 @@ app.include_router(writing.router)
 app.include_router(quiz.router)
 
 
+@app.on_event("startup")
+def load_vocabulary_catalog():
+    vocabulary_catalog.load()
+    vocabulary_bundles.warm_in_background()
+
+
+@app.on_event("startup")
+async def start_story_pool():
+    if settings.STORY_POOL_WORKER and settings.GEMINI_API_KEY:
+        story_pool.start()
+
+
+@app.on_event("shutdown")
+async def stop_story_pool():
+    await story_pool.stop()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    await async_engine.dispose()
+
+
+@app.on_event("shutdown")
+def flush_ai_usage_audit_log():
+    audit_log.flush()
+
+
+
 @app.get("/")
 def root():
     return {
@@ -47,3 +94,19 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics")
+def metrics():
+    """Runtime counters for capacity planning (per worker process)"""
+    return {
+        "db_pool": get_pool_status(),
+        "db_async_pool": get_async_pool_status(),
+        "validation_cache": validation_cache.stats(),
+        "auth_token_cache": token_cache.stats(),
+        "password_hashing": password_pool.snapshot(),
+        "review_count_streams": review_counts.stats(),
+        "story_pool": story_pool.stats(),
+        "vocabulary_bundles": vocabulary_bundles.stats(),
+        "ai_usage_audit_pending": audit_log.pending
+    }
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Table, Float, JSON, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Table, Float, JSON, UniqueConstraint, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .database import Base
+from .pinyin import numbered_key, toneless_key
 
 # Association tables
 story_words = Table(
@@ -41,6 +42,8 @@ class HanziWord(Base):
     simplified = Column(String, index=True, nullable=False)
     traditional = Column(String, nullable=False)
     pinyin = Column(String, nullable=False)
+    pinyin_toneless = Column(String, index=True, nullable=True)  # "nihao", kept in sync with pinyin
+    pinyin_numbered = Column(String, index=True, nullable=True)  # "ni3hao3", kept in sync with pinyin
     english = Column(Text, nullable=False)
     hsk_level = Column(Integer, index=True, nullable=False)
     category = Column(String, index=True, nullable=True)  # e.g., "noun", "verb", "adjective", "number", "time"
@@ -48,27 +51,53 @@ class HanziWord(Base):
     strokes = Column(Integer, nullable=True)
     image_url = Column(String, nullable=True)
 
+    __table_args__ = (
+        UniqueConstraint('simplified', 'hsk_level', name='unique_hanzi_word_level'),
+    )
+
     stories = relationship("Story", secondary=story_words, back_populates="words")
     progress = relationship("UserProgress", back_populates="word")
     vocabulary_sets = relationship("VocabularySet", secondary=vocabulary_set_words, back_populates="words")
 
 
+@event.listens_for(HanziWord, "before_insert")
+@event.listens_for(HanziWord, "before_update")
+def set_pinyin_keys(mapper, connection, target):
+    """Maintain the normalized pinyin lookup columns on every ORM write"""
+    if target.pinyin:
+        target.pinyin_toneless = toneless_key(target.pinyin)
+        target.pinyin_numbered = numbered_key(target.pinyin)
+
+
 class Story(Base):
     __tablename__ = "stories"
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
+    title_pinyin = Column(String, nullable=True)
     content = Column(Text, nullable=False)
+    content_pinyin = Column(Text, nullable=True)
     english_translation = Column(Text, nullable=True)
     hsk_level = Column(Integer, index=True, nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_published = Column(Boolean, default=False)
+    revision = Column(Integer, nullable=False, default=1, server_default='1')  # bumped on every update, drives the ETag
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     author = relationship("User", back_populates="stories")
     words = relationship("HanziWord", secondary=story_words, back_populates="stories")
 
+    __table_args__ = (
+        Index('ix_stories_published_level_id', 'is_published', 'hsk_level', 'id'),
+    )
+
+
+@event.listens_for(Story, "before_update")
+def bump_story_revision(mapper, connection, target):
+    """Increment in SQL, so concurrent edits cannot end on the same revision"""
+    target.revision = Story.revision + 1
+
 
 class UserProgress(Base):
     __tablename__ = "user_progress"
@@ -92,6 +121,24 @@ class UserProgress(Base):
     user = relationship("User", back_populates="progress")
     word = relationship("HanziWord", back_populates="progress")
 
+    __table_args__ = (
+        UniqueConstraint('user_id', 'word_id', name='unique_user_word_progress'),
+        Index('ix_user_progress_user_next_review', 'user_id', 'next_review', postgresql_include=['word_id']),
+    )
+
+
+class UserLearningStats(Base):
+    """Per-user, per-HSK-level totals over user_progress, kept current by LearningService"""
+    __tablename__ = "user_learning_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    hsk_level = Column(Integer, primary_key=True)
+    words_learning = Column(Integer, nullable=False, default=0)
+    mastered_words = Column(Integer, nullable=False, default=0)  # mastery_level >= 8
+    mastery_total = Column(Integer, nullable=False, default=0)
+    correct_total = Column(Integer, nullable=False, default=0)
+    incorrect_total = Column(Integer, nullable=False, default=0)
+
 
 class VocabularySet(Base):
     __tablename__ = "vocabulary_sets"
@@ -129,6 +176,20 @@ class WritingProgress(Base):
     word = relationship("HanziWord")
 
 
+class UserWritingStats(Base):
+    """Per-user, per-HSK-level totals over writing_progress, kept current by WritingService"""
+    __tablename__ = "user_writing_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    hsk_level = Column(Integer, primary_key=True)
+    characters_practiced = Column(Integer, nullable=False, default=0)
+    attempts_total = Column(Integer, nullable=False, default=0)
+    accuracy_total = Column(Float, nullable=False, default=0.0)
+    mastered_characters = Column(Integer, nullable=False, default=0)  # mastery_level >= 8
+    characters_in_progress = Column(Integer, nullable=False, default=0)  # 3-7
+    new_characters = Column(Integer, nullable=False, default=0)  # < 3
+
+
 class AIUsage(Base):
     __tablename__ = "ai_usage"
 
@@ -140,3 +201,23 @@ class AIUsage(Base):
     request_data = Column(JSON, nullable=True)  # Store request details for debugging
 
     user = relationship("User")
+
+    __table_args__ = (
+        Index('ix_ai_usage_user_feature_timestamp', 'user_id', 'feature', 'timestamp'),
+    )
+
+
+class PooledStory(Base):
+    """Pre-generated story waiting to be handed out by /stories/generate"""
+    __tablename__ = "story_pool"
+
+    id = Column(Integer, primary_key=True)
+    hsk_level = Column(Integer, nullable=False)
+    topic = Column(String, nullable=False, default='')  # normalized, '' for no topic
+    length = Column(String, nullable=False)
+    story_data = Column(JSON, nullable=False)  # parsed Gemini response
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_story_pool_combination', 'hsk_level', 'topic', 'length', 'id'),
+    )
@@ -0,0 +1,112 @@
+"""
+Pinyin normalization helpers
+
+Learners type the same word as "nǐ hǎo", "ni3hao3" or "ni hao". Every form is
+reduced to two compact lookup keys stored alongside HanziWord.pinyin:
+
+- toneless key: "nihao"   (tone-insensitive matching, search)
+- numbered key: "ni3hao3" (tone-exact matching, answer checking)
+"""
+import re
+import unicodedata
+
+# Combining marks used by the four pinyin tones (NFD decomposition)
+TONE_MARKS = {
+    "\u0304": 1,  # macron: ā
+    "\u0301": 2,  # acute: á
+    "\u030c": 3,  # caron: ǎ
+    "\u0300": 4,  # grave: à
+}
+
+VOWELS = set("aeiouü")
+
+# Syllable separators dropped from the compact keys
+_SEPARATORS = re.compile(r"[\s'’\-·]+")
+# Neutral tone may be written as 5 or 0; the keys leave it unmarked
+_NEUTRAL_TONE = re.compile(r"[05]")
+_DIGITS = re.compile(r"[0-9]")
+
+
+def strip_tones(pinyin: str) -> str:
+    """
+    Remove tone marks and lowercase: "Nǐ hǎo" -> "ni hao"
+    The umlaut in ü is kept since it distinguishes syllables (lü / lu)
+    """
+    decomposed = unicodedata.normalize("NFD", pinyin.strip().lower())
+    stripped = "".join(ch for ch in decomposed if ch not in TONE_MARKS)
+    return unicodedata.normalize("NFC", stripped)
+
+
+def _split_tone(ch: str):
+    """Split one precomposed character into (base letter, tone number or 0)"""
+    tone = 0
+    base = ""
+    for part in unicodedata.normalize("NFD", ch):
+        if part in TONE_MARKS:
+            tone = TONE_MARKS[part]
+        else:
+            base += part
+    return unicodedata.normalize("NFC", base), tone
+
+
+def _syllable_ends(letters: list, index: int) -> bool:
+    """Whether the syllable containing letters[index] ends at that letter"""
+    def at(i):
+        return letters[i] if i < len(letters) else ""
+
+    current, following, after = at(index), at(index + 1), at(index + 2)
+    if not following.isalpha():
+        return True
+    if current in VOWELS:
+        if following in VOWELS:
+            return False
+        if following in ("n", "r"):
+            # "n"/"r" before a vowel starts the next syllable (hǎo|ne, not hǎon|e)
+            return after in VOWELS
+        return True
+    if current == "n" and following == "g":
+        return after in VOWELS  # fāng'àn is written with an apostrophe
+    return True
+
+
+def to_tone_numbers(pinyin: str) -> str:
+    """
+    Move tone marks to tone numbers after each syllable:
+    "Zhōngguó" -> "zhong1guo2", "nǐ hǎo" -> "ni3 hao3"
+    """
+    letters, tones = [], []
+    for ch in unicodedata.normalize("NFC", pinyin.strip().lower().replace("v", "ü")):
+        base, tone = _split_tone(ch)
+        letters.append(base)
+        tones.append(tone)
+
+    result = []
+    pending = 0
+    for index, letter in enumerate(letters):
+        result.append(letter)
+        if tones[index]:
+            pending = tones[index]
+        if pending and _syllable_ends(letters, index):
+            result.append(str(pending))
+            pending = 0
+    return "".join(result)
+
+
+def numbered_key(pinyin: str) -> str:
+    """
+    Compact tone-number form of any input style:
+    "nǐ hǎo" / "ni3 hao3" / "NI3HAO3" -> "ni3hao3"
+    Input without tones yields the toneless form ("ni hao" -> "nihao")
+    """
+    text = pinyin.strip().lower().replace("v", "ü")
+    if not _DIGITS.search(text):
+        text = to_tone_numbers(text)
+    text = _NEUTRAL_TONE.sub("", text)
+    return _SEPARATORS.sub("", text)
+
+
+def toneless_key(pinyin: str) -> str:
+    """Compact tone-insensitive form of any input style: "Nǐ hǎo" / "ni3 hao3" -> "nihao" """
+    text = strip_tones(pinyin).replace("v", "ü")
+    text = _DIGITS.sub("", text)
+    return _SEPARATORS.sub("", text)
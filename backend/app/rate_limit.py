@@ -1,9 +1,30 @@
-from datetime import datetime, timedelta
+"""
+AI feature rate limiting
+
+Limits are enforced by sliding-window logs held in memory (per worker) or in
+Redis (shared by all workers, RATE_LIMIT_BACKEND=redis). A check and the
+consumption of a slot happen in one atomic step, so concurrent requests
+cannot both slip under the limit. The ai_usage table is only an audit log: rows
+are written by a background thread and read once per (user, feature) to warm
+the in-memory windows after a restart.
+"""
+import bisect
+import logging
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from .config import settings
+from .database import SessionLocal
 from .models import AIUsage, User
 
+logger = logging.getLogger(__name__)
+
 # Rate limit configuration
 RATE_LIMITS = {
     'story_generation': {'daily': 5, 'hourly': 2},
@@ -11,80 +32,324 @@ RATE_LIMITS = {
     'translation': {'daily': 20, 'hourly': 10},
 }
 
-def check_rate_limit(db: Session, user: User, feature: str) -> bool:
+WINDOW_SECONDS = {
+    'hourly': 3600,
+    'daily': 86400,
+}
+
+LIMIT_MESSAGES = {
+    'hourly': "Hourly rate limit exceeded for {feature}. Limit: {limit}/hour. Try again in a few minutes.",
+    'daily': "Daily rate limit exceeded for {feature}. Limit: {limit}/day. Reset in 24 hours.",
+}
+
+
+def _windows(feature: str) -> List[Tuple[str, int, int]]:
+    """(name, seconds, limit) for each configured window, shortest first"""
+    limits = RATE_LIMITS.get(feature, {})
+    return sorted(
+        ((name, WINDOW_SECONDS[name], limit) for name, limit in limits.items()),
+        key=lambda window: window[1]
+    )
+
+
+class MemorySlidingWindowLimiter:
     """
-    Check if user has exceeded rate limit for a feature.
-    Returns True if within limits, raises HTTPException if exceeded.
+    Per-process sliding-window log; each key holds at most `daily` timestamps
+    Keys whose windows have emptied are dropped by a periodic sweep.
+    """
+
+    SWEEP_INTERVAL_SECONDS = 600
+
+    def __init__(self):
+        self._events: Dict[str, List[float]] = {}
+        self._warmed = set()
+        self._lock = threading.Lock()
+        self._last_sweep = time.time()
+
+    def is_warm(self, key: str) -> bool:
+        return key in self._warmed
+
+    def warm(self, key: str, timestamps: List[float]):
+        """Seed a key from the audit log (first use in this process only)"""
+        with self._lock:
+            if key in self._warmed:
+                return
+            events = sorted(set(self._events.get(key, [])) | set(timestamps))
+            if events:
+                self._events[key] = events
+            self._warmed.add(key)
+
+    def _counts(self, events: List[float], windows, now: float) -> Dict[str, int]:
+        return {
+            name: len(events) - bisect.bisect_right(events, now - seconds)
+            for name, seconds, _ in windows
+        }
+
+    def acquire(self, key: str, windows, now: Optional[float] = None) -> Tuple[Optional[str], float]:
+        """
+        Consume one slot if every window has room
+
+        Returns (name of the exceeded window or None, the slot for release())
+        """
+        now = now or time.time()
+        with self._lock:
+            if now - self._last_sweep >= self.SWEEP_INTERVAL_SECONDS:
+                self._sweep(now)
+            events = self._events.setdefault(key, [])
+            longest = max(seconds for _, seconds, _ in windows)
+            del events[:bisect.bisect_right(events, now - longest)]
+
+            counts = self._counts(events, windows, now)
+            for name, _, limit in windows:
+                if counts[name] >= limit:
+                    return name, now
+            events.append(now)
+            return None, now
+
+    def release(self, key: str, slot: float):
+        """Give back the slot acquire() returned (not necessarily the newest one)"""
+        with self._lock:
+            events = self._events.get(key)
+            if events:
+                i = bisect.bisect_left(events, slot)
+                if i < len(events) and events[i] == slot:
+                    del events[i]
+                if not events:
+                    self._drop(key)
+
+    def _sweep(self, now: float):
+        """Prune every key to the longest window and drop the empty ones"""
+        cutoff = now - max(WINDOW_SECONDS.values())
+        for key in list(self._events):
+            events = self._events[key]
+            del events[:bisect.bisect_right(events, cutoff)]
+            if not events:
+                self._drop(key)
+        self._warmed &= self._events.keys()
+        self._last_sweep = now
+
+    def _drop(self, key: str):
+        # Forgetting the warm-up too: a returning key re-reads the audit log
+        self._events.pop(key, None)
+        self._warmed.discard(key)
+
+    def usage(self, key: str, windows, now: Optional[float] = None) -> Dict[str, int]:
+        now = now or time.time()
+        with self._lock:
+            return self._counts(self._events.get(key, []), windows, now)
+
+
+# KEYS[1] = sorted set of slot timestamps
+# ARGV = now, member, longest window, then (seconds, limit) pairs
+_REDIS_ACQUIRE = """
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - tonumber(ARGV[3]))
+for i = 4, #ARGV, 2 do
+    local count = redis.call('ZCOUNT', KEYS[1], now - tonumber(ARGV[i]), '+inf')
+    if count >= tonumber(ARGV[i + 1]) then
+        return (i - 4) / 2 + 1
+    end
+end
+redis.call('ZADD', KEYS[1], now, ARGV[2])
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[3])))
+return 0
+"""
+
+
+class RedisSlidingWindowLimiter:
+    """Sliding-window log in a Redis sorted set, checked and consumed by one Lua script"""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package") from e
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._acquire = self._client.register_script(_REDIS_ACQUIRE)
+
+    def is_warm(self, key: str) -> bool:
+        # Redis outlives worker restarts, so there is nothing to warm
+        return True
+
+    def warm(self, key: str, timestamps: List[float]):
+        pass
+
+    def acquire(self, key: str, windows, now: Optional[float] = None) -> Tuple[Optional[str], str]:
+        now = now or time.time()
+        member = f"{now!r}:{uuid.uuid4().hex[:12]}"  # unique, so release() removes only this slot
+        args = [now, member, max(seconds for _, seconds, _ in windows)]
+        for _, seconds, limit in windows:
+            args.extend([seconds, limit])
+        exceeded = self._acquire(keys=[f"ratelimit:{key}"], args=args)
+        return (windows[exceeded - 1][0] if exceeded else None), member
+
+    def release(self, key: str, slot: str):
+        self._client.zrem(f"ratelimit:{key}", slot)
+
+    def usage(self, key: str, windows, now: Optional[float] = None) -> Dict[str, int]:
+        now = now or time.time()
+        pipe = self._client.pipeline()
+        for _, seconds, _ in windows:
+            pipe.zcount(f"ratelimit:{key}", now - seconds, "+inf")
+        return {name: count for (name, _, _), count in zip(windows, pipe.execute())}
+
+
+class AuditLogWriter:
+    """Background thread that batches ai_usage inserts off the request path"""
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[dict]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, row: dict):
+        self._ensure_started()
+        self._queue.put(row)
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="ai-usage-audit", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            rows = [self._queue.get()]
+            while len(rows) < self.batch_size:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write(rows)
+            for _ in rows:
+                self._queue.task_done()
+
+    def _write(self, rows: List[dict]):
+        db = SessionLocal()
+        try:
+            db.bulk_insert_mappings(AIUsage, rows)
+            db.commit()
+        except Exception:
+            logger.exception("Failed to write %d ai_usage audit rows", len(rows))
+            db.rollback()
+        finally:
+            db.close()
+
+    def flush(self):
+        """Block until every submitted row has been written"""
+        if self._thread is not None:
+            self._queue.join()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+
+def _create_limiter():
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisSlidingWindowLimiter(settings.REDIS_URL)
+    logger.warning(
+        "AI rate limits are kept in memory per worker process; run a single worker "
+        "or set RATE_LIMIT_BACKEND=redis, otherwise each worker allows the full limit"
+    )
+    return MemorySlidingWindowLimiter()
+
+
+limiter = _create_limiter()
+audit_log = AuditLogWriter()
+
+
+def _key(user: User, feature: str) -> str:
+    return f"{user.id}:{feature}"
+
+
+def _warm_from_audit_log(db: Session, user: User, feature: str):
+    """Load the last day of usage so limits survive a worker restart"""
+    key = _key(user, feature)
+    if limiter.is_warm(key):
+        return
+    since = datetime.now(timezone.utc) - timedelta(seconds=max(WINDOW_SECONDS.values()))
+    rows = db.query(AIUsage.timestamp).filter(
+        AIUsage.user_id == user.id,
+        AIUsage.feature == feature,
+        AIUsage.timestamp >= since
+    ).all()
+    stamps = [
+        (ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).timestamp()
+        for (ts,) in rows if ts is not None
+    ]
+    limiter.warm(key, stamps)
+
+
+def check_rate_limit(db: Session, user: User, feature: str):
+    """
+    Check the user's limits for a feature and consume one slot.
+    Returns the slot if within limits, raises HTTPException if exceeded.
+    Pass the slot to release_rate_limit() if the feature then fails
+    without being used.
     """
     if feature not in RATE_LIMITS:
         # No limit for unknown features
-        return True
+        return None
+
+    _warm_from_audit_log(db, user, feature)
+    exceeded, slot = limiter.acquire(_key(user, feature), _windows(feature))
+    if exceeded:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=LIMIT_MESSAGES[exceeded].format(feature=feature, limit=RATE_LIMITS[feature][exceeded])
+        )
+    return slot
 
-    limits = RATE_LIMITS[feature]
-    now = datetime.utcnow()
-    
-    # Check hourly limit
-    if 'hourly' in limits:
-        hour_ago = now - timedelta(hours=1)
-        hourly_count = db.query(func.count(AIUsage.id)).filter(
-            AIUsage.user_id == user.id,
-            AIUsage.feature == feature,
-            AIUsage.timestamp >= hour_ago
-        ).scalar()
-        
-        if hourly_count >= limits['hourly']:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Hourly rate limit exceeded for {feature}. Limit: {limits['hourly']}/hour. Try again in a few minutes."
-            )
-    
-    # Check daily limit
-    if 'daily' in limits:
-        day_ago = now - timedelta(days=1)
-        daily_count = db.query(func.count(AIUsage.id)).filter(
-            AIUsage.user_id == user.id,
-            AIUsage.feature == feature,
-            AIUsage.timestamp >= day_ago
-        ).scalar()
-        
-        if daily_count >= limits['daily']:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Daily rate limit exceeded for {feature}. Limit: {limits['daily']}/day. Reset in 24 hours."
-            )
-    
-    return True
+
+def release_rate_limit(user: User, feature: str, slot):
+    """Give back the slot check_rate_limit() consumed for this request"""
+    if feature in RATE_LIMITS and slot is not None:
+        limiter.release(_key(user, feature), slot)
+
+
+async def check_rate_limit_async(db: Session, user: User, feature: str):
+    """
+    check_rate_limit() for async handlers: the first check of a key reads the
+    audit log and the Redis limiter makes network calls, so it runs in the
+    threadpool
+    """
+    return await run_in_threadpool(check_rate_limit, db, user, feature)
+
+
+async def release_rate_limit_async(user: User, feature: str, slot):
+    """release_rate_limit() for async handlers, run in the threadpool"""
+    await run_in_threadpool(release_rate_limit, user, feature, slot)
 
 
 def record_ai_usage(db: Session, user: User, feature: str, tokens_used: int = 0, request_data: dict = None):
-    """Record AI usage in database"""
-    usage = AIUsage(
-        user_id=user.id,
-        feature=feature,
-        tokens_used=tokens_used,
-        request_data=request_data
-    )
-    db.add(usage)
-    db.commit()
+    """Queue an ai_usage audit row; it is written in the background"""
+    audit_log.submit({
+        "user_id": user.id,
+        "feature": feature,
+        "tokens_used": tokens_used,
+        "timestamp": datetime.now(timezone.utc),
+        "request_data": request_data,
+    })
 
 
 def get_usage_stats(db: Session, user: User, feature: str = None) -> dict:
     """Get usage statistics for a user"""
-    now = datetime.utcnow()
-    day_ago = now - timedelta(days=1)
-    hour_ago = now - timedelta(hours=1)
-    
-    query = db.query(AIUsage).filter(AIUsage.user_id == user.id)
-    
-    if feature:
-        query = query.filter(AIUsage.feature == feature)
-        limits = RATE_LIMITS.get(feature, {})
-    else:
-        limits = {}
-    
-    daily_count = query.filter(AIUsage.timestamp >= day_ago).count()
-    hourly_count = query.filter(AIUsage.timestamp >= hour_ago).count()
-    
+    features = [feature] if feature else list(RATE_LIMITS)
+    limits = RATE_LIMITS.get(feature, {}) if feature else {}
+
+    hourly_count = 0
+    daily_count = 0
+    for name in features:
+        if name not in RATE_LIMITS:
+            continue
+        _warm_from_audit_log(db, user, name)
+        windows = [(w, WINDOW_SECONDS[w], 0) for w in ('hourly', 'daily')]
+        counts = limiter.usage(_key(user, name), windows)
+        hourly_count += counts['hourly']
+        daily_count += counts['daily']
+
     return {
         'feature': feature or 'all',
         'used_this_hour': hourly_count,
@@ -94,3 +359,8 @@ def get_usage_stats(db: Session, user: User, feature: str = None) -> dict:
         'limit_daily': limits.get('daily', 'unlimited'),
         'remaining_daily': max(0, limits.get('daily', 999) - daily_count) if 'daily' in limits else 'unlimited',
     }
+
+
+async def get_usage_stats_async(db: Session, user: User, feature: str = None) -> dict:
+    """get_usage_stats() for async handlers, run in the threadpool"""
+    return await run_in_threadpool(get_usage_stats, db, user, feature)
@@ -0,0 +1,46 @@
+"""
+JSON response helpers
+orjson-backed default response class and direct serialization of trusted rows
+
+orjson is optional; without it the standard library encoder is used.
+"""
+import json
+from typing import Iterable, Optional, Type
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+# Response class for every route (FastAPI(default_response_class=...))
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def dump_json(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def trusted_response(
+    rows: Iterable,
+    schema: Type[BaseModel],
+    headers: Optional[dict] = None
+) -> Response:
+    """
+    JSON list of `rows` (ORM objects, catalog words) with the fields of `schema`
+
+    Returning this instead of the rows skips the response_model round trip
+    (validating every row into a pydantic model, then serializing it again).
+    Only for flat schemas and rows the endpoint already trusts to match
+    them, i.e. rows read straight from their own table; keep response_model
+    on the route for the OpenAPI docs.
+    """
+    fields = tuple(schema.model_fields)
+    content = [{field: getattr(row, field) for field in fields} for row in rows]
+    return Response(dump_json(content), media_type="application/json", headers=headers)
@@ -8,12 +8,14 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.services.gemini_service import (
     validate_chinese_sentence,
-    generate_sentence_exercise
+    generate_sentence_exercise,
+    validation_cache,
+    validation_cache_key
 )
 from app.auth import get_current_user
 from app.models import User
 from app.database import get_db
-from app.rate_limit import check_rate_limit, record_ai_usage
+from app.rate_limit import check_rate_limit_async, release_rate_limit_async, record_ai_usage
 
 router = APIRouter(prefix="/exercises", tags=["exercises"])
 
@@ -57,9 +59,16 @@ async def validate_sentence(
     Rate limited to 15 requests per day per user
 
     Checks grammar, naturalness, and provides detailed feedback
+    Identical submissions are answered from cache and do not count
+    against the rate limit
     """
+    cache_key = validation_cache_key(request.sentence, request.expected_meaning, request.hsk_level)
+    cached = await validation_cache.get_async(cache_key)
+    if cached is not None:
+        return SentenceValidationResponse(**cached)
+
     # Check rate limit
-    check_rate_limit(db, current_user, 'sentence_validation')
+    slot = await check_rate_limit_async(db, current_user, 'sentence_validation')
 
     try:
         result = await validate_chinese_sentence(
@@ -68,16 +77,22 @@ async def validate_sentence(
             hsk_level=request.hsk_level
         )
 
-        # Record AI usage
-        record_ai_usage(
-            db=db,
-            user=current_user,
-            feature='sentence_validation',
-            request_data={
-                'sentence': request.sentence,
-                'hsk_level': request.hsk_level
-            }
-        )
+        if result.is_fallback:
+            # The Gemini call failed; the fallback answer does not use up a slot
+            await release_rate_limit_async(current_user, 'sentence_validation', slot)
+        else:
+            await validation_cache.set_async(cache_key, result.to_dict())
+
+            # Record AI usage
+            record_ai_usage(
+                db=db,
+                user=current_user,
+                feature='sentence_validation',
+                request_data={
+                    'sentence': request.sentence,
+                    'hsk_level': request.hsk_level
+                }
+            )
 
         return SentenceValidationResponse(
             is_correct=result.is_correct,
@@ -88,6 +103,7 @@ async def validate_sentence(
             suggestions=result.suggestions
         )
     except Exception as e:
+        await release_rate_limit_async(current_user, 'sentence_validation', slot)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to validate sentence: {str(e)}"
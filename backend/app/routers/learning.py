@@ -1,14 +1,19 @@
 """
 Learning routes for Learn/Review/Test modes
 """
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.auth import get_current_user
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.auth import get_current_user, get_current_user_from_query
 from app.models import User
-from app.services.learning_service import LearningService
+from app.services.learning_service import LearningService, due_count_query
+from app.services.review_notifier import review_counts
+from app.services.vocabulary_catalog import vocabulary_catalog
 from app import schemas
 
 router = APIRouter(prefix="/learning", tags=["learning"])
@@ -26,18 +31,46 @@ class ReviewResponse(BaseModel):
     message: str
 
 
+class BatchReviewItem(BaseModel):
+    word_id: int
+    quality: int  # 0-5 rating
+    reviewed_at: Optional[datetime] = None  # defaults to the time of submission
+
+
+class BatchReviewRequest(BaseModel):
+    reviews: List[BatchReviewItem]
+
+
+class ReviewSchedule(BaseModel):
+    word_id: int
+    mastery_level: int
+    correct_count: int
+    incorrect_count: int
+    easiness_factor: float
+    interval: int
+    repetitions: int
+    next_review: datetime
+    last_reviewed: datetime
+
+
+class BatchReviewResponse(BaseModel):
+    success: bool
+    count: int
+    schedules: List[ReviewSchedule]
+
+
 @router.get("/words/new")
-def get_new_words(
+async def get_new_words(
     hsk_level: int = 1,
     limit: int = 20,
     category: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get new words for learning (Learn mode)
     """
-    words = LearningService.get_words_for_learning(
+    words = await LearningService.get_words_for_learning(
         db=db,
         user=current_user,
         hsk_level=hsk_level,
@@ -55,15 +88,15 @@ def get_new_words(
 
 
 @router.get("/words/review")
-def get_review_words(
+async def get_review_words(
     hsk_level: Optional[int] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get words due for review (Review mode)
     """
-    reviews = LearningService.get_words_for_review(
+    reviews = await LearningService.get_words_for_review(
         db=db,
         user=current_user,
         hsk_level=hsk_level
@@ -78,17 +111,17 @@ def get_review_words(
 
 
 @router.get("/words/test")
-def get_test_words(
+async def get_test_words(
     hsk_level: int = 1,
     limit: int = 20,
     category: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get words for testing (Test mode)
     """
-    test_words = LearningService.get_words_for_test(
+    test_words = await LearningService.get_words_for_test(
         db=db,
         user=current_user,
         hsk_level=hsk_level,
@@ -106,10 +139,10 @@ def get_test_words(
 
 
 @router.post("/review", response_model=ReviewResponse)
-def record_review(
+async def record_review(
     request: ReviewRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Record a review and update spaced repetition schedule
@@ -118,7 +151,7 @@ def record_review(
     if request.quality < 0 or request.quality > 5:
         raise HTTPException(status_code=400, detail="Quality must be between 0 and 5")
 
-    progress = LearningService.record_review(
+    progress = await LearningService.record_review(
         db=db,
         user=current_user,
         word_id=request.word_id,
@@ -143,16 +176,50 @@ def record_review(
     )
 
 
+@router.post("/review/batch", response_model=BatchReviewResponse)
+async def record_review_batch(
+    request: BatchReviewRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Record a whole review session in one transaction
+    Returns the updated schedule of every reviewed word
+    """
+    if not request.reviews:
+        raise HTTPException(status_code=400, detail="No reviews submitted")
+    if len(request.reviews) > LearningService.MAX_BATCH_REVIEWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {LearningService.MAX_BATCH_REVIEWS} reviews per batch"
+        )
+    if any(review.quality < 0 or review.quality > 5 for review in request.reviews):
+        raise HTTPException(status_code=400, detail="Quality must be between 0 and 5")
+
+    word_ids = {review.word_id for review in request.reviews}
+    missing = word_ids - {word.id for word in vocabulary_catalog.get_many(list(word_ids))}
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Words not found: {sorted(missing)}")
+
+    schedules = await LearningService.record_reviews(
+        db=db,
+        user=current_user,
+        reviews=[(review.word_id, review.quality, review.reviewed_at) for review in request.reviews]
+    )
+
+    return BatchReviewResponse(success=True, count=len(schedules), schedules=schedules)
+
+
 @router.get("/stats")
-def get_learning_stats(
+async def get_learning_stats(
     hsk_level: Optional[int] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get learning statistics for the current user
     """
-    stats = LearningService.get_learning_stats(
+    stats = await LearningService.get_learning_stats(
         db=db,
         user=current_user,
         hsk_level=hsk_level
@@ -165,42 +232,56 @@ def get_learning_stats(
 
 
 @router.get("/review-count")
-def get_review_count(
+async def get_review_count(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get the count of words due for review (lightweight endpoint for notifications)
     """
     from datetime import datetime, timezone
-    from app.models import UserProgress
 
-    now = datetime.now(timezone.utc)
-    count = db.query(UserProgress).filter(
-        UserProgress.user_id == current_user.id,
-        UserProgress.next_review <= now
-    ).count()
+    count = await db.scalar(due_count_query(current_user.id, datetime.now(timezone.utc)))
 
     return {
         "count": count
     }
 
 
+@router.get("/review-count/stream")
+async def stream_review_count(current_user: User = Depends(get_current_user_from_query)):
+    """
+    Server-sent events with the count of words due for review
+
+    Sends the current count on connect and again whenever it changes, so the
+    client does not need to poll /learning/review-count. Authenticate with
+    ?token=<access token> (EventSource cannot set headers).
+    """
+    return StreamingResponse(
+        review_counts.stream(current_user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/progress/{word_id}")
-def get_word_progress(
+async def get_word_progress(
     word_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get progress for a specific word
     """
-    from app.models import UserProgress, HanziWord
+    from app.models import UserProgress
 
-    progress = db.query(UserProgress).filter(
-        UserProgress.user_id == current_user.id,
-        UserProgress.word_id == word_id
-    ).first()
+    result = await db.execute(
+        select(UserProgress).where(
+            UserProgress.user_id == current_user.id,
+            UserProgress.word_id == word_id
+        )
+    )
+    progress = result.scalars().first()
 
     if not progress:
         return {
@@ -211,7 +292,7 @@ def get_word_progress(
             "incorrect_count": 0
         }
 
-    word = db.query(HanziWord).filter(HanziWord.id == word_id).first()
+    word = vocabulary_catalog.get(word_id)
 
     return {
         "word_id": word_id,
@@ -4,6 +4,8 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from .. import models, schemas, auth
 from ..database import get_db
+from ..responses import trusted_response
+from ..services.stats_service import StatsService, learning_delta
 
 router = APIRouter(prefix="/progress", tags=["progress"])
 
@@ -16,7 +18,7 @@ def get_user_progress(
     progress = db.query(models.UserProgress).filter(
         models.UserProgress.user_id == current_user.id
     ).all()
-    return progress
+    return trusted_response(progress, schemas.UserProgress)
 
 
 @router.post("/", response_model=schemas.UserProgress)
@@ -45,6 +47,9 @@ def update_progress(
             review_count=1
         )
         db.add(new_progress)
+        StatsService.apply_learning_changes_sync(
+            db, current_user.id, [(progress_data.word_id, learning_delta(None, {}))]
+        )
         db.commit()
         db.refresh(new_progress)
         return new_progress
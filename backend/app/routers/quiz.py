@@ -6,9 +6,12 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from .. import models, auth
 from ..database import get_db
+from ..pinyin import numbered_key, toneless_key
+from ..services.distractor_index import DistractorIndex
+from ..services.vocabulary_catalog import CatalogWord, vocabulary_catalog
+from ..services.word_sampler import sample_words
 import random
 
 router = APIRouter(prefix="/quiz", tags=["quiz"])
@@ -19,6 +22,7 @@ class QuizGenerateRequest(BaseModel):
     quiz_type: str = "multiple_choice"  # multiple_choice, fill_blank, character_match, tone_practice
     num_questions: int = 10
     category: Optional[str] = None
+    distractors: str = "random"  # random, hard (similar pinyin, same radical or category)
 
 
 class MultipleChoiceQuestion(BaseModel):
@@ -50,6 +54,12 @@ class MatchingPair(BaseModel):
     word_id: int
 
 
+class AnswerCheckRequest(BaseModel):
+    word_id: int
+    answer: str  # characters or pinyin ("nǐ hǎo", "ni3hao3", "ni hao")
+    check_tones: bool = True
+
+
 class QuizResponse(BaseModel):
     quiz_type: str
     hsk_level: int
@@ -59,32 +69,30 @@ class QuizResponse(BaseModel):
 @router.post("/generate", response_model=QuizResponse)
 def generate_quiz(
     request: QuizGenerateRequest,
-    current_user: models.User = Depends(auth.get_current_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(auth.get_current_user)
 ):
     """Generate a quiz based on HSK level and type"""
 
-    # Get words for the quiz
-    query = db.query(models.HanziWord).filter(
-        models.HanziWord.hsk_level == request.hsk_level
+    # Randomly select words for questions
+    selected_words, total_words = sample_words(
+        hsk_level=request.hsk_level,
+        size=request.num_questions,
+        category=request.category
     )
 
-    if request.category:
-        query = query.filter(models.HanziWord.category == request.category)
-
-    all_words = query.all()
-
-    if len(all_words) < request.num_questions:
+    if total_words < request.num_questions:
         raise HTTPException(
             status_code=400,
-            detail=f"Not enough words for HSK {request.hsk_level}. Need {request.num_questions}, found {len(all_words)}"
+            detail=f"Not enough words for HSK {request.hsk_level}. Need {request.num_questions}, found {total_words}"
         )
 
-    # Randomly select words for questions
-    selected_words = random.sample(all_words, request.num_questions)
-
     if request.quiz_type == "multiple_choice":
-        questions = generate_multiple_choice(selected_words, all_words)
+        distractor_index = vocabulary_catalog.distractors(request.hsk_level, category=request.category)
+        questions = generate_multiple_choice(
+            selected_words,
+            distractor_index,
+            hard=request.distractors == "hard"
+        )
     elif request.quiz_type == "fill_blank":
         questions = generate_fill_blank(selected_words)
     elif request.quiz_type == "character_match":
@@ -99,17 +107,40 @@ def generate_quiz(
     )
 
 
-def generate_multiple_choice(selected_words: List[models.HanziWord], all_words: List[models.HanziWord]) -> List[dict]:
-    """Generate multiple choice questions"""
+# Option text shown for each question type
+OPTION_FIELDS = {
+    "meaning": "english",
+    "pinyin": "pinyin",
+    "character": "simplified",
+}
+
+
+def generate_multiple_choice(
+    selected_words: List[CatalogWord],
+    distractor_index: DistractorIndex,
+    hard: bool = False
+) -> List[dict]:
+    """
+    Generate multiple choice questions
+    A word whose level has too few distinct option texts for a full set of
+    options is left out rather than asked with fewer options.
+    """
     questions = []
-    question_types = ["meaning", "pinyin", "character"]
+    question_types = list(OPTION_FIELDS)
 
-    for idx, word in enumerate(selected_words):
+    for word in selected_words:
         question_type = random.choice(question_types)
+        field = OPTION_FIELDS[question_type]
 
         # Get wrong options from other words
-        wrong_options_pool = [w for w in all_words if w.id != word.id]
-        wrong_options = random.sample(wrong_options_pool, min(3, len(wrong_options_pool)))
+        wrong_options = distractor_index.sample(
+            word,
+            k=3,
+            hard=hard,
+            key=lambda w: getattr(w, field)
+        )
+        if len(wrong_options) < 3:
+            continue
 
         if question_type == "meaning":
             # Ask for meaning given Chinese character
@@ -132,7 +163,7 @@ def generate_multiple_choice(selected_words: List[models.HanziWord], all_words:
         correct_answer = options.index(correct)
 
         questions.append({
-            "id": idx,
+            "id": len(questions),
             "question": question,
             "question_type": question_type,
             "options": options,
@@ -146,7 +177,7 @@ def generate_multiple_choice(selected_words: List[models.HanziWord], all_words:
     return questions
 
 
-def generate_fill_blank(selected_words: List[models.HanziWord]) -> List[dict]:
+def generate_fill_blank(selected_words: List[CatalogWord]) -> List[dict]:
     """Generate fill-in-the-blank questions"""
     questions = []
 
@@ -166,7 +197,7 @@ def generate_fill_blank(selected_words: List[models.HanziWord]) -> List[dict]:
     return questions
 
 
-def generate_character_match(selected_words: List[models.HanziWord]) -> List[dict]:
+def generate_character_match(selected_words: List[CatalogWord]) -> List[dict]:
     """Generate character matching quiz"""
     questions = []
 
@@ -182,6 +213,42 @@ def generate_character_match(selected_words: List[models.HanziWord]) -> List[dic
     return questions
 
 
+@router.post("/check-answer")
+def check_answer(
+    request: AnswerCheckRequest,
+    current_user: models.User = Depends(auth.get_current_user)
+):
+    """
+    Check a typed answer against a word
+
+    Accepts the characters or pinyin in any style: tone marks, tone numbers,
+    or (when check_tones is false) no tones at all
+    """
+    word = vocabulary_catalog.get(request.word_id)
+    if not word:
+        raise HTTPException(status_code=404, detail="Word not found")
+
+    answer = request.answer.strip()
+    toneless = toneless_key(answer)
+    tones_correct = numbered_key(answer) == word.pinyin_numbered
+
+    if answer in (word.simplified, word.traditional):
+        correct = True
+        tones_correct = True
+    elif request.check_tones:
+        correct = tones_correct
+    else:
+        correct = bool(toneless) and toneless == word.pinyin_toneless
+
+    return {
+        "word_id": word.id,
+        "correct": correct,
+        "tones_correct": tones_correct,
+        "chinese": word.simplified,
+        "pinyin": word.pinyin
+    }
+
+
 @router.post("/submit")
 def submit_quiz(
     quiz_results: dict,
@@ -1,11 +1,20 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, selectinload
 from pydantic import BaseModel
 from .. import models, schemas, auth
-from ..database import get_db
-from ..rate_limit import check_rate_limit, record_ai_usage, get_usage_stats
-from ..services.gemini_service import generate_story
+from ..database import AsyncSessionLocal, SessionLocal, get_db
+from ..http_cache import cache_headers, make_etag, not_modified
+from ..rate_limit import (
+    check_rate_limit_async, get_usage_stats, get_usage_stats_async, record_ai_usage,
+    release_rate_limit, release_rate_limit_async
+)
+from ..services.gemini_service import build_story_prompt, generate_story, parse_story_response, stream_text
+from ..services.story_pool import story_pool
+from ..services.story_service import StoryService
+from ..services.story_stream import JsonStringField, sse_event
 
 router = APIRouter(prefix="/stories", tags=["stories"])
 
@@ -17,34 +26,127 @@ class StoryGenerateRequest(BaseModel):
     length: str = "short"  # short, medium, long
 
 
+MAX_STORY_PAGE = 100
+
+
+def parse_story_cursor(after: Optional[str]) -> Optional[Tuple[int, int]]:
+    """(hsk_level, id) from a "<hsk_level>:<id>" cursor, the last story of the previous page"""
+    if after is None:
+        return None
+    try:
+        hsk_level, story_id = after.split(":")
+        return int(hsk_level), int(story_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def published_stories_page(
+    db: Session,
+    response: Response,
+    hsk_level: Optional[int],
+    after: Optional[str],
+    skip: int,
+    limit: int,
+    *options
+) -> List[models.Story]:
+    """
+    One page of published stories ordered by (hsk_level, id)
+
+    Pages continue from the `after` cursor with an index range scan on
+    (is_published, hsk_level, id), so deep pages cost the same as the
+    first. When the page is full, the cursor of the next page is returned
+    in the X-Next-Cursor header.
+    """
+    if limit < 1 or limit > MAX_STORY_PAGE:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_STORY_PAGE}")
+    cursor = parse_story_cursor(after)
+
+    query = db.query(models.Story).filter(models.Story.is_published == True)
+    if hsk_level:
+        query = query.filter(models.Story.hsk_level == hsk_level)
+    if cursor:
+        query = query.filter(tuple_(models.Story.hsk_level, models.Story.id) > cursor)
+    stories = query.options(*options).order_by(
+        models.Story.hsk_level, models.Story.id
+    ).offset(skip).limit(limit).all()
+
+    if len(stories) == limit:
+        last = stories[-1]
+        response.headers["X-Next-Cursor"] = f"{last.hsk_level}:{last.id}"
+    return stories
+
+
 @router.get("/", response_model=List[schemas.Story])
 def get_stories(
+    response: Response,
     hsk_level: Optional[int] = None,
+    after: Optional[str] = None,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = MAX_STORY_PAGE,
     db: Session = Depends(get_db)
 ):
-    query = db.query(models.Story).filter(models.Story.is_published == True)
-    if hsk_level:
-        query = query.filter(models.Story.hsk_level == hsk_level)
-    stories = query.offset(skip).limit(limit).all()
-    return stories
+    """Published stories, paged with the X-Next-Cursor response header (`skip` is deprecated)"""
+    return published_stories_page(db, response, hsk_level, after, skip, limit)
+
+
+@router.get("/with-words", response_model=List[schemas.StoryWithWords])
+def get_stories_with_words(
+    response: Response,
+    hsk_level: Optional[int] = None,
+    after: Optional[str] = None,
+    limit: int = MAX_STORY_PAGE,
+    db: Session = Depends(get_db)
+):
+    """Like GET /stories/, with each story's words (loaded in one query per page)"""
+    return published_stories_page(
+        db, response, hsk_level, after, 0, limit, selectinload(models.Story.words)
+    )
+
+
+@router.get("/ai-usage-stats")
+def get_ai_usage(
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get AI usage statistics for current user"""
+    return {
+        "story_generation": get_usage_stats(db, current_user, 'story_generation'),
+        "sentence_validation": get_usage_stats(db, current_user, 'sentence_validation'),
+    }
 
 
 @router.get("/{story_id}", response_model=schemas.Story)
-def get_story(story_id: int, db: Session = Depends(get_db)):
+def get_story(story_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    if request.headers.get("if-none-match"):
+        # Revalidation reads only the revision counter, not the story
+        revision = db.query(models.Story.revision).filter(models.Story.id == story_id).scalar()
+        if revision is None:
+            raise HTTPException(status_code=404, detail="Story not found")
+        cached = not_modified(request, response, make_etag(revision, "story", story_id))
+        if cached:
+            return cached
+
     story = db.query(models.Story).filter(models.Story.id == story_id).first()
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
+    response.headers.update(cache_headers(make_etag(story.revision, "story", story_id)))
     return story
 
 
 @router.get("/{story_id}/words", response_model=List[schemas.HanziWord])
 def get_story_words(story_id: int, db: Session = Depends(get_db)):
-    story = db.query(models.Story).filter(models.Story.id == story_id).first()
-    if not story:
+    """Words of a story in order of first occurrence"""
+    position = models.story_words.c.position
+    words = db.query(models.HanziWord).join(
+        models.story_words, models.story_words.c.word_id == models.HanziWord.id
+    ).filter(
+        models.story_words.c.story_id == story_id
+    ).order_by(position.is_(None), position, models.HanziWord.id).all()
+
+    # Only a story without words needs the existence check
+    if not words and db.get(models.Story, story_id) is None:
         raise HTTPException(status_code=404, detail="Story not found")
-    return story.words
+    return words
 
 
 @router.post("/", response_model=schemas.Story)
@@ -111,31 +213,33 @@ async def generate_ai_story(
 ):
     """
     Generate a new story using AI and save it to database
-    Rate limited to 5 requests per day per user
+    Rate limited to 5 requests per day per user, including stories served
+    from the pre-generated pool
     """
-    # Check rate limit
-    check_rate_limit(db, current_user, 'story_generation')
+    # Check rate limit (pool hits count too, or one user could drain the
+    # pool and keep the refill worker generating)
+    slot = await check_rate_limit_async(db, current_user, 'story_generation')
 
     try:
-        # Generate story using Gemini
-        story_data = await generate_story(
-            hsk_level=request.hsk_level,
-            topic=request.topic,
-            character_names=request.character_names,
-            length=request.length
+        story_data = await story_pool.take(
+            request.hsk_level, request.topic, request.length, request.character_names
         )
+        pooled = story_data is not None
 
-        # Save generated story to database
-        db_story = models.Story(
-            title=story_data.get('title', 'Generated Story'),
-            content=story_data.get('content', ''),
-            hsk_level=request.hsk_level,
-            author_id=current_user.id,
-            is_published=True  # Auto-publish AI generated stories
-        )
-        db.add(db_story)
-        db.commit()
-        db.refresh(db_story)
+        # Generate story using Gemini
+        if not pooled:
+            story_data = await generate_story(
+                hsk_level=request.hsk_level,
+                topic=request.topic,
+                character_names=request.character_names,
+                length=request.length
+            )
+
+        # Save generated story with its vocabulary links to database
+        async with AsyncSessionLocal() as story_db:
+            db_story = await StoryService.save_generated_story(
+                story_db, story_data, request.hsk_level, current_user.id
+            )
 
         # Record AI usage
         record_ai_usage(
@@ -146,12 +250,13 @@ async def generate_ai_story(
                 'hsk_level': request.hsk_level,
                 'topic': request.topic,
                 'length': request.length,
-                'story_id': db_story.id
+                'story_id': db_story.id,
+                'pooled': pooled
             }
         )
 
         # Get updated usage stats
-        usage_stats = get_usage_stats(db, current_user, 'story_generation')
+        usage_stats = await get_usage_stats_async(db, current_user, 'story_generation')
 
         return {
             "story": story_data,
@@ -160,16 +265,104 @@ async def generate_ai_story(
         }
 
     except Exception as e:
+        # Failed generations do not count against the limit
+        await release_rate_limit_async(current_user, 'story_generation', slot)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/ai-usage-stats")
-def get_ai_usage(
+@router.post("/generate/stream")
+async def generate_ai_story_stream(
+    request: StoryGenerateRequest,
     current_user: models.User = Depends(auth.get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get AI usage statistics for current user"""
-    return {
-        "story_generation": get_usage_stats(db, current_user, 'story_generation'),
-        "sentence_validation": get_usage_stats(db, current_user, 'sentence_validation'),
-    }
+    """
+    Generate a story like /generate, streamed as server-sent events
+
+    Events:
+    - "title" / "content": {"delta": text} as the story is written
+    - "done": the same body /generate returns, once the story is saved
+    - "error": {"detail": message}
+
+    A story from the pre-generated pool arrives as one title and one
+    content event; it counts against the rate limit like a generated one.
+    """
+    # Check rate limit (before the stream starts, so a 429 is a plain response)
+    slot = await check_rate_limit_async(db, current_user, 'story_generation')
+
+    prompt = build_story_prompt(
+        hsk_level=request.hsk_level,
+        topic=request.topic,
+        character_names=request.character_names,
+        length=request.length
+    )
+
+    async def events():
+        fields = [JsonStringField("title"), JsonStringField("content")]
+        response_text = ""
+        used = False
+        try:
+            story_data = await story_pool.take(
+                request.hsk_level, request.topic, request.length, request.character_names
+            )
+            pooled = story_data is not None
+            if pooled:
+                for field in fields:
+                    yield sse_event(field.name, {"delta": story_data.get(field.name, '')})
+            else:
+                async for chunk in stream_text(prompt):
+                    response_text += chunk
+                    for field in fields:
+                        delta = field.read(response_text)
+                        if delta:
+                            yield sse_event(field.name, {"delta": delta})
+
+                story_data = parse_story_response(response_text)
+
+            async with AsyncSessionLocal() as story_db:
+                db_story = await StoryService.save_generated_story(
+                    story_db, story_data, request.hsk_level, current_user.id
+                )
+
+            # The request's `db` is closed once the response starts streaming
+            usage_db = SessionLocal()
+            try:
+                record_ai_usage(
+                    db=usage_db,
+                    user=current_user,
+                    feature='story_generation',
+                    request_data={
+                        'hsk_level': request.hsk_level,
+                        'topic': request.topic,
+                        'length': request.length,
+                        'story_id': db_story.id,
+                        'streamed': True,
+                        'pooled': pooled
+                    }
+                )
+                used = True
+                usage_stats = await get_usage_stats_async(usage_db, current_user, 'story_generation')
+            finally:
+                usage_db.close()
+
+            yield sse_event("done", {
+                "story": story_data,
+                "story_id": db_story.id,
+                "usage_stats": usage_stats
+            })
+
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Failed to generate story: {str(e)}"})
+        finally:
+            # Failed or abandoned generations do not count against the limit.
+            # A client disconnect closes the generator with GeneratorExit (or
+            # cancels it), which `except Exception` does not see; nothing can
+            # be awaited here then, so the release is the sync call.
+            if not used:
+                release_rate_limit(current_user, 'story_generation', slot)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
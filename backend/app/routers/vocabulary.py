@@ -1,12 +1,42 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import FileResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from .. import models, schemas
 from ..database import get_db
+from ..config import settings
+from ..http_cache import cache_headers, encoded_etag, etag_matches, make_etag, negotiate_encoding, not_modified
+from ..responses import trusted_response
+from ..services import search_service
+from ..services.vocabulary_bundles import ENCODINGS, Bundle, vocabulary_bundles
+from ..services.vocabulary_catalog import vocabulary_catalog
 
 router = APIRouter(prefix="/vocabulary", tags=["vocabulary"])
 
 
+def _encoded_headers(request: Request, headers: dict, encoding: Optional[str]) -> Tuple[dict, bool]:
+    """
+    Headers for one content coding of a bundle, and whether the client's copy
+    is current. Each coding gets its own ETag, so caches and conditional
+    requests never take the gzip, brotli and plain bodies for one another.
+    """
+    headers = {**headers, "ETag": encoded_etag(headers["ETag"], encoding), "Vary": "Accept-Encoding"}
+    return headers, etag_matches(request.headers.get("if-none-match"), headers["ETag"])
+
+
+def _bundle_response(bundle: Bundle, request: Request, headers: dict) -> Response:
+    """The bundle in the client's preferred precompressed encoding, or a 304"""
+    available = tuple(encoding for encoding, _ in ENCODINGS if getattr(bundle, encoding))
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), available)
+    headers, current = _encoded_headers(request, headers, encoding)
+    if current:
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=bundle.encoded(encoding), media_type="application/json", headers=headers)
+
+
 # Specific routes must come before path parameter routes
 @router.get("/search", response_model=List[schemas.HanziWord])
 def search_words(
@@ -14,56 +44,97 @@ def search_words(
     hsk_level: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(models.HanziWord).filter(
-        (models.HanziWord.simplified.ilike(f"%{q}%")) |
-        (models.HanziWord.pinyin.ilike(f"%{q}%")) |
-        (models.HanziWord.english.ilike(f"%{q}%"))
-    )
-    if hsk_level:
-        query = query.filter(models.HanziWord.hsk_level == hsk_level)
-    return query.limit(50).all()
+    return search_service.search_words(db, q, hsk_level=hsk_level, limit=50)
 
 
 @router.get("/categories/all")
-def get_all_categories(db: Session = Depends(get_db)):
+def get_all_categories(request: Request, response: Response):
     """Get list of all unique categories"""
-    categories = db.query(models.HanziWord.category).distinct().filter(
-        models.HanziWord.category.isnot(None)
-    ).all()
-    return [{"value": cat[0], "label": cat[0].title()} for cat in categories if cat[0]]
+    cached = not_modified(request, response, make_etag(vocabulary_catalog.revision(), "categories"))
+    if cached:
+        return cached
+    categories = vocabulary_catalog.categories()
+    return [{"value": cat, "label": cat.title()} for cat in categories]
 
 
 @router.get("/categories/hsk/{level}")
-def get_categories_by_hsk(level: int, db: Session = Depends(get_db)):
+def get_categories_by_hsk(level: int, request: Request, response: Response):
     """Get categories available for a specific HSK level"""
-    categories = db.query(models.HanziWord.category).distinct().filter(
-        models.HanziWord.hsk_level == level,
-        models.HanziWord.category.isnot(None)
-    ).all()
-    return [{"value": cat[0], "label": cat[0].title()} for cat in categories if cat[0]]
+    cached = not_modified(request, response, make_etag(vocabulary_catalog.revision(), "categories", level))
+    if cached:
+        return cached
+    categories = vocabulary_catalog.categories(hsk_level=level)
+    return [{"value": cat, "label": cat.title()} for cat in categories]
 
 
 @router.get("/hsk/{level}", response_model=List[schemas.HanziWord])
 def get_words_by_hsk_level(
     level: int,
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 1000,
-    category: Optional[str] = None,
-    db: Session = Depends(get_db)
+    category: Optional[str] = None
 ):
-    query = db.query(models.HanziWord).filter(
-        models.HanziWord.hsk_level == level
-    )
+    etag = make_etag(vocabulary_catalog.revision(), "hsk", level, skip, limit, category)
+    words = vocabulary_catalog.words_for_level(level, category=category)
+    if skip == 0 and limit >= len(words):
+        # The whole list is already encoded as the level's bundle
+        return _bundle_response(vocabulary_bundles.get(level, category), request, cache_headers(etag))
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+    return trusted_response(words[skip:skip + limit], schemas.HanziWord, headers=cache_headers(etag))
+
+
+@router.get("/bundles/hsk/{level}")
+def get_vocabulary_bundle_url(level: int, request: Request, category: Optional[str] = None):
+    """
+    Same words as /hsk/{level}, by redirect to the immutable bundle of the
+    current vocabulary revision
+    """
+    url = request.url_for("get_vocabulary_bundle", revision=vocabulary_bundles.revision(), level=level)
     if category:
-        query = query.filter(models.HanziWord.category == category)
+        url = url.include_query_params(category=category)
+    return RedirectResponse(
+        str(url),
+        status_code=307,
+        headers={"Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}"}
+    )
+
 
-    words = query.offset(skip).limit(limit).all()
-    return words
+@router.get("/bundles/{revision}/hsk/{level}")
+def get_vocabulary_bundle(revision: str, level: int, request: Request, category: Optional[str] = None):
+    """
+    Precompressed word list of one vocabulary revision; the content of a
+    revision never changes, so it is cached for a year
+    """
+    path = vocabulary_bundles.file_path(revision, level, category)
+    if path is None and revision != vocabulary_bundles.revision():
+        # Superseded revision: send the client to the current one
+        return get_vocabulary_bundle_url(level, request, category)
+
+    headers = {
+        "ETag": make_etag(revision, "bundle", level, category),
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+    if path is not None:
+        available = tuple(encoding for encoding, suffix in ENCODINGS if os.path.isfile(path + suffix))
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"), available)
+        headers, current = _encoded_headers(request, headers, encoding)
+        if current:
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            path += dict(ENCODINGS)[encoding]
+        return FileResponse(path, media_type="application/json", headers=headers)
+
+    return _bundle_response(vocabulary_bundles.get(level, category), request, headers)
 
 
 @router.get("/{word_id}", response_model=schemas.HanziWord)
-def get_word(word_id: int, db: Session = Depends(get_db)):
-    word = db.query(models.HanziWord).filter(models.HanziWord.id == word_id).first()
+def get_word(word_id: int):
+    word = vocabulary_catalog.get(word_id)
     if not word:
         raise HTTPException(status_code=404, detail="Word not found")
     return word
@@ -71,8 +142,16 @@ def get_word(word_id: int, db: Session = Depends(get_db)):
 
 @router.post("/", response_model=schemas.HanziWord)
 def create_word(word: schemas.HanziWordCreate, db: Session = Depends(get_db)):
+    existing = db.query(models.HanziWord.id).filter(
+        models.HanziWord.simplified == word.simplified,
+        models.HanziWord.hsk_level == word.hsk_level
+    ).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="Word already exists at this HSK level")
+
     db_word = models.HanziWord(**word.dict())
     db.add(db_word)
     db.commit()
     db.refresh(db_word)
+    vocabulary_catalog.invalidate()
     return db_word
@@ -3,11 +3,11 @@ Writing Practice Router
 API endpoints for character writing practice
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_async_db
 from app.auth import get_current_user
-from app.models import User, HanziWord
+from app.models import User
 from app.schemas import (
     HanziWord as HanziWordSchema,
     WritingAttemptCreate,
@@ -15,6 +15,8 @@ from app.schemas import (
     WritingProgressWithWord,
     WritingStatsResponse
 )
+from app.responses import trusted_response
+from app.services.vocabulary_catalog import vocabulary_catalog
 from app.services.writing_service import WritingService
 
 
@@ -26,7 +28,7 @@ async def get_characters_for_practice(
     hsk_level: int = 1,
     limit: int = 20,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get characters for writing practice by HSK level
@@ -41,7 +43,7 @@ async def get_characters_for_practice(
             detail="HSK level must be between 1 and 6"
         )
 
-    characters = WritingService.get_characters_for_practice(
+    characters = await WritingService.get_characters_for_practice(
         db=db,
         user=current_user,
         hsk_level=hsk_level,
@@ -55,7 +57,7 @@ async def get_characters_for_practice(
 async def record_writing_attempt(
     attempt: WritingAttemptCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Record a writing practice attempt
@@ -65,7 +67,7 @@ async def record_writing_attempt(
     - Returns updated progress
     """
     # Verify word exists
-    word = db.query(HanziWord).filter(HanziWord.id == attempt.word_id).first()
+    word = vocabulary_catalog.get(attempt.word_id)
     if not word:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,7 +82,7 @@ async def record_writing_attempt(
         )
 
     # Record the attempt
-    progress = WritingService.record_attempt(
+    progress = await WritingService.record_attempt(
         db=db,
         user=current_user,
         word_id=attempt.word_id,
@@ -96,7 +98,7 @@ async def record_writing_attempt(
 async def get_writing_progress(
     hsk_level: Optional[int] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get user's writing progress
@@ -110,20 +112,20 @@ async def get_writing_progress(
             detail="HSK level must be between 1 and 6"
         )
 
-    progress_list = WritingService.get_user_progress(
+    progress_list = await WritingService.get_user_progress(
         db=db,
         user=current_user,
         hsk_level=hsk_level
     )
 
-    return progress_list
+    return trusted_response(progress_list, WritingProgressSchema)
 
 
 @router.get("/stats", response_model=WritingStatsResponse)
 async def get_writing_statistics(
     hsk_level: Optional[int] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get writing practice statistics
@@ -139,7 +141,7 @@ async def get_writing_statistics(
             detail="HSK level must be between 1 and 6"
         )
 
-    stats = WritingService.get_statistics(
+    stats = await WritingService.get_statistics(
         db=db,
         user=current_user,
         hsk_level=hsk_level
@@ -152,7 +154,7 @@ async def get_writing_statistics(
 async def get_character_progress(
     word_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get writing progress for a specific character
@@ -161,14 +163,14 @@ async def get_character_progress(
     - Returns None if character not yet practiced
     """
     # Verify word exists
-    word = db.query(HanziWord).filter(HanziWord.id == word_id).first()
+    word = vocabulary_catalog.get(word_id)
     if not word:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Word with id {word_id} not found"
         )
 
-    progress = WritingService.get_progress_by_character(
+    progress = await WritingService.get_progress_by_character(
         db=db,
         user=current_user,
         word_id=word_id
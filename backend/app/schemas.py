@@ -42,7 +42,9 @@ class HanziWord(HanziWordBase):
 
 class StoryBase(BaseModel):
     title: str
+    title_pinyin: Optional[str] = None
     content: str
+    content_pinyin: Optional[str] = None
     english_translation: Optional[str] = None
     hsk_level: int
 
@@ -114,6 +116,7 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     username: Optional[str] = None
+    user_id: Optional[int] = None
 
 
 # Writing Practice Schemas
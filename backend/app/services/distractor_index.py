@@ -0,0 +1,102 @@
+"""
+Distractor Index
+Per-level index for picking wrong answers in multiple-choice quizzes
+
+Words are kept in one array and distractors are drawn by random position, so
+sampling costs O(k) per question regardless of how large the level is. "Hard"
+distractors come from precomputed buckets of words that sound alike (same
+pinyin ignoring tones), share a category or share a radical.
+"""
+import random
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Sequence
+
+# Extra random draws allowed per question to skip duplicate option texts
+EXTRA_DRAWS = 8
+
+
+def _draw(population: Sequence[int], count: int) -> Iterator[int]:
+    """Yield up to `count` distinct random members of population without copying it"""
+    size = len(population)
+    for position in random.sample(range(size), min(size, count)):
+        yield population[position]
+
+
+class DistractorIndex:
+    """Array-backed distractor sampler for one (HSK level, category) word list"""
+
+    def __init__(self, words: Sequence):
+        self.words = list(words)
+        self._all = range(len(self.words))
+        self._position: Dict[int, int] = {}
+        self._by_pinyin: Dict[str, List[int]] = {}
+        self._by_category: Dict[str, List[int]] = {}
+        self._by_radical: Dict[str, List[int]] = {}
+
+        for position, word in enumerate(self.words):
+            self._position[word.id] = position
+            self._by_pinyin.setdefault(word.pinyin_toneless, []).append(position)
+            if word.category:
+                self._by_category.setdefault(word.category, []).append(position)
+            if word.radical:
+                self._by_radical.setdefault(word.radical, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def _similar(self, word) -> List[Sequence[int]]:
+        """Buckets of look-alike / sound-alike words, most confusable first"""
+        buckets = [self._by_pinyin.get(word.pinyin_toneless, [])]
+        if word.radical:
+            buckets.append(self._by_radical.get(word.radical, []))
+        if word.category:
+            buckets.append(self._by_category.get(word.category, []))
+        return buckets
+
+    def sample(
+        self,
+        word,
+        k: int = 3,
+        hard: bool = False,
+        key: Optional[Callable[[object], Hashable]] = None
+    ) -> List:
+        """
+        Pick k distractors for `word`; fewer only when the word list does
+        not hold k usable ones
+
+        Args:
+            word: The correct answer (never returned)
+            k: Number of distractors wanted
+            hard: Prefer similar pinyin, shared radical, then same category
+            key: Option text extractor; distractors whose text equals the
+                 correct answer or another picked distractor are skipped
+        """
+        target = self._position.get(word.id)
+        picked = []
+        taken = {target}
+        seen = {key(word)} if key else set()
+
+        def take(positions: Iterator[int]):
+            for position in positions:
+                if len(picked) >= k:
+                    return
+                if position in taken:
+                    continue
+                taken.add(position)
+                candidate = self.words[position]
+                if key:
+                    value = key(candidate)
+                    if value in seen:
+                        continue
+                    seen.add(value)
+                picked.append(candidate)
+
+        if hard:
+            for bucket in self._similar(word):
+                take(_draw(bucket, k + EXTRA_DRAWS))
+
+        take(_draw(self._all, k + EXTRA_DRAWS + 1))
+        if len(picked) < k:
+            # The draws kept hitting the answer, exclusions or repeated option
+            # texts: go through the rest of the list, still in random order
+            take(_draw(self._all, len(self.words)))
+        return picked
@@ -2,8 +2,13 @@
 Gemini AI Service for sentence validation and feedback
 """
 
+import asyncio
+import hashlib
+import re
+import unicodedata
 import google.generativeai as genai
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
+from app.cache import ResponseCache, create_backend
 from app.config import settings
 
 # Configure Gemini AI
@@ -12,6 +17,81 @@ genai.configure(api_key=settings.GEMINI_API_KEY)
 # Initialize model - using stable free tier model
 model = genai.GenerativeModel('gemini-2.5-flash')
 
+# Caps in-flight Gemini calls per worker so a burst of slow generations
+# queues here instead of piling up on the API
+_gemini_slots = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+
+
+async def generate_text(prompt: str, timeout: Optional[float] = None) -> str:
+    """
+    Run one Gemini prompt without blocking the event loop
+
+    Waits for a free concurrency slot, then awaits the SDK's async API.
+    Raises asyncio.TimeoutError if the call (excluding the wait for a slot)
+    takes longer than `timeout` seconds (GEMINI_TIMEOUT_SECONDS by default).
+    """
+    async with _gemini_slots:
+        response = await asyncio.wait_for(
+            model.generate_content_async(prompt),
+            timeout=timeout or settings.GEMINI_TIMEOUT_SECONDS
+        )
+    return response.text
+
+
+async def stream_text(prompt: str, timeout: Optional[float] = None) -> AsyncIterator[str]:
+    """
+    Run one Gemini prompt in streaming mode, yielding text as it is generated
+
+    Holds a concurrency slot until the stream ends. Raises asyncio.TimeoutError
+    if the whole generation takes longer than `timeout` seconds
+    (GEMINI_TIMEOUT_SECONDS by default).
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (timeout or settings.GEMINI_TIMEOUT_SECONDS)
+
+    def remaining() -> float:
+        return max(0.0, deadline - loop.time())
+
+    async with _gemini_slots:
+        response = await asyncio.wait_for(
+            model.generate_content_async(prompt, stream=True),
+            timeout=remaining()
+        )
+        chunks = response.__aiter__()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(chunks.__anext__(), timeout=remaining())
+            except StopAsyncIteration:
+                return
+            if chunk.text:
+                yield chunk.text
+
+
+# Bump whenever the validation prompt changes so cached verdicts are not reused
+VALIDATION_PROMPT_VERSION = 1
+
+validation_cache = ResponseCache(
+    "sentence_validation",
+    create_backend(max_entries=settings.VALIDATION_CACHE_MAX_ENTRIES),
+    ttl=settings.VALIDATION_CACHE_TTL_SECONDS
+)
+
+
+def validation_cache_key(sentence: str, expected_meaning: Optional[str], hsk_level: int) -> str:
+    """
+    Content address of a validation request
+
+    Whitespace and full-/half-width differences in the sentence, and case and
+    spacing in the expected meaning, do not change the verdict so they do not
+    change the key either.
+    """
+    normalized_sentence = re.sub(r"\s+", "", unicodedata.normalize("NFKC", sentence))
+    normalized_meaning = " ".join(
+        unicodedata.normalize("NFKC", expected_meaning or "").lower().split()
+    )
+    material = f"v{VALIDATION_PROMPT_VERSION}|{hsk_level}|{normalized_sentence}|{normalized_meaning}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
 
 class SentenceValidationResult:
     """Result of sentence validation"""
@@ -22,7 +102,8 @@ class SentenceValidationResult:
         feedback: str,
         corrections: Optional[List[str]] = None,
         grammar_issues: Optional[List[str]] = None,
-        suggestions: Optional[List[str]] = None
+        suggestions: Optional[List[str]] = None,
+        is_fallback: bool = False
     ):
         self.is_correct = is_correct
         self.score = score  # 0-100
@@ -30,6 +111,7 @@ class SentenceValidationResult:
         self.corrections = corrections or []
         self.grammar_issues = grammar_issues or []
         self.suggestions = suggestions or []
+        self.is_fallback = is_fallback  # True when Gemini failed; never cached
 
     def to_dict(self) -> Dict:
         return {
@@ -94,8 +176,7 @@ Be encouraging but honest. Focus on learning."""
 
     try:
         # Call Gemini API
-        response = model.generate_content(prompt)
-        response_text = response.text
+        response_text = await generate_text(prompt)
 
         # Parse JSON response
         import json
@@ -128,7 +209,8 @@ Be encouraging but honest. Focus on learning."""
             feedback=f"Unable to validate sentence. Error: {str(e)}",
             corrections=[],
             grammar_issues=["API Error"],
-            suggestions=["Please try again"]
+            suggestions=["Please try again"],
+            is_fallback=True
         )
 
 
@@ -172,8 +254,7 @@ Format as JSON:
 }}"""
 
     try:
-        response = model.generate_content(prompt)
-        response_text = response.text
+        response_text = await generate_text(prompt)
 
         # Parse JSON
         import json
@@ -195,24 +276,13 @@ Format as JSON:
         }
 
 
-async def generate_story(
+def build_story_prompt(
     hsk_level: int,
     topic: Optional[str] = None,
     character_names: Optional[List[str]] = None,
     length: str = "short"
-) -> Dict:
-    """
-    Generate a Chinese story using Gemini AI
-
-    Args:
-        hsk_level: HSK level (1-6) for vocabulary complexity
-        topic: Story topic/theme (e.g., "family", "school", "food")
-        character_names: Optional character names to use
-        length: "short" (100-200 chars), "medium" (200-400 chars), or "long" (400-600 chars)
-
-    Returns:
-        Dict with story data including Chinese text, pinyin, English translation
-    """
+) -> str:
+    """Story generation prompt (arguments as for generate_story)"""
 
     # Determine word count based on length
     length_guide = {
@@ -229,7 +299,7 @@ async def generate_story(
     # Build topic string
     topic_str = f"Topic: {topic}" if topic else "Topic: Daily life"
 
-    prompt = f"""You are a creative Chinese language teacher. Create an engaging story for HSK Level {hsk_level} students.
+    return f"""You are a creative Chinese language teacher. Create an engaging story for HSK Level {hsk_level} students.
 
 Requirements:
 - HSK Level: {hsk_level}
@@ -259,19 +329,41 @@ Provide the story in JSON format:
 
 Make it interesting and educational!"""
 
-    try:
-        response = model.generate_content(prompt)
-        response_text = response.text
 
-        # Parse JSON
-        import json
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
+def parse_story_response(response_text: str) -> Dict:
+    """Story JSON from a model response, with or without a ``` fence"""
+    import json
+    if "```json" in response_text:
+        response_text = response_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in response_text:
+        response_text = response_text.split("```")[1].split("```")[0].strip()
+
+    return json.loads(response_text)
+
 
-        story_data = json.loads(response_text)
-        return story_data
+async def generate_story(
+    hsk_level: int,
+    topic: Optional[str] = None,
+    character_names: Optional[List[str]] = None,
+    length: str = "short"
+) -> Dict:
+    """
+    Generate a Chinese story using Gemini AI
+
+    Args:
+        hsk_level: HSK level (1-6) for vocabulary complexity
+        topic: Story topic/theme (e.g., "family", "school", "food")
+        character_names: Optional character names to use
+        length: "short" (100-200 chars), "medium" (200-400 chars), or "long" (400-600 chars)
+
+    Returns:
+        Dict with story data including Chinese text, pinyin, English translation
+    """
+    prompt = build_story_prompt(hsk_level, topic, character_names, length)
+
+    try:
+        response_text = await generate_text(prompt)
+        return parse_story_response(response_text)
 
     except Exception as e:
         print(f"Gemini API Error: {e}")
@@ -281,8 +373,8 @@ Make it interesting and educational!"""
 async def test_gemini_connection() -> bool:
     """Test if Gemini AI is configured correctly"""
     try:
-        response = model.generate_content("Say hello in Chinese")
-        return len(response.text) > 0
+        response_text = await generate_text("Say hello in Chinese")
+        return len(response_text) > 0
     except Exception as e:
         print(f"Gemini connection test failed: {e}")
         return False
@@ -3,10 +3,66 @@ Learning service with spaced repetition algorithm
 Implements a simple version of the SM-2 (SuperMemo 2) algorithm
 """
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import List, Dict, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import upsert_insert
 from app.models import UserProgress, HanziWord, User
+from app.services.review_notifier import review_counts
+from app.services.scheduling import get_scheduler
+from app.services.stats_service import LEARNING_COUNTERS, StatsService, learning_delta, sum_rows
+from app.services.vocabulary_catalog import CatalogWord, vocabulary_catalog
+
+
+# Scheduling state of a word the user has never reviewed
+NEW_PROGRESS = {
+    "mastery_level": 0,
+    "correct_count": 0,
+    "incorrect_count": 0,
+    "easiness_factor": 2.5,
+    "interval": 1,
+    "repetitions": 0,
+}
+
+SCHEDULE_FIELDS = (
+    "correct_count", "incorrect_count", "easiness_factor", "interval",
+    "repetitions", "mastery_level", "next_review", "last_reviewed"
+)
+
+
+def due_reviews_query(user_id: int, now: datetime, hsk_level: Optional[int] = None):
+    """
+    Progress rows due for review, most overdue first
+    Walks ix_user_progress_user_next_review in order, so LIMIT stops the
+    scan early; only the rows returned are fetched from the table.
+    """
+    query = select(UserProgress).where(
+        UserProgress.user_id == user_id,
+        UserProgress.next_review <= now
+    )
+    if hsk_level:
+        query = query.join(
+            HanziWord, UserProgress.word_id == HanziWord.id
+        ).where(HanziWord.hsk_level == hsk_level)
+    return query.order_by(UserProgress.next_review.asc())
+
+
+def due_count_query(user_id: int, now: datetime, hsk_level: Optional[int] = None):
+    """
+    Number of progress rows due for review
+    Without a level filter this is answered from ix_user_progress_user_next_review alone.
+    """
+    query = select(func.count()).select_from(UserProgress).where(
+        UserProgress.user_id == user_id,
+        UserProgress.next_review <= now
+    )
+    if hsk_level:
+        query = query.join(
+            HanziWord, UserProgress.word_id == HanziWord.id
+        ).where(HanziWord.hsk_level == hsk_level)
+    return query
+
+sm2 = get_scheduler("sm2")
 
 
 class LearningService:
@@ -15,35 +71,38 @@ class LearningService:
     # Spaced repetition intervals (in days)
     INTERVALS = [1, 3, 7, 14, 30, 90, 180]
 
+    # Most grades accepted by one record_reviews() call
+    MAX_BATCH_REVIEWS = 200
+
     @staticmethod
-    def get_words_for_learning(
-        db: Session,
+    async def get_words_for_learning(
+        db: AsyncSession,
         user: User,
         hsk_level: int,
         limit: int = 20,
         category: str = None
-    ) -> List[HanziWord]:
+    ) -> List[CatalogWord]:
         """
         Get words for initial learning (never seen before)
         """
         # Get words user hasn't started learning yet
-        learned_word_ids = db.query(UserProgress.word_id).filter(
-            UserProgress.user_id == user.id
-        ).subquery()
-
-        query = db.query(HanziWord).filter(
-            HanziWord.hsk_level == hsk_level,
-            ~HanziWord.id.in_(learned_word_ids)
+        result = await db.execute(
+            select(UserProgress.word_id).where(UserProgress.user_id == user.id)
         )
+        learned_word_ids = set(result.scalars().all())
 
-        if category:
-            query = query.filter(HanziWord.category == category)
+        words = []
+        for word in vocabulary_catalog.words_for_level(hsk_level, category=category):
+            if word.id not in learned_word_ids:
+                words.append(word)
+                if len(words) >= limit:
+                    break
 
-        return query.limit(limit).all()
+        return words
 
     @staticmethod
-    def get_words_for_review(
-        db: Session,
+    async def get_words_for_review(
+        db: AsyncSession,
         user: User,
         hsk_level: int = None
     ) -> List[Dict]:
@@ -52,33 +111,23 @@ class LearningService:
         """
         now = datetime.now(timezone.utc)
 
-        query = db.query(UserProgress, HanziWord).join(
-            HanziWord, UserProgress.word_id == HanziWord.id
-        ).filter(
-            UserProgress.user_id == user.id,
-            UserProgress.next_review <= now
-        )
-
-        if hsk_level:
-            query = query.filter(HanziWord.hsk_level == hsk_level)
-
-        # Order by next_review (most overdue first)
-        query = query.order_by(UserProgress.next_review.asc())
-
-        results = query.limit(50).all()
+        # At most 50 rows, in index order; word details come from the
+        # vocabulary catalog, not a join
+        due = (await db.execute(due_reviews_query(user.id, now, hsk_level).limit(50))).scalars().all()
+        words = {word.id: word for word in vocabulary_catalog.get_many([p.word_id for p in due])}
 
         return [
             {
-                "word": word,
+                "word": words.get(progress.word_id),
                 "progress": progress,
                 "days_overdue": (now - progress.next_review).days
             }
-            for progress, word in results
+            for progress in due
         ]
 
     @staticmethod
-    def get_words_for_test(
-        db: Session,
+    async def get_words_for_test(
+        db: AsyncSession,
         user: User,
         hsk_level: int,
         limit: int = 20,
@@ -87,18 +136,19 @@ class LearningService:
         """
         Get words for testing (mix of learned and mastered words)
         """
-        query = db.query(UserProgress, HanziWord).join(
+        query = select(UserProgress, HanziWord).join(
             HanziWord, UserProgress.word_id == HanziWord.id
-        ).filter(
+        ).where(
             UserProgress.user_id == user.id,
             HanziWord.hsk_level == hsk_level,
             UserProgress.mastery_level >= 1  # At least started learning
         )
 
         if category:
-            query = query.filter(HanziWord.category == category)
+            query = query.where(HanziWord.category == category)
 
-        results = query.order_by(UserProgress.last_reviewed.desc()).limit(limit).all()
+        query = query.order_by(UserProgress.last_reviewed.desc()).limit(limit)
+        results = (await db.execute(query)).all()
 
         return [
             {
@@ -109,8 +159,8 @@ class LearningService:
         ]
 
     @staticmethod
-    def record_review(
-        db: Session,
+    async def record_review(
+        db: AsyncSession,
         user: User,
         word_id: int,
         quality: int  # 0-5 rating (0=complete failure, 5=perfect recall)
@@ -119,80 +169,141 @@ class LearningService:
         Record a review and update spaced repetition schedule
         Based on SM-2 algorithm
         """
-        # Get or create progress record
-        progress = db.query(UserProgress).filter(
+        # Get or create progress record, locked so concurrent reviews of the
+        # word apply their stats deltas one after the other
+        locked = select(UserProgress).where(
             UserProgress.user_id == user.id,
             UserProgress.word_id == word_id
-        ).first()
+        ).with_for_update()
+        progress = (await db.execute(locked)).scalars().first()
 
         if not progress:
-            progress = UserProgress(
-                user_id=user.id,
-                word_id=word_id,
-                mastery_level=0,
-                correct_count=0,
-                incorrect_count=0,
-                easiness_factor=2.5,
-                interval=1,
-                repetitions=0
+            # A concurrent first review may insert the row too; ON CONFLICT
+            # DO NOTHING leaves it to whichever insert wins
+            created = await db.execute(
+                upsert_insert(db)(UserProgress).values(
+                    user_id=user.id, word_id=word_id, **NEW_PROGRESS
+                ).on_conflict_do_nothing(index_elements=[UserProgress.user_id, UserProgress.word_id])
             )
-            db.add(progress)
-
-        # Update counts
-        if quality >= 3:  # Correct response
-            progress.correct_count += 1
-        else:  # Incorrect response
-            progress.incorrect_count += 1
-
-        # Calculate new easiness factor (SM-2 formula)
-        progress.easiness_factor = max(
-            1.3,
-            progress.easiness_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+            progress = (await db.execute(locked)).scalars().one()
+            before = None if created.rowcount else {field: getattr(progress, field) for field in NEW_PROGRESS}
+        else:
+            before = {field: getattr(progress, field) for field in NEW_PROGRESS}
+
+        now = datetime.now(timezone.utc)
+        schedule = sm2.schedule_one(
+            {field: getattr(progress, field) for field in sm2.state_defaults},
+            quality
         )
+        for field, value in schedule.items():
+            setattr(progress, field, value)
+        progress.next_review = now + timedelta(days=progress.interval)
+        progress.last_reviewed = now
 
-        # Update interval and repetitions
-        if quality < 3:  # Failed recall
-            progress.repetitions = 0
-            progress.interval = 1
-        else:  # Successful recall
-            progress.repetitions += 1
-            if progress.repetitions == 1:
-                progress.interval = 1
-            elif progress.repetitions == 2:
-                progress.interval = 6
-            else:
-                progress.interval = int(progress.interval * progress.easiness_factor)
-
-        # Update mastery level (0-10 scale)
-        total_reviews = progress.correct_count + progress.incorrect_count
-        if total_reviews > 0:
-            accuracy = progress.correct_count / total_reviews
-            progress.mastery_level = min(10, int(accuracy * 10 * (progress.repetitions / 5 + 1)))
-
-        # Set next review date
-        progress.next_review = datetime.now(timezone.utc) + timedelta(days=progress.interval)
-        progress.last_reviewed = datetime.now(timezone.utc)
-
-        db.commit()
-        db.refresh(progress)
+        await StatsService.apply_learning_changes(db, user.id, [(word_id, learning_delta(before, schedule))])
+        await db.commit()
+        await db.refresh(progress)
+        review_counts.notify(user.id)
 
         return progress
 
     @staticmethod
-    def get_learning_stats(db: Session, user: User, hsk_level: int = None) -> Dict:
+    async def record_reviews(
+        db: AsyncSession,
+        user: User,
+        reviews: List[Tuple[int, int, Optional[datetime]]]
+    ) -> List[Dict]:
         """
-        Get learning statistics for a user
+        Record a session's worth of (word_id, quality, reviewed_at) grades at once
+
+        Grades are applied in reviewed_at order (a word may appear more than
+        once), each round of distinct words through one vectorized scheduler
+        call, and written in one transaction: one locked SELECT of the affected
+        rows and one multi-row INSERT ... ON CONFLICT (user_id, word_id) upsert.
+        Returns the resulting schedule of each word, in request order.
         """
-        query = db.query(UserProgress).filter(
-            UserProgress.user_id == user.id
+        now = datetime.now(timezone.utc)
+
+        def as_utc(reviewed_at: Optional[datetime]) -> datetime:
+            if reviewed_at is None:
+                return now
+            if reviewed_at.tzinfo is None:
+                reviewed_at = reviewed_at.replace(tzinfo=timezone.utc)
+            return min(reviewed_at, now)
+
+        grades = sorted(
+            ((word_id, quality, as_utc(reviewed_at)) for word_id, quality, reviewed_at in reviews),
+            key=lambda grade: grade[2]
+        )
+        word_ids = list(dict.fromkeys(word_id for word_id, _, _ in reviews))
+
+        result = await db.execute(
+            select(UserProgress.word_id, *[
+                getattr(UserProgress, field) for field in NEW_PROGRESS
+            ]).where(
+                UserProgress.user_id == user.id,
+                UserProgress.word_id.in_(word_ids)
+            ).with_for_update()
         )
+        states = {row.word_id: dict(row._mapping) for row in result}
+        before = {word_id: dict(state) for word_id, state in states.items()}
+        for word_id in word_ids:
+            if word_id not in states:
+                states[word_id] = {"user_id": user.id, "word_id": word_id, **NEW_PROGRESS}
+
+        # The k-th grade of every word goes into round k
+        rounds: List[List[Tuple[int, int, datetime]]] = []
+        seen_count: Dict[int, int] = {}
+        for grade in grades:
+            k = seen_count.get(grade[0], 0)
+            seen_count[grade[0]] = k + 1
+            if k == len(rounds):
+                rounds.append([])
+            rounds[k].append(grade)
+
+        for round_grades in rounds:
+            batch = [states[word_id] for word_id, _, _ in round_grades]
+            result = sm2.schedule(
+                {field: [state[field] for state in batch] for field in sm2.state_defaults},
+                [quality for _, quality, _ in round_grades]
+            )
+            for i, (word_id, _, reviewed_at) in enumerate(round_grades):
+                state = states[word_id]
+                for field, values in result.items():
+                    state[field] = values[i]
+                state["next_review"] = reviewed_at + timedelta(days=state["interval"])
+                state["last_reviewed"] = reviewed_at
+
+        insert = upsert_insert(db)
+        statement = insert(UserProgress).values([
+            {"user_id": user.id, "word_id": word_id, **{field: states[word_id][field] for field in SCHEDULE_FIELDS}}
+            for word_id in word_ids
+        ])
+        await db.execute(statement.on_conflict_do_update(
+            index_elements=[UserProgress.user_id, UserProgress.word_id],
+            set_={field: statement.excluded[field] for field in SCHEDULE_FIELDS}
+        ))
+        await StatsService.apply_learning_changes(db, user.id, [
+            (word_id, learning_delta(before.get(word_id), states[word_id])) for word_id in word_ids
+        ])
+        await db.commit()
+        review_counts.notify(user.id)
 
-        if hsk_level:
-            query = query.join(HanziWord).filter(HanziWord.hsk_level == hsk_level)
+        return [
+            {"word_id": word_id, **{field: states[word_id][field] for field in SCHEDULE_FIELDS}}
+            for word_id in word_ids
+        ]
 
-        all_progress = query.all()
+    @staticmethod
+    async def get_learning_stats(db: AsyncSession, user: User, hsk_level: int = None) -> Dict:
+        """
+        Get learning statistics for a user
+        Totals come from the materialized user_learning_stats rows; only the
+        time-dependent due count is queried (index-only on user_progress)
+        """
+        rows = await StatsService.get_learning_rows(db, user.id, hsk_level)
 
-        if not all_progress:
+        if not rows:
             return {
                 "total_words_learning": 0,
                 "mastered_words": 0,
@@ -202,18 +313,19 @@ class LearningService:
                 "accuracy": 0
             }
 
-        now = datetime.now(timezone.utc)
-        mastered = sum(1 for p in all_progress if p.mastery_level >= 8)
-        due_for_review = sum(1 for p in all_progress if p.next_review and p.next_review <= now)
-        total_correct = sum(p.correct_count for p in all_progress)
-        total_incorrect = sum(p.incorrect_count for p in all_progress)
-        total_reviews = total_correct + total_incorrect
+        totals = sum_rows(rows, LEARNING_COUNTERS)
+
+        due_for_review = await db.scalar(due_count_query(user.id, datetime.now(timezone.utc), hsk_level))
+
+        total_correct = totals["correct_total"]
+        total_reviews = total_correct + totals["incorrect_total"]
+        words_learning = totals["words_learning"]
 
         return {
-            "total_words_learning": len(all_progress),
-            "mastered_words": mastered,
+            "total_words_learning": words_learning,
+            "mastered_words": totals["mastered_words"],
             "due_for_review": due_for_review,
-            "average_mastery": sum(p.mastery_level for p in all_progress) / len(all_progress),
+            "average_mastery": totals["mastery_total"] / words_learning if words_learning else 0,
             "total_reviews": total_reviews,
             "accuracy": (total_correct / total_reviews * 100) if total_reviews > 0 else 0
         }
@@ -0,0 +1,143 @@
+"""
+Review Notifier
+Pushes a user's due-review count to open connections instead of being polled
+
+One watcher task runs per user with at least one open stream, however many
+tabs are open. It asks the database for the due count and the next due time
+in a single indexed query, then sleeps until that card becomes due, until
+the user's reviews change the schedule (notify()), or until the periodic
+resync (which catches reviews recorded by other worker processes).
+"""
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set, Tuple
+from sqlalchemy import func, select
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import UserProgress
+
+logger = logging.getLogger(__name__)
+
+
+async def due_review_snapshot(user_id: int) -> Tuple[int, Optional[datetime]]:
+    """(number of due reviews, earliest future next_review or None)"""
+    now = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(
+            select(
+                func.count().filter(UserProgress.next_review <= now),
+                func.min(UserProgress.next_review).filter(UserProgress.next_review > now),
+            ).where(UserProgress.user_id == user_id)
+        )).one()
+    count, next_due = row
+    if next_due is not None and next_due.tzinfo is None:
+        next_due = next_due.replace(tzinfo=timezone.utc)
+    return count or 0, next_due
+
+
+class DueReviewWatcher:
+    """Keeps one user's due count current and fans it out to their streams"""
+
+    def __init__(self, hub: "ReviewCountHub", user_id: int):
+        self.hub = hub
+        self.user_id = user_id
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.count: Optional[int] = None
+        self.changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def _publish(self, count: int):
+        self.count = count
+        for queue in self.subscribers:
+            queue.put_nowait(count)
+
+    async def run(self):
+        while self.subscribers:
+            try:
+                count, next_due = await due_review_snapshot(self.user_id)
+                self.hub.queries += 1
+            except Exception:
+                logger.exception("Due review query failed for user %s", self.user_id)
+                count, next_due = self.count, None
+
+            if count is not None and count != self.count:
+                self._publish(count)
+
+            timeout = settings.REVIEW_STREAM_RESYNC_SECONDS
+            if next_due is not None:
+                seconds_until_due = (next_due - datetime.now(timezone.utc)).total_seconds()
+                timeout = min(timeout, max(seconds_until_due, 0) + 1)
+            try:
+                await asyncio.wait_for(self.changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.changed.clear()
+
+
+class ReviewCountHub:
+    """Per-process registry of due-review watchers"""
+
+    def __init__(self):
+        self._watchers: Dict[int, DueReviewWatcher] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queries = 0
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int):
+        """Queue receiving the user's due count now and whenever it changes"""
+        self._loop = asyncio.get_running_loop()
+        watcher = self._watchers.get(user_id)
+        if watcher is None:
+            watcher = self._watchers[user_id] = DueReviewWatcher(self, user_id)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        if watcher.count is not None:
+            queue.put_nowait(watcher.count)
+        watcher.subscribers.add(queue)
+        if watcher.task is None or watcher.task.done():
+            watcher.task = asyncio.create_task(watcher.run())
+        try:
+            yield queue
+        finally:
+            watcher.subscribers.discard(queue)
+            if not watcher.subscribers:
+                watcher.task.cancel()
+                del self._watchers[user_id]
+
+    def notify(self, user_id: int):
+        """Schedule changed for a user: recount now (safe to call from any thread)"""
+        watcher = self._watchers.get(user_id)
+        if watcher is None or self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            watcher.changed.set()
+        else:
+            self._loop.call_soon_threadsafe(watcher.changed.set)
+
+    async def stream(self, user_id: int):
+        """Server-sent events: a review-count event per change, keep-alive comments between"""
+        async with self.subscribe(user_id) as queue:
+            while True:
+                try:
+                    count = await asyncio.wait_for(queue.get(), settings.REVIEW_STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: review-count\ndata: {json.dumps({'count': count})}\n\n"
+
+    def stats(self) -> dict:
+        return {
+            "watched_users": len(self._watchers),
+            "open_streams": sum(len(w.subscribers) for w in self._watchers.values()),
+            "queries": self.queries,
+        }
+
+
+review_counts = ReviewCountHub()
@@ -0,0 +1,323 @@
+"""
+Scheduling engine for spaced repetition
+Computes the next review state of many cards at once
+
+Card states are passed column-wise (field name -> sequence of values, one
+entry per card) together with a sequence of 0-5 quality grades, and the new
+columns come back the same way. With NumPy installed large batches are
+computed with array operations; otherwise (and for small batches, where
+array setup costs more than it saves) a plain Python loop is used. Both
+paths give identical results.
+
+Algorithms:
+- "sm2":  SuperMemo 2, the schedule stored in user_progress
+- "fsrs": FSRS-4.5 with its default weights, for simulations; its state
+          (stability, difficulty, elapsed_days) is not persisted yet
+"""
+import math
+from typing import Dict, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Below this many cards the Python loop beats NumPy's per-call overhead
+VECTORIZE_MIN_CARDS = 64
+
+Columns = Dict[str, Sequence]
+
+
+def mastery_level(correct_count: int, incorrect_count: int, repetitions: int) -> int:
+    """0-10 mastery from answer accuracy, boosted by the current streak"""
+    total_reviews = correct_count + incorrect_count
+    if total_reviews == 0:
+        return 0
+    accuracy = correct_count / total_reviews
+    return min(10, int(accuracy * 10 * (repetitions / 5 + 1)))
+
+
+def _mastery_array(correct, incorrect, repetitions):
+    total = correct + incorrect
+    accuracy = np.divide(correct, total, out=np.zeros(len(total)), where=total > 0)
+    return np.minimum(10, np.floor(accuracy * 10 * (repetitions / 5 + 1))).astype(np.int64)
+
+
+class Scheduler:
+    """
+    Base class for scheduling algorithms
+
+    Subclasses list their state fields with defaults for unseen cards and
+    implement _schedule_python (per card) and _schedule_numpy (per batch).
+    """
+    name = ""
+    state_defaults: Dict[str, float] = {}
+
+    def schedule(self, states: Columns, quality: Sequence[int], as_arrays: bool = False) -> Dict[str, Sequence]:
+        """
+        Apply one review to each card
+
+        Args:
+            states: Column per state field (lists or NumPy arrays); missing
+                    fields and None/NaN values take the defaults for an unseen card
+            quality: 0-5 grade per card (0=complete failure, 5=perfect recall)
+            as_arrays: Return NumPy arrays instead of lists (requires NumPy),
+                       which saves the conversion in large simulations
+
+        Returns:
+            New value columns for the state fields, plus "interval" (days
+            until the next review) and "mastery_level"
+        """
+        size = len(quality)
+        if np is not None and (as_arrays or size >= VECTORIZE_MIN_CARDS):
+            arrays = {}
+            for field, default in self.state_defaults.items():
+                values = states.get(field)
+                if values is None:
+                    arrays[field] = np.full(size, default, dtype=np.float64)
+                    continue
+                column = np.array(values, dtype=np.float64)
+                column[np.isnan(column)] = default
+                arrays[field] = column
+            result = self._schedule_numpy(arrays, np.asarray(quality, dtype=np.int64))
+            if as_arrays:
+                return result
+            return {field: values.tolist() for field, values in result.items()}
+        if as_arrays:
+            raise RuntimeError("as_arrays=True requires NumPy")
+
+        columns = {
+            field: [default if value is None else value for value in states.get(field, [default] * size)]
+            for field, default in self.state_defaults.items()
+        }
+        rows = [
+            self._schedule_python({field: columns[field][i] for field in columns}, quality[i])
+            for i in range(size)
+        ]
+        return {field: [row[field] for row in rows] for field in (rows[0] if rows else {})}
+
+    def schedule_one(self, state: Dict, quality: int) -> Dict:
+        """schedule() for a single card given as a field -> value dict"""
+        result = self.schedule({field: [value] for field, value in state.items()}, [quality])
+        return {field: values[0] for field, values in result.items()}
+
+    def _schedule_python(self, state: Dict, quality: int) -> Dict:
+        raise NotImplementedError
+
+    def _schedule_numpy(self, state: Dict, quality) -> Dict:
+        raise NotImplementedError
+
+
+class SM2Scheduler(Scheduler):
+    """SuperMemo 2 as used since the first version of the learning service"""
+    name = "sm2"
+    state_defaults = {
+        "correct_count": 0,
+        "incorrect_count": 0,
+        "easiness_factor": 2.5,
+        "interval": 1,
+        "repetitions": 0,
+    }
+
+    def _schedule_python(self, state: Dict, quality: int) -> Dict:
+        correct_count = int(state["correct_count"])
+        incorrect_count = int(state["incorrect_count"])
+        interval = int(state["interval"])
+        repetitions = int(state["repetitions"])
+
+        if quality >= 3:  # Correct response
+            correct_count += 1
+        else:  # Incorrect response
+            incorrect_count += 1
+
+        easiness_factor = max(
+            1.3,
+            state["easiness_factor"] + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        )
+
+        if quality < 3:  # Failed recall
+            repetitions = 0
+            interval = 1
+        else:  # Successful recall
+            repetitions += 1
+            if repetitions == 1:
+                interval = 1
+            elif repetitions == 2:
+                interval = 6
+            else:
+                interval = int(interval * easiness_factor)
+
+        return {
+            "correct_count": correct_count,
+            "incorrect_count": incorrect_count,
+            "easiness_factor": easiness_factor,
+            "interval": interval,
+            "repetitions": repetitions,
+            "mastery_level": mastery_level(correct_count, incorrect_count, repetitions),
+        }
+
+    def _schedule_numpy(self, state: Dict, quality) -> Dict:
+        passed = quality >= 3
+        correct = state["correct_count"] + passed
+        incorrect = state["incorrect_count"] + ~passed
+        miss = 5 - quality
+        easiness = np.maximum(1.3, state["easiness_factor"] + (0.1 - miss * (0.08 + miss * 0.02)))
+
+        repetitions = np.where(passed, state["repetitions"] + 1, 0)
+        interval = np.select(
+            [~passed, repetitions == 1, repetitions == 2],
+            [1, 1, 6],
+            np.floor(state["interval"] * easiness)
+        )
+
+        return {
+            "correct_count": correct.astype(np.int64),
+            "incorrect_count": incorrect.astype(np.int64),
+            "easiness_factor": easiness,
+            "interval": interval.astype(np.int64),
+            "repetitions": repetitions.astype(np.int64),
+            "mastery_level": _mastery_array(correct, incorrect, repetitions),
+        }
+
+
+# FSRS-4.5 default parameters
+FSRS_WEIGHTS = (
+    0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+    0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755,
+)
+FSRS_DECAY = -0.5
+FSRS_FACTOR = 19 / 81  # makes retrievability 90% when elapsed days == stability
+
+
+def fsrs_rating(quality: int) -> int:
+    """0-5 SM-2 grade -> FSRS rating (1=again, 2=hard, 3=good, 4=easy)"""
+    return 1 if quality < 3 else quality - 1
+
+
+class FSRSScheduler(Scheduler):
+    """
+    FSRS-4.5 (Free Spaced Repetition Scheduler) with default weights
+
+    State per card: stability (days), difficulty (1-10) and elapsed_days
+    since the previous review; stability 0 marks an unseen card.
+    """
+    name = "fsrs"
+    state_defaults = {
+        "correct_count": 0,
+        "incorrect_count": 0,
+        "repetitions": 0,
+        "stability": 0.0,
+        "difficulty": 0.0,
+        "elapsed_days": 0.0,
+    }
+
+    def __init__(self, desired_retention: float = 0.9, weights: Sequence[float] = FSRS_WEIGHTS):
+        self.desired_retention = desired_retention
+        self.w = tuple(weights)
+
+    def _interval(self, stability: float) -> int:
+        days = stability / FSRS_FACTOR * (self.desired_retention ** (1 / FSRS_DECAY) - 1)
+        return max(1, int(round(days)))
+
+    def _schedule_python(self, state: Dict, quality: int) -> Dict:
+        w = self.w
+        rating = fsrs_rating(quality)
+        stability = state["stability"]
+        difficulty = state["difficulty"]
+
+        if stability <= 0:  # First review
+            new_stability = w[rating - 1]
+            new_difficulty = w[4] - (rating - 3) * w[5]
+        else:
+            retrievability = (1 + FSRS_FACTOR * state["elapsed_days"] / stability) ** FSRS_DECAY
+            if rating > 1:
+                hard_penalty = w[15] if rating == 2 else 1.0
+                easy_bonus = w[16] if rating == 4 else 1.0
+                new_stability = stability * (
+                    math.exp(w[8]) * (11 - difficulty) * stability ** -w[9]
+                    * (math.exp(w[10] * (1 - retrievability)) - 1) * hard_penalty * easy_bonus + 1
+                )
+            else:
+                new_stability = (
+                    w[11] * max(difficulty, 1.0) ** -w[12] * ((stability + 1) ** w[13] - 1)
+                    * math.exp(w[14] * (1 - retrievability))
+                )
+            # Move difficulty by the rating, then revert towards the default
+            new_difficulty = w[7] * w[4] + (1 - w[7]) * (difficulty - w[6] * (rating - 3))
+        new_difficulty = min(10.0, max(1.0, new_difficulty))
+
+        passed = rating > 1
+        correct_count = int(state["correct_count"]) + passed
+        incorrect_count = int(state["incorrect_count"]) + (not passed)
+        repetitions = int(state["repetitions"]) + 1 if passed else 0
+
+        return {
+            "correct_count": correct_count,
+            "incorrect_count": incorrect_count,
+            "repetitions": repetitions,
+            "stability": new_stability,
+            "difficulty": new_difficulty,
+            "elapsed_days": 0.0,
+            "interval": self._interval(new_stability),
+            "mastery_level": mastery_level(correct_count, incorrect_count, repetitions),
+        }
+
+    def _schedule_numpy(self, state: Dict, quality) -> Dict:
+        w = np.asarray(self.w)
+        rating = np.where(quality < 3, 1, quality - 1)
+        stability = state["stability"]
+        difficulty = state["difficulty"]
+        seen = stability > 0
+        safe_stability = np.where(seen, stability, 1.0)
+
+        retrievability = (1 + FSRS_FACTOR * state["elapsed_days"] / safe_stability) ** FSRS_DECAY
+        hard_penalty = np.where(rating == 2, w[15], 1.0)
+        easy_bonus = np.where(rating == 4, w[16], 1.0)
+        recall_stability = safe_stability * (
+            np.exp(w[8]) * (11 - difficulty) * safe_stability ** -w[9]
+            * (np.exp(w[10] * (1 - retrievability)) - 1) * hard_penalty * easy_bonus + 1
+        )
+        forget_stability = (
+            w[11] * np.maximum(difficulty, 1.0) ** -w[12] * ((safe_stability + 1) ** w[13] - 1)
+            * np.exp(w[14] * (1 - retrievability))
+        )
+        new_stability = np.where(
+            seen,
+            np.where(rating > 1, recall_stability, forget_stability),
+            w[rating - 1]
+        )
+        new_difficulty = np.clip(np.where(
+            seen,
+            w[7] * w[4] + (1 - w[7]) * (difficulty - w[6] * (rating - 3)),
+            w[4] - (rating - 3) * w[5]
+        ), 1.0, 10.0)
+
+        passed = rating > 1
+        correct = state["correct_count"] + passed
+        incorrect = state["incorrect_count"] + ~passed
+        repetitions = np.where(passed, state["repetitions"] + 1, 0)
+        days = new_stability / FSRS_FACTOR * (self.desired_retention ** (1 / FSRS_DECAY) - 1)
+
+        return {
+            "correct_count": correct.astype(np.int64),
+            "incorrect_count": incorrect.astype(np.int64),
+            "repetitions": repetitions.astype(np.int64),
+            "stability": new_stability,
+            "difficulty": new_difficulty,
+            "elapsed_days": np.zeros(len(quality)),
+            "interval": np.maximum(1, np.round(days)).astype(np.int64),
+            "mastery_level": _mastery_array(correct, incorrect, repetitions),
+        }
+
+
+SCHEDULERS = {
+    SM2Scheduler.name: SM2Scheduler(),
+    FSRSScheduler.name: FSRSScheduler(),
+}
+
+
+def get_scheduler(name: str = "sm2") -> Scheduler:
+    try:
+        return SCHEDULERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown scheduling algorithm: {name}") from None
@@ -0,0 +1,90 @@
+"""
+Search Index
+In-memory n-gram index used for vocabulary search when PostgreSQL is not available
+"""
+import heapq
+from typing import Dict, List, Optional, Sequence, Set
+from app.pinyin import numbered_key, toneless_key
+
+# Match tiers, best first: exact match, prefix match, substring match.
+# Within a tier simplified beats pinyin beats English; typing the tones right
+# ranks a word just above its toneless homophones.
+EXACT_SCORES = (100, 90, 80)
+TONE_EXACT_SCORE = 95
+PREFIX_SCORES = (60, 55, 50)
+SUBSTRING_SCORE = 10
+
+
+def _ngrams(text: str, size: int) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class SearchIndex:
+    """In-memory n-gram index over a catalog snapshot"""
+
+    def __init__(self, words: Sequence):
+        self.words = list(words)
+        # Per field: simplified, pinyin key, lowercased English
+        self._fields = [
+            [(w.simplified or "") for w in self.words],
+            [w.pinyin_toneless for w in self.words],
+            [(w.english or "").lower() for w in self.words],
+        ]
+        self._numbered = [w.pinyin_numbered for w in self.words]
+        self._postings: List[Dict[str, Set[int]]] = []
+        for values in self._fields:
+            postings: Dict[str, Set[int]] = {}
+            for position, value in enumerate(values):
+                for gram in _ngrams(value, 1) | _ngrams(value, 2):
+                    postings.setdefault(gram, set()).add(position)
+            self._postings.append(postings)
+
+    def _candidates(self, field: int, query: str) -> Set[int]:
+        grams = _ngrams(query, 2 if len(query) >= 2 else 1)
+        postings = self._postings[field]
+        sets = sorted((postings.get(gram, set()) for gram in grams), key=len)
+        if not sets:
+            return set()
+        candidates = set(sets[0])
+        for other in sets[1:]:
+            candidates &= other
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, q: str, hsk_level: Optional[int] = None, limit: int = 50) -> List:
+        queries = (q.strip(), toneless_key(q), q.strip().lower())
+        numbered = numbered_key(q)
+        has_tones = numbered != queries[1]
+        scores: Dict[int, int] = {}
+
+        for field, query in enumerate(queries):
+            if not query:
+                continue
+            values = self._fields[field]
+            for position in self._candidates(field, query):
+                value = values[position]
+                if value == query:
+                    score = EXACT_SCORES[field]
+                    if field == 1 and has_tones and self._numbered[position] == numbered:
+                        score = TONE_EXACT_SCORE
+                elif value.startswith(query):
+                    score = PREFIX_SCORES[field]
+                elif query in value:
+                    score = SUBSTRING_SCORE
+                else:
+                    continue
+                if score > scores.get(position, 0):
+                    scores[position] = score
+
+        words = self.words
+        positions = (
+            p for p in scores
+            if hsk_level is None or words[p].hsk_level == hsk_level
+        )
+        best = heapq.nsmallest(
+            limit,
+            positions,
+            key=lambda p: (-scores[p], len(words[p].simplified), words[p].id)
+        )
+        return [words[p] for p in best]
@@ -0,0 +1,87 @@
+"""
+Vocabulary Search
+Ranked, tone-insensitive search over simplified characters, pinyin and English
+
+On PostgreSQL the query runs against the pg_trgm GIN indexes created by the
+`add_vocabulary_search_indexes` migration and the normalized pinyin columns
+from `add_normalized_pinyin_columns`. Other databases (SQLite test runs) use an
+in-memory n-gram index built from the vocabulary catalog.
+"""
+from typing import List, Optional
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+from app.models import HanziWord
+from app.pinyin import numbered_key, toneless_key
+from app.services.search_index import EXACT_SCORES, PREFIX_SCORES, SUBSTRING_SCORE, TONE_EXACT_SCORE
+from app.services.vocabulary_catalog import vocabulary_catalog
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_words(
+    db: Session,
+    q: str,
+    hsk_level: Optional[int] = None,
+    limit: int = 50
+) -> List:
+    """
+    Search vocabulary, best matches first
+
+    Args:
+        db: Database session (its dialect selects the backend)
+        q: Characters, pinyin with or without tone marks, or English
+        hsk_level: Optional HSK level filter
+        limit: Maximum number of results
+    """
+    if not q.strip():
+        return []
+
+    if db.get_bind().dialect.name != "postgresql":
+        return vocabulary_catalog.search_index().search(q, hsk_level=hsk_level, limit=limit)
+
+    text = q.strip()
+    pinyin = toneless_key(q)
+    numbered = numbered_key(q)
+    english = text.lower()
+
+    pinyin_column = HanziWord.pinyin_toneless
+    english_column = func.lower(HanziWord.english)
+
+    text_pattern = _escape_like(text)
+    english_pattern = _escape_like(english)
+    pinyin_pattern = _escape_like(pinyin)
+
+    conditions = [
+        HanziWord.simplified.like(f"%{text_pattern}%", escape="\\"),
+        english_column.like(f"%{english_pattern}%", escape="\\"),
+    ]
+    exact = [
+        (HanziWord.simplified == text, EXACT_SCORES[0]),
+        (english_column == english, EXACT_SCORES[2]),
+    ]
+    prefix = [
+        (HanziWord.simplified.like(f"{text_pattern}%", escape="\\"), PREFIX_SCORES[0]),
+        (english_column.like(f"{english_pattern}%", escape="\\"), PREFIX_SCORES[2]),
+    ]
+    # Punctuation-only input ("'", "-") normalizes to an empty pinyin key
+    if pinyin:
+        conditions.append(pinyin_column.like(f"%{pinyin_pattern}%", escape="\\"))
+        exact.insert(1, (pinyin_column == pinyin, EXACT_SCORES[1]))
+        prefix.insert(1, (pinyin_column.like(f"{pinyin_pattern}%", escape="\\"), PREFIX_SCORES[1]))
+        if numbered != pinyin:
+            exact.insert(1, (HanziWord.pinyin_numbered == numbered, TONE_EXACT_SCORE))
+
+    score = case(*exact, *prefix, else_=SUBSTRING_SCORE)
+
+    query = db.query(HanziWord).filter(or_(*conditions))
+    if hsk_level:
+        query = query.filter(HanziWord.hsk_level == hsk_level)
+
+    return query.order_by(
+        score.desc(),
+        func.similarity(english_column, english).desc(),
+        func.length(HanziWord.simplified),
+        HanziWord.id
+    ).limit(limit).all()
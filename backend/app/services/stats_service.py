@@ -0,0 +1,269 @@
+"""
+Stats Service
+Materialized per-user, per-HSK-level totals behind the stats endpoints
+
+Every change to a user_progress or writing_progress row is turned into a
+delta (e.g. mastered_words +1, mastery_total +3) and added to the matching
+stats row in the same transaction, with an INSERT ... ON CONFLICT increment.
+Reading stats is then a lookup of at most six rows. rebuild_* recompute the
+rows for one user from the progress tables with SQL aggregates; that also
+happens on a write that finds the user's row for a level missing, or that
+touches a word the vocabulary catalog does not know yet.
+"""
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.orm import Session
+from app.database import upsert_insert
+from app.models import HanziWord, UserLearningStats, UserProgress, UserWritingStats, WritingProgress
+from app.services.vocabulary_catalog import vocabulary_catalog
+
+logger = logging.getLogger(__name__)
+
+LEARNING_COUNTERS = ("words_learning", "mastered_words", "mastery_total", "correct_total", "incorrect_total")
+WRITING_COUNTERS = (
+    "characters_practiced", "attempts_total", "accuracy_total",
+    "mastered_characters", "characters_in_progress", "new_characters"
+)
+
+MASTERED_LEVEL = 8
+IN_PROGRESS_LEVEL = 3
+
+
+def learning_delta(old: Optional[Dict], new: Dict) -> Dict:
+    """Counter changes for one user_progress row going from `old` (None if new) to `new`"""
+    old = old or {}
+    mastery_before = old.get("mastery_level") or 0
+    mastery_after = new.get("mastery_level") or 0
+    return {
+        "words_learning": 0 if old else 1,
+        "mastered_words": (mastery_after >= MASTERED_LEVEL) - (bool(old) and mastery_before >= MASTERED_LEVEL),
+        "mastery_total": mastery_after - mastery_before,
+        "correct_total": (new.get("correct_count") or 0) - (old.get("correct_count") or 0),
+        "incorrect_total": (new.get("incorrect_count") or 0) - (old.get("incorrect_count") or 0),
+    }
+
+
+def _writing_bucket(mastery_level: int) -> str:
+    if mastery_level >= MASTERED_LEVEL:
+        return "mastered_characters"
+    if mastery_level >= IN_PROGRESS_LEVEL:
+        return "characters_in_progress"
+    return "new_characters"
+
+
+def writing_delta(old: Optional[Dict], new: Dict) -> Dict:
+    """Counter changes for one writing_progress row going from `old` (None if new) to `new`"""
+    delta = dict.fromkeys(WRITING_COUNTERS, 0)
+    delta["characters_practiced"] = 0 if old else 1
+    delta["attempts_total"] = (new.get("total_attempts") or 0) - ((old or {}).get("total_attempts") or 0)
+    delta["accuracy_total"] = (new.get("accuracy_score") or 0.0) - ((old or {}).get("accuracy_score") or 0.0)
+    if old:
+        delta[_writing_bucket(old.get("mastery_level") or 0)] -= 1
+    delta[_writing_bucket(new.get("mastery_level") or 0)] += 1
+    return delta
+
+
+def increment_statement(db, model, counters: Tuple[str, ...], user_id: int, changes: List[Tuple[int, Dict]]):
+    """
+    Upsert adding the (word_id, delta) changes to the user's stats rows, or
+    None if nothing changes. Works with sync and async sessions alike.
+    """
+    levels = {word.id: word.hsk_level for word in vocabulary_catalog.get_many([word_id for word_id, _ in changes])}
+    totals: Dict[int, Dict] = {}
+    for word_id, delta in changes:
+        level = levels.get(word_id)
+        if level is None:
+            logger.warning("Word %s not in the vocabulary catalog; %s not updated", word_id, model.__tablename__)
+            continue
+        row = totals.setdefault(level, dict.fromkeys(counters, 0))
+        for counter in counters:
+            row[counter] += delta[counter]
+
+    rows = [
+        {"user_id": user_id, "hsk_level": level, **row}
+        for level, row in totals.items() if any(row.values())
+    ]
+    if not rows:
+        return None
+
+    statement = upsert_insert(db)(model).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[model.user_id, model.hsk_level],
+        set_={counter: getattr(model, counter) + statement.excluded[counter] for counter in counters}
+    )
+
+
+def sum_rows(rows: List, counters: Tuple[str, ...]) -> Dict:
+    """Add up stats rows (one per HSK level) into one set of totals"""
+    return {counter: sum(getattr(row, counter) for row in rows) for counter in counters}
+
+
+def learning_aggregates(user_id: int):
+    """Per-level learning stats of a user, aggregated from user_progress"""
+    mastery = func.coalesce(UserProgress.mastery_level, 0)
+    return select(
+        HanziWord.hsk_level,
+        func.count().label("words_learning"),
+        func.sum(case((mastery >= MASTERED_LEVEL, 1), else_=0)).label("mastered_words"),
+        func.sum(mastery).label("mastery_total"),
+        func.sum(func.coalesce(UserProgress.correct_count, 0)).label("correct_total"),
+        func.sum(func.coalesce(UserProgress.incorrect_count, 0)).label("incorrect_total"),
+    ).join(
+        HanziWord, UserProgress.word_id == HanziWord.id
+    ).where(
+        UserProgress.user_id == user_id
+    ).group_by(HanziWord.hsk_level)
+
+
+def writing_aggregates(user_id: int):
+    """Per-level writing stats of a user, aggregated from writing_progress"""
+    mastery = func.coalesce(WritingProgress.mastery_level, 0)
+    return select(
+        HanziWord.hsk_level,
+        func.count().label("characters_practiced"),
+        func.sum(func.coalesce(WritingProgress.total_attempts, 0)).label("attempts_total"),
+        func.sum(func.coalesce(WritingProgress.accuracy_score, 0.0)).label("accuracy_total"),
+        func.sum(case((mastery >= MASTERED_LEVEL, 1), else_=0)).label("mastered_characters"),
+        func.sum(case(
+            ((mastery >= IN_PROGRESS_LEVEL) & (mastery < MASTERED_LEVEL), 1), else_=0
+        )).label("characters_in_progress"),
+        func.sum(case((mastery < IN_PROGRESS_LEVEL, 1), else_=0)).label("new_characters"),
+    ).join(
+        HanziWord, WritingProgress.word_id == HanziWord.id
+    ).where(
+        WritingProgress.user_id == user_id
+    ).group_by(HanziWord.hsk_level)
+
+
+def _touched_levels(changes: List[Tuple[int, Dict]]) -> Optional[Set[int]]:
+    """
+    HSK levels of the changed words, or None if a word is not in the
+    vocabulary catalog: its level is unknown, so no delta can be applied
+    """
+    word_ids = {word_id for word_id, _ in changes}
+    words = vocabulary_catalog.get_many(list(word_ids))
+    if len(words) < len(word_ids):
+        return None
+    return {word.hsk_level for word in words}
+
+
+def _existing_levels(model, user_id: int, levels: Set[int]):
+    return select(model.hsk_level).where(model.user_id == user_id, model.hsk_level.in_(levels))
+
+
+def _replace_statements(db, model, user_id: int, aggregates: List) -> List:
+    statements = [delete(model).where(model.user_id == user_id)]
+    rows = [{"user_id": user_id, **row._mapping} for row in aggregates]
+    if rows:
+        statements.append(upsert_insert(db)(model).values(rows))
+    return statements
+
+
+# (stats model, counters, aggregate query) of each kind of stats
+LEARNING = (UserLearningStats, LEARNING_COUNTERS, learning_aggregates)
+WRITING = (UserWritingStats, WRITING_COUNTERS, writing_aggregates)
+
+
+class StatsService:
+    """Materialized learning and writing stats"""
+
+    @staticmethod
+    async def apply_learning_changes(db, user_id: int, changes: List[Tuple[int, Dict]]):
+        """
+        Add (word_id, learning_delta) changes; the caller commits
+        The progress rows must already hold the changes: a user whose stats
+        rows are missing is rebuilt from them instead.
+        """
+        await StatsService._apply(db, LEARNING, user_id, changes)
+
+    @staticmethod
+    async def apply_writing_changes(db, user_id: int, changes: List[Tuple[int, Dict]]):
+        """
+        Add (word_id, writing_delta) changes; the caller commits
+        The progress rows must already hold the changes: a user whose stats
+        rows are missing is rebuilt from them instead.
+        """
+        await StatsService._apply(db, WRITING, user_id, changes)
+
+    @staticmethod
+    def apply_learning_changes_sync(db: Session, user_id: int, changes: List[Tuple[int, Dict]]):
+        """apply_learning_changes for routers on a sync Session"""
+        model, counters, aggregates = LEARNING
+        levels = _touched_levels(changes)
+        if levels is not None:
+            missing = levels - set(db.execute(_existing_levels(model, user_id, levels)).scalars().all())
+            if not missing:
+                statement = increment_statement(db, model, counters, user_id, changes)
+                if statement is not None:
+                    db.execute(statement)
+                return
+        db.flush()
+        for statement in _replace_statements(db, model, user_id, db.execute(aggregates(user_id)).all()):
+            db.execute(statement)
+
+    @staticmethod
+    async def _apply(db, kind, user_id: int, changes: List[Tuple[int, Dict]]):
+        """
+        Increment the stats rows, or rebuild the user's rows when a level
+        touched by the changes has none yet (the user's stats were never
+        built, or were cleared) or a word's level is unknown: a delta added
+        to a missing row would only count that one change.
+        """
+        model, counters, aggregates = kind
+        levels = _touched_levels(changes)
+        if levels is not None:
+            result = await db.execute(_existing_levels(model, user_id, levels))
+            if not levels - set(result.scalars().all()):
+                statement = increment_statement(db, model, counters, user_id, changes)
+                if statement is not None:
+                    await db.execute(statement)
+                return
+        await db.flush()
+        await StatsService._rebuild(db, kind, user_id)
+
+    @staticmethod
+    async def get_learning_rows(db, user_id: int, hsk_level: Optional[int] = None) -> List[UserLearningStats]:
+        """Stats rows of a user, rebuilt from user_progress if the user has none yet"""
+        rows = await StatsService._load(db, UserLearningStats, user_id)
+        if not rows and await StatsService.rebuild_learning_stats(db, user_id):
+            await db.commit()
+            rows = await StatsService._load(db, UserLearningStats, user_id)
+        return [row for row in rows if not hsk_level or row.hsk_level == hsk_level]
+
+    @staticmethod
+    async def get_writing_rows(db, user_id: int, hsk_level: Optional[int] = None) -> List[UserWritingStats]:
+        """Stats rows of a user, rebuilt from writing_progress if the user has none yet"""
+        rows = await StatsService._load(db, UserWritingStats, user_id)
+        if not rows and await StatsService.rebuild_writing_stats(db, user_id):
+            await db.commit()
+            rows = await StatsService._load(db, UserWritingStats, user_id)
+        return [row for row in rows if not hsk_level or row.hsk_level == hsk_level]
+
+    @staticmethod
+    async def _load(db, model, user_id: int) -> List:
+        return list((await db.execute(select(model).where(model.user_id == user_id))).scalars().all())
+
+    @staticmethod
+    async def rebuild_learning_stats(db, user_id: int) -> int:
+        """
+        Recompute a user's learning stats rows with SQL aggregates
+        Returns the number of levels written; the caller commits
+        """
+        return await StatsService._rebuild(db, LEARNING, user_id)
+
+    @staticmethod
+    async def rebuild_writing_stats(db, user_id: int) -> int:
+        """
+        Recompute a user's writing stats rows with SQL aggregates
+        Returns the number of levels written; the caller commits
+        """
+        return await StatsService._rebuild(db, WRITING, user_id)
+
+    @staticmethod
+    async def _rebuild(db, kind, user_id: int) -> int:
+        model, _, aggregates = kind
+        rows = (await db.execute(aggregates(user_id))).all()
+        for statement in _replace_statements(db, model, user_id, rows):
+            await db.execute(statement)
+        return len(rows)
@@ -0,0 +1,215 @@
+"""
+Story Pool
+Pre-generated stories for popular (hsk_level, topic, length) combinations
+
+/stories/generate first tries to claim a ready story from the story_pool
+table and only calls Gemini when the pool is empty for the request (pool
+hits still count against the user's story_generation rate limit). A
+background worker keeps every configured combination topped up to
+STORY_POOL_DEPTH, generating at most STORY_POOL_REFILL_PER_MINUTE stories
+and always refilling the emptiest combination first.
+
+The pool lives in the database, so all worker processes share it; claiming
+a story is a single DELETE ... RETURNING and never hands one story out
+twice. Run the refill worker in one process only (STORY_POOL_WORKER).
+
+The generator is injectable: StoryPool(generate=fake) runs the worker
+against a fake Gemini client.
+"""
+import asyncio
+import logging
+import re
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, select
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import PooledStory
+from app.services.gemini_service import generate_story
+
+logger = logging.getLogger(__name__)
+
+Combination = Tuple[int, str, str]  # (hsk_level, normalized topic, length)
+
+LENGTHS = ("short", "medium", "long")
+_CJK = re.compile(r'[\u4e00-\u9fff]')
+
+
+def normalize_topic(topic: Optional[str]) -> str:
+    return " ".join((topic or "").lower().split())
+
+
+def parse_combinations(value: str) -> List[Combination]:
+    """"1::short,2:food:medium" -> [(1, "", "short"), (2, "food", "medium")]"""
+    combinations = []
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        try:
+            level, topic, length = item.split(":")
+            combination = (int(level), normalize_topic(topic), length.strip())
+        except ValueError:
+            logger.warning("Ignoring malformed story pool combination %r", item)
+            continue
+        if combination[2] not in LENGTHS:
+            logger.warning("Ignoring story pool combination with unknown length %r", item)
+            continue
+        combinations.append(combination)
+    return combinations
+
+
+def is_valid_story(story_data) -> bool:
+    """Whether a generated story is complete enough to hand out unseen"""
+    if not isinstance(story_data, dict):
+        return False
+    title = story_data.get("title")
+    content = story_data.get("content")
+    if not isinstance(title, str) or not title.strip():
+        return False
+    if not isinstance(content, str) or not _CJK.search(content):
+        return False
+    return isinstance(story_data.get("key_vocabulary", []), list)
+
+
+class StoryPool:
+    """Claims pooled stories and refills the pool in the background"""
+
+    def __init__(self, generate: Callable[..., Awaitable[Dict]] = generate_story):
+        self.generate = generate
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        self.rejected = 0
+        self.failures = 0
+
+    @staticmethod
+    def combinations() -> List[Combination]:
+        if settings.STORY_POOL_DEPTH <= 0:
+            return []
+        return parse_combinations(settings.STORY_POOL_COMBINATIONS)
+
+    async def take(
+        self,
+        hsk_level: int,
+        topic: Optional[str] = None,
+        length: str = "short",
+        character_names: Optional[List[str]] = None
+    ) -> Optional[Dict]:
+        """
+        Claim the oldest pooled story for a request, or None to generate live
+        Requests naming characters are always generated live.
+        """
+        combination = (hsk_level, normalize_topic(topic), length)
+        if character_names or combination not in self.combinations():
+            return None
+
+        oldest = select(PooledStory.id).where(
+            PooledStory.hsk_level == combination[0],
+            PooledStory.topic == combination[1],
+            PooledStory.length == combination[2]
+        ).order_by(PooledStory.id).limit(1).with_for_update(skip_locked=True).scalar_subquery()
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                delete(PooledStory).where(PooledStory.id == oldest).returning(PooledStory.story_data)
+            )
+            story_data = result.scalar_one_or_none()
+            await db.commit()
+
+        if story_data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if self._wake is not None:
+            self._wake.set()
+        return story_data
+
+    async def depths(self) -> Dict[Combination, int]:
+        """Ready stories per configured combination"""
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(
+                select(PooledStory.hsk_level, PooledStory.topic, PooledStory.length, func.count())
+                .group_by(PooledStory.hsk_level, PooledStory.topic, PooledStory.length)
+            )).all()
+        counts = {(level, topic, length): count for level, topic, length, count in rows}
+        return {combination: counts.get(combination, 0) for combination in self.combinations()}
+
+    async def refill_one(self) -> bool:
+        """
+        Generate one story for the emptiest combination below STORY_POOL_DEPTH
+        Returns False when every combination is full.
+        """
+        depths = await self.depths()
+        missing = [
+            (depth, combination) for combination, depth in depths.items()
+            if depth < settings.STORY_POOL_DEPTH
+        ]
+        if not missing:
+            return False
+        _, (hsk_level, topic, length) = min(missing)
+
+        try:
+            story_data = await self.generate(hsk_level=hsk_level, topic=topic or None, length=length)
+        except Exception:
+            self.failures += 1
+            logger.exception("Story pool generation failed for %s", (hsk_level, topic, length))
+            return True
+        if not is_valid_story(story_data):
+            self.rejected += 1
+            logger.warning("Story pool discarded an incomplete story for %s", (hsk_level, topic, length))
+            return True
+
+        async with AsyncSessionLocal() as db:
+            db.add(PooledStory(hsk_level=hsk_level, topic=topic, length=length, story_data=story_data))
+            await db.commit()
+        self.generated += 1
+        return True
+
+    async def run(self):
+        """Refill loop: one generation per refill interval while anything is missing"""
+        interval = 60 / settings.STORY_POOL_REFILL_PER_MINUTE
+        while True:
+            try:
+                working = await self.refill_one()
+            except Exception:
+                logger.exception("Story pool refill failed")
+                working = True
+            self._wake.clear()
+            if working:
+                await asyncio.sleep(interval)
+            else:
+                # Full: sleep until a story is claimed (or a periodic recheck,
+                # which notices claims made by other processes)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), interval * 10)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self):
+        if self._task is None and self.combinations() and settings.STORY_POOL_REFILL_PER_MINUTE > 0:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wake = None
+
+    def stats(self) -> dict:
+        return {
+            "worker_running": self._task is not None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "generated": self.generated,
+            "rejected": self.rejected,
+            "failures": self.failures,
+        }
+
+
+story_pool = StoryPool()
@@ -0,0 +1,78 @@
+"""
+Story Service
+Persists AI-generated stories together with everything the model returned
+"""
+from typing import Dict, List, Optional
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import HanziWord, Story, story_words
+
+
+def vocabulary_words(story_data: Dict) -> List[str]:
+    """Distinct simplified forms listed in a story's key_vocabulary, in order"""
+    words = []
+    for entry in story_data.get('key_vocabulary') or []:
+        simplified = entry.get('simplified') if isinstance(entry, dict) else None
+        if isinstance(simplified, str) and simplified.strip() and simplified.strip() not in words:
+            words.append(simplified.strip())
+    return words
+
+
+def word_position(content: str, simplified: str) -> Optional[int]:
+    """Character offset of the word's first occurrence in the story, if it occurs"""
+    position = content.find(simplified)
+    return position if position >= 0 else None
+
+
+class StoryService:
+    """Service for saving generated stories"""
+
+    @staticmethod
+    async def save_generated_story(
+        db: AsyncSession,
+        story_data: Dict,
+        hsk_level: int,
+        author_id: int
+    ) -> Story:
+        """
+        Save a generated story with its translation, pinyin and story_words
+        links in one transaction
+
+        key_vocabulary entries are matched to HanziWord by simplified form in
+        one query (the lowest HSK level wins when a form is listed twice);
+        entries not in the vocabulary are skipped. Each link records where
+        the word first occurs in the story.
+        """
+        simplified_forms = vocabulary_words(story_data)
+        word_ids: Dict[str, int] = {}
+        if simplified_forms:
+            result = await db.execute(
+                select(HanziWord.simplified, HanziWord.id)
+                .where(HanziWord.simplified.in_(simplified_forms))
+                .order_by(HanziWord.hsk_level.desc(), HanziWord.id.desc())
+            )
+            word_ids = dict(result.all())  # later rows (lower levels) win
+
+        content = story_data.get('content', '')
+        story = Story(
+            title=story_data.get('title', 'Generated Story'),
+            title_pinyin=story_data.get('title_pinyin'),
+            content=content,
+            content_pinyin=story_data.get('content_pinyin'),
+            english_translation=story_data.get('content_english'),
+            hsk_level=hsk_level,
+            author_id=author_id,
+            is_published=True  # Auto-publish AI generated stories
+        )
+        db.add(story)
+        await db.flush()  # assigns story.id
+
+        links = [
+            {'story_id': story.id, 'word_id': word_ids[simplified], 'position': word_position(content, simplified)}
+            for simplified in simplified_forms if simplified in word_ids
+        ]
+        if links:
+            await db.execute(insert(story_words), links)
+
+        await db.commit()
+        return story
@@ -0,0 +1,76 @@
+"""
+Story streaming helpers
+Incremental extraction of story text from a JSON response that is still arriving
+
+The model answers story prompts with one JSON object. While it streams, the
+"title" and "content" string values can already be shown to the reader; the
+complete object (pinyin, translation, vocabulary, ...) is only parsed once
+the response has finished.
+"""
+import json
+import re
+
+# Single-character JSON escapes
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class JsonStringField:
+    """Decodes one top-level string field of a JSON text as the text grows"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._pattern = re.compile(r'"%s"\s*:\s*"' % re.escape(name))
+        self._position = None  # index of the next undecoded character of the value
+        self.done = False
+
+    def read(self, text: str) -> str:
+        """
+        Newly available part of the field's value in `text`, the whole
+        response received so far. Escape sequences split across chunks are
+        left for the next call.
+        """
+        if self.done:
+            return ""
+        if self._position is None:
+            match = self._pattern.search(text)
+            if not match:
+                return ""
+            self._position = match.end()
+
+        decoded = []
+        i = self._position
+        while i < len(text):
+            ch = text[i]
+            if ch == '"':
+                self.done = True
+                i += 1
+                break
+            if ch != '\\':
+                decoded.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(text):
+                break
+            escape = text[i + 1]
+            if escape == 'u':
+                if i + 6 > len(text):
+                    break
+                code = int(text[i + 2:i + 6], 16)
+                if 0xD800 <= code < 0xDC00:  # high surrogate: combine with the \uXXXX after it
+                    if i + 12 > len(text):
+                        break
+                    low = int(text[i + 8:i + 12], 16)
+                    code = 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                    i += 6
+                decoded.append(chr(code))
+                i += 6
+            else:
+                decoded.append(_ESCAPES.get(escape, escape))
+                i += 2
+        self._position = i
+        return "".join(decoded)
+
+
+def sse_event(event: str, data) -> str:
+    """One server-sent event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -0,0 +1,206 @@
+"""
+Vocabulary Bundles
+Prebuilt, precompressed JSON word lists per HSK level and level x category
+
+A bundle holds exactly the body /vocabulary/hsk/{level} would return,
+already encoded and compressed with gzip and (when the optional `brotli`
+package is installed) brotli. Bundles are keyed by the catalog revision,
+so a bundle URL never changes content and can be cached indefinitely.
+
+Bundles are built in memory by a background thread, at startup and on the
+first request after a vocabulary change. A request that arrives before its
+bundle is ready builds it without brotli (quality 11 is too slow for the
+request path); the background build adds brotli. write_bundles() builds the
+whole set into a directory ahead of time (see build_vocabulary_bundles.py,
+also called by the seed scripts); with VOCABULARY_BUNDLE_DIR pointing there,
+the API sends those files instead of building them.
+"""
+import gzip
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+from pydantic import TypeAdapter
+from app import schemas
+from app.config import settings
+from app.services.vocabulary_catalog import CatalogSnapshot, vocabulary_catalog
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+_word_list = TypeAdapter(List[schemas.HanziWord])
+
+# File suffix per Content-Encoding, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+@dataclass(frozen=True)
+class Bundle:
+    """One encoded word list in every available encoding"""
+    name: str
+    revision: str
+    body: bytes
+    gzip: bytes
+    br: Optional[bytes] = None
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        return {"br": self.br, "gzip": self.gzip}.get(encoding) or self.body
+
+
+def bundle_name(hsk_level: int, category: Optional[str] = None) -> str:
+    """File name stem: "hsk1", or "hsk1.noun" for a category"""
+    if category:
+        return f"hsk{hsk_level}.{quote(category, safe='')}"
+    return f"hsk{hsk_level}"
+
+
+def build_bundle(
+    snapshot: CatalogSnapshot,
+    hsk_level: int,
+    category: Optional[str] = None,
+    with_brotli: bool = True
+) -> Bundle:
+    words = _word_list.validate_python(snapshot.words_for_level(hsk_level, category), from_attributes=True)
+    body = _word_list.dump_json(words)
+    return Bundle(
+        name=bundle_name(hsk_level, category),
+        revision=snapshot.revision,
+        body=body,
+        gzip=gzip.compress(body, compresslevel=9, mtime=0),
+        br=brotli.compress(body, quality=11) if brotli is not None and with_brotli else None,
+    )
+
+
+def bundle_keys(snapshot: CatalogSnapshot) -> List[Tuple[int, Optional[str]]]:
+    """Every (hsk_level, category) with words; category None is the whole level"""
+    keys = [(level, None) for level in sorted(snapshot.by_level)]
+    keys.extend(sorted(snapshot.by_level_category))
+    return keys
+
+
+def _write_atomic(path: str, data: bytes):
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def write_bundles(directory: str, snapshot: Optional[CatalogSnapshot] = None) -> int:
+    """
+    Build every bundle of the current vocabulary into directory/<revision>/
+    Returns the number of bundles written. Earlier revisions are left in
+    place for clients still holding their URLs.
+    """
+    snapshot = snapshot or vocabulary_catalog.load()
+    target = os.path.join(directory, snapshot.revision)
+    os.makedirs(target, exist_ok=True)
+
+    names = []
+    for hsk_level, category in bundle_keys(snapshot):
+        bundle = build_bundle(snapshot, hsk_level, category)
+        path = os.path.join(target, f"{bundle.name}.json")
+        _write_atomic(path, bundle.body)
+        _write_atomic(path + ".gz", bundle.gzip)
+        if bundle.br is not None:
+            _write_atomic(path + ".br", bundle.br)
+        names.append(bundle.name)
+
+    _write_atomic(
+        os.path.join(directory, "manifest.json"),
+        json.dumps({"revision": snapshot.revision, "bundles": names}).encode()
+    )
+    return len(names)
+
+
+class BundleStore:
+    """Bundles of the current catalog revision, built in the background"""
+
+    def __init__(self):
+        self._revision: Optional[str] = None
+        self._bundles: Dict[Tuple[int, Optional[str]], Bundle] = {}
+        self._lock = threading.Lock()
+        self._warming = False
+        self.builds = 0
+
+    def revision(self) -> str:
+        return vocabulary_catalog.revision()
+
+    def _current(self, snapshot: CatalogSnapshot):
+        """Drop the bundles of an earlier revision; call with the lock held"""
+        if self._revision != snapshot.revision:
+            self._revision = snapshot.revision
+            self._bundles = {}
+
+    def get(self, hsk_level: int, category: Optional[str] = None) -> Bundle:
+        snapshot = vocabulary_catalog.snapshot()
+        key = (hsk_level, category or None)
+        with self._lock:
+            self._current(snapshot)
+            bundle = self._bundles.get(key)
+        if bundle is not None:
+            return bundle
+
+        bundle = build_bundle(snapshot, hsk_level, category, with_brotli=False)
+        with self._lock:
+            if self._revision == snapshot.revision:
+                bundle = self._bundles.setdefault(key, bundle)
+            self.builds += 1
+        self.warm_in_background()
+        return bundle
+
+    def warm(self):
+        """Build every bundle of the current revision, with brotli when available"""
+        snapshot = vocabulary_catalog.snapshot()
+        for key in bundle_keys(snapshot):
+            with self._lock:
+                self._current(snapshot)
+                existing = self._bundles.get(key)
+            if existing is not None and (existing.br is not None or brotli is None):
+                continue
+            bundle = build_bundle(snapshot, *key)
+            with self._lock:
+                if self._revision != snapshot.revision:
+                    return  # superseded; the newer revision starts its own build
+                self._bundles[key] = bundle
+                self.builds += 1
+
+    def warm_in_background(self):
+        with self._lock:
+            if self._warming:
+                return
+            self._warming = True
+        threading.Thread(target=self._background_warm, name="vocabulary-bundles", daemon=True).start()
+
+    def _background_warm(self):
+        try:
+            self.warm()
+        except Exception:
+            logger.exception("Building the vocabulary bundles failed")
+        finally:
+            self._warming = False
+
+    def file_path(self, revision: str, hsk_level: int, category: Optional[str] = None) -> Optional[str]:
+        """Prebuilt file for a bundle under VOCABULARY_BUNDLE_DIR, if there is one"""
+        if not settings.VOCABULARY_BUNDLE_DIR or not revision.isalnum():
+            return None
+        path = os.path.join(settings.VOCABULARY_BUNDLE_DIR, revision, f"{bundle_name(hsk_level, category)}.json")
+        return path if os.path.isfile(path) else None
+
+    def stats(self) -> dict:
+        return {
+            "revision": self._revision,
+            "bundles": len(self._bundles),
+            "bytes": sum(len(b.body) + len(b.gzip) + len(b.br or b"") for b in self._bundles.values()),
+            "builds": self.builds,
+            "brotli": brotli is not None,
+        }
+
+
+vocabulary_bundles = BundleStore()
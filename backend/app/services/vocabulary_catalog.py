@@ -0,0 +1,252 @@
+"""
+Vocabulary Catalog
+Process-wide, versioned in-memory snapshot of the HanziWord table
+
+Vocabulary only changes when the seed scripts run or a word is created through
+the API, so the hot read paths (HSK word lists, word lookups, quiz generation,
+learn mode) are served from this snapshot instead of querying Postgres.
+"""
+import asyncio
+import hashlib
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
+from app.models import HanziWord
+from app.pinyin import numbered_key, toneless_key
+from app.services.distractor_index import DistractorIndex
+from app.services.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CatalogWord:
+    """Immutable, session-independent copy of a HanziWord row"""
+    id: int
+    simplified: str
+    traditional: str
+    pinyin: str
+    english: str
+    hsk_level: int
+    category: Optional[str] = None
+    radical: Optional[str] = None
+    strokes: Optional[int] = None
+    image_url: Optional[str] = None
+    pinyin_toneless: str = ""
+    pinyin_numbered: str = ""
+
+    @classmethod
+    def from_model(cls, word: HanziWord) -> "CatalogWord":
+        return cls(
+            id=word.id,
+            simplified=word.simplified,
+            traditional=word.traditional,
+            pinyin=word.pinyin,
+            english=word.english,
+            hsk_level=word.hsk_level,
+            category=word.category,
+            radical=word.radical,
+            strokes=word.strokes,
+            image_url=word.image_url,
+            # Rows written before the normalized columns existed may lack them
+            pinyin_toneless=word.pinyin_toneless or toneless_key(word.pinyin),
+            pinyin_numbered=word.pinyin_numbered or numbered_key(word.pinyin)
+        )
+
+
+class CatalogSnapshot:
+    """One immutable generation of the catalog with its lookup indexes"""
+
+    def __init__(self, version: int, words: List[CatalogWord]):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.words = sorted(words, key=lambda w: w.id)
+
+        self.by_id: Dict[int, CatalogWord] = {}
+        self.by_level: Dict[int, List[CatalogWord]] = {}
+        self.by_level_category: Dict[Tuple[int, str], List[CatalogWord]] = {}
+
+        for word in self.words:
+            self.by_id[word.id] = word
+            self.by_level.setdefault(word.hsk_level, []).append(word)
+            if word.category:
+                self.by_level_category.setdefault((word.hsk_level, word.category), []).append(word)
+
+        self._distractor_indexes: Dict[Tuple[int, Optional[str]], DistractorIndex] = {}
+        self._search_index: Optional[SearchIndex] = None
+        self._revision: Optional[str] = None
+
+    @property
+    def revision(self) -> str:
+        """
+        Digest of the snapshot's contents; unlike `version` it is the same in
+        every worker and across reloads that changed nothing
+        """
+        if self._revision is None:
+            digest = hashlib.blake2b(digest_size=8)
+            for word in self.words:
+                digest.update(repr(word).encode())
+            self._revision = digest.hexdigest()
+        return self._revision
+
+    def words_for_level(self, hsk_level: int, category: Optional[str] = None) -> List[CatalogWord]:
+        if category:
+            return self.by_level_category.get((hsk_level, category), [])
+        return self.by_level.get(hsk_level, [])
+
+    def distractor_index(self, hsk_level: int, category: Optional[str] = None) -> DistractorIndex:
+        """Built on first use and kept for the lifetime of this snapshot"""
+        key = (hsk_level, category or None)
+        index = self._distractor_indexes.get(key)
+        if index is None:
+            index = DistractorIndex(self.words_for_level(hsk_level, category))
+            self._distractor_indexes[key] = index
+        return index
+
+    def search_index(self) -> SearchIndex:
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.words)
+        return self._search_index
+
+
+class VocabularyCatalog:
+    """
+    Lazily loaded vocabulary cache shared by every request in the process
+
+    Readers always get a complete snapshot; a reload builds a new snapshot and
+    swaps it in, so no locking is needed on the read path. Writes made through
+    this process call `invalidate()`. Writes made elsewhere (seed scripts, other
+    workers) are picked up once VOCABULARY_CACHE_TTL_SECONDS has elapsed.
+
+    A stale snapshot is reloaded in place from sync code (threadpool handlers,
+    scripts). On the event loop the load would block every request, so async
+    handlers keep the current snapshot while a background thread reloads it.
+    """
+
+    def __init__(self, ttl_seconds: int = 0):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._version = 0
+        # invalidate() bumps _generation; a load records the generation it
+        # started from, so an invalidation during the load leaves it stale
+        self._generations = itertools.count(1)
+        self._generation = 0
+        self._loaded_generation: Optional[int] = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.background_reloads = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def load(self, db: Optional[Session] = None) -> CatalogSnapshot:
+        """Read every HanziWord and swap in a freshly indexed snapshot"""
+        with self._lock:
+            generation = self._generation
+            own_session = db is None
+            if own_session:
+                db = SessionLocal()
+            try:
+                words = [CatalogWord.from_model(w) for w in db.query(HanziWord).all()]
+            finally:
+                if own_session:
+                    db.close()
+
+            self._version += 1
+            self._snapshot = CatalogSnapshot(self._version, words)
+            self._loaded_generation = generation
+            return self._snapshot
+
+    def invalidate(self):
+        """Mark the snapshot stale; the next read reloads it"""
+        self._generation = next(self._generations)
+
+    def snapshot(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.load()
+        if self._is_stale(snapshot):
+            if _on_event_loop():
+                self._reload_in_background()
+            else:
+                snapshot = self._reload_if_stale()
+        return snapshot
+
+    def _reload_if_stale(self) -> CatalogSnapshot:
+        """load(), unless another thread reloaded while this one waited for the lock"""
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and not self._is_stale(snapshot):
+                return snapshot
+        return self.load()
+
+    def _reload_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_reload, name="vocabulary-catalog-reload", daemon=True).start()
+
+    def _background_reload(self):
+        try:
+            self._reload_if_stale()
+            self.background_reloads += 1
+        except Exception:
+            logger.exception("Vocabulary catalog reload failed; serving the previous snapshot")
+        finally:
+            self._refreshing = False
+
+    def _is_stale(self, snapshot: CatalogSnapshot) -> bool:
+        return self._loaded_generation != self._generation or self._expired(snapshot)
+
+    def _expired(self, snapshot: CatalogSnapshot) -> bool:
+        if not self.ttl_seconds:
+            return False
+        return time.monotonic() - snapshot.loaded_at > self.ttl_seconds
+
+    def revision(self) -> str:
+        """Content revision of the current snapshot (drives the vocabulary ETags)"""
+        return self.snapshot().revision
+
+    def get(self, word_id: int) -> Optional[CatalogWord]:
+        return self.snapshot().by_id.get(word_id)
+
+    def get_many(self, word_ids: List[int]) -> List[CatalogWord]:
+        """Look up several words, preserving order and skipping unknown ids"""
+        by_id = self.snapshot().by_id
+        return [by_id[word_id] for word_id in word_ids if word_id in by_id]
+
+    def words_for_level(self, hsk_level: int, category: Optional[str] = None) -> List[CatalogWord]:
+        """Words of an HSK level ordered by id, optionally narrowed to one category"""
+        return self.snapshot().words_for_level(hsk_level, category)
+
+    def distractors(self, hsk_level: int, category: Optional[str] = None) -> DistractorIndex:
+        """Distractor index over the same word list as words_for_level()"""
+        return self.snapshot().distractor_index(hsk_level, category)
+
+    def search_index(self) -> SearchIndex:
+        """In-memory search index over every word in the catalog"""
+        return self.snapshot().search_index()
+
+    def categories(self, hsk_level: Optional[int] = None) -> List[str]:
+        """Distinct categories, optionally limited to one HSK level"""
+        keys = self.snapshot().by_level_category.keys()
+        return sorted({category for level, category in keys if hsk_level is None or level == hsk_level})
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+vocabulary_catalog = VocabularyCatalog(ttl_seconds=settings.VOCABULARY_CACHE_TTL_SECONDS)
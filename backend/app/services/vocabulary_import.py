@@ -0,0 +1,211 @@
+"""
+Vocabulary Import
+Streams HanziWord rows from CSV or JSONL files into the database
+
+Each row holds the HanziWord columns: simplified, pinyin, english and
+hsk_level are required; traditional (new words default to simplified),
+category, radical, strokes and image_url are optional. hsk_level may be
+given once for a whole file instead of per row.
+
+Words are keyed on (simplified, hsk_level). Files are read in batches;
+each batch is compared with the stored words in one query, and only new
+or changed words are written, with one INSERT ... ON CONFLICT DO UPDATE
+per batch. Optional columns missing from a row keep their stored value.
+Importing the same files again reports every row as skipped.
+"""
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import func, select
+from app.database import upsert_insert
+from app.models import HanziWord
+from app.pinyin import numbered_key, toneless_key
+from app.services.vocabulary_catalog import vocabulary_catalog
+
+REQUIRED = ("simplified", "pinyin", "english")
+OPTIONAL = ("category", "radical", "strokes", "image_url")
+COMPARED = ("traditional", "pinyin", "english") + OPTIONAL
+
+# Invalid rows reported by line; the rest are only counted
+MAX_ERRORS = 20
+
+WordKey = Tuple[str, int]  # (simplified, hsk_level)
+
+
+@dataclass
+class ImportReport:
+    """Row counts of one import run"""
+    added: int = 0
+    updated: int = 0
+    skipped: int = 0  # unchanged, or repeated in the input
+    invalid: int = 0
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def error(self, message: str):
+        self.invalid += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(message)
+
+    def summary(self) -> str:
+        return (
+            f"{self.added} added, {self.updated} updated, {self.skipped} skipped, "
+            f"{self.invalid} invalid in {self.seconds:.2f}s"
+        )
+
+
+def read_rows(path: str) -> Iterator[Tuple[int, Dict]]:
+    """(line number, raw row) for every row of a .csv or .jsonl file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+    elif extension in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError:
+                    yield line_number, None
+    else:
+        raise ValueError(f"Unsupported vocabulary file {path!r}: expected .csv or .jsonl")
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def normalize_row(raw: Dict, hsk_level: Optional[int] = None) -> Dict:
+    """
+    Column values for one hanzi_words row
+    Raises ValueError for an incomplete or malformed row.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("not a JSON object")
+    row = {name: _text(raw.get(name)) for name in REQUIRED + ("traditional",) + OPTIONAL}
+    missing = [name for name in REQUIRED if row[name] is None]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    level = _text(raw.get("hsk_level")) or hsk_level
+    try:
+        row["hsk_level"] = int(level)
+        row["strokes"] = int(row["strokes"]) if row["strokes"] is not None else None
+    except (TypeError, ValueError):
+        raise ValueError("hsk_level and strokes must be integers")
+    if not 1 <= row["hsk_level"] <= 6:
+        raise ValueError(f"hsk_level {row['hsk_level']} is not 1-6")
+
+    return row
+
+
+def _is_changed(row: Dict, stored) -> bool:
+    return any(
+        row[name] is not None and row[name] != getattr(stored, name)
+        for name in COMPARED
+    )
+
+
+def _upsert_batch(db, rows: List[Dict], report: ImportReport):
+    """Write the new and changed rows of one batch"""
+    stored = {
+        (word.simplified, word.hsk_level): word
+        for word in db.execute(
+            select(HanziWord.simplified, HanziWord.hsk_level, *[getattr(HanziWord, name) for name in COMPARED])
+            .where(HanziWord.simplified.in_({row["simplified"] for row in rows}))
+        ).all()
+    }
+
+    changed = []
+    for row in rows:
+        existing = stored.get((row["simplified"], row["hsk_level"]))
+        if existing is None:
+            report.added += 1
+        elif _is_changed(row, existing):
+            report.updated += 1
+        else:
+            report.skipped += 1
+            continue
+        row["traditional"] = row["traditional"] or (existing.traditional if existing else row["simplified"])
+        # Bulk inserts bypass the ORM events that keep the pinyin keys in sync
+        row["pinyin_toneless"] = toneless_key(row["pinyin"])
+        row["pinyin_numbered"] = numbered_key(row["pinyin"])
+        changed.append(row)
+
+    if not changed:
+        return
+    # One statement with a parameter list: compiled once and sent as
+    # multi-row INSERTs by the driver
+    insert = upsert_insert(db)(HanziWord.__table__)
+    excluded = insert.excluded
+    update = {
+        name: excluded[name]
+        for name in ("traditional", "pinyin", "english", "pinyin_toneless", "pinyin_numbered")
+    }
+    update.update({name: func.coalesce(excluded[name], HanziWord.__table__.c[name]) for name in OPTIONAL})
+    db.execute(insert.on_conflict_do_update(index_elements=["simplified", "hsk_level"], set_=update), changed)
+
+
+def _batches(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def import_vocabulary(
+    db,
+    paths: Iterable[str],
+    hsk_level: Optional[int] = None,
+    batch_size: int = 1000,
+    dry_run: bool = False
+) -> ImportReport:
+    """
+    Upsert the words of every file in one transaction and report the counts
+    The first row for a (simplified, hsk_level) wins; later repeats, also
+    across files, are skipped. With dry_run the changes are rolled back.
+    """
+    report = ImportReport()
+    started = time.perf_counter()
+    seen = set()
+
+    def rows():
+        for path in paths:
+            for line_number, raw in read_rows(path):
+                try:
+                    row = normalize_row(raw, hsk_level)
+                except ValueError as e:
+                    report.error(f"{path}:{line_number}: {e}")
+                    continue
+                key: WordKey = (row["simplified"], row["hsk_level"])
+                if key in seen:
+                    report.skipped += 1
+                    continue
+                seen.add(key)
+                yield row
+
+    try:
+        for batch in _batches(rows(), batch_size):
+            _upsert_batch(db, batch, report)
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    if not dry_run and (report.added or report.updated):
+        vocabulary_catalog.invalidate()
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,25 @@
+"""
+Word Sampler
+Random selection of HanziWord entries from the in-memory vocabulary catalog
+"""
+import random
+from typing import List, Optional, Tuple
+from app.services.vocabulary_catalog import CatalogWord, vocabulary_catalog
+
+
+def sample_words(
+    hsk_level: int,
+    size: int,
+    category: Optional[str] = None
+) -> Tuple[List[CatalogWord], int]:
+    """
+    Pick `size` random words of an HSK level without touching the database
+
+    The catalog already holds each level's word list, so a draw costs
+    O(size) whether the level has 150 or 2,500 words.
+
+    Returns:
+        (sampled words, total number of words matching the filter)
+    """
+    words = vocabulary_catalog.words_for_level(hsk_level, category=category)
+    return random.sample(words, min(size, len(words))), len(words)
@@ -4,17 +4,32 @@ Handles business logic for character writing practice and progress tracking
 """
 from datetime import datetime
 from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import upsert_insert
 from app.models import WritingProgress, HanziWord, User
+from app.services.stats_service import WRITING_COUNTERS, StatsService, sum_rows, writing_delta
+
+
+# WritingProgress fields the materialized writing stats depend on
+STATS_FIELDS = ("total_attempts", "accuracy_score", "mastery_level")
+
+# Column values of a word's first writing progress row
+NEW_PROGRESS = {
+    "total_attempts": 0,
+    "successful_attempts": 0,
+    "accuracy_score": 0.0,
+    "average_time": 0.0,
+    "mastery_level": 0,
+}
 
 
 class WritingService:
     """Service for managing writing practice progress"""
 
     @staticmethod
-    def get_characters_for_practice(
-        db: Session,
+    async def get_characters_for_practice(
+        db: AsyncSession,
         user: User,
         hsk_level: int,
         limit: int = 20
@@ -24,34 +39,39 @@ class WritingService:
         Prioritizes characters user hasn't practiced yet
         """
         # Get characters user has already practiced
-        practiced_word_ids = db.query(WritingProgress.word_id).filter(
+        practiced_word_ids = select(WritingProgress.word_id).where(
             WritingProgress.user_id == user.id
-        ).subquery()
+        )
 
         # Get new characters (not yet practiced)
-        new_characters = db.query(HanziWord).filter(
-            HanziWord.hsk_level == hsk_level,
-            ~HanziWord.id.in_(practiced_word_ids)
-        ).limit(limit // 2).all()
+        result = await db.execute(
+            select(HanziWord).where(
+                HanziWord.hsk_level == hsk_level,
+                ~HanziWord.id.in_(practiced_word_ids)
+            ).limit(limit // 2)
+        )
+        new_characters = list(result.scalars().all())
 
         # If not enough new characters, add some practiced ones with low mastery
         if len(new_characters) < limit:
             remaining = limit - len(new_characters)
-            practiced_characters = db.query(HanziWord).join(
-                WritingProgress, WritingProgress.word_id == HanziWord.id
-            ).filter(
-                WritingProgress.user_id == user.id,
-                HanziWord.hsk_level == hsk_level,
-                WritingProgress.mastery_level < 8  # Not yet mastered
-            ).order_by(WritingProgress.mastery_level.asc()).limit(remaining).all()
+            result = await db.execute(
+                select(HanziWord).join(
+                    WritingProgress, WritingProgress.word_id == HanziWord.id
+                ).where(
+                    WritingProgress.user_id == user.id,
+                    HanziWord.hsk_level == hsk_level,
+                    WritingProgress.mastery_level < 8  # Not yet mastered
+                ).order_by(WritingProgress.mastery_level.asc()).limit(remaining)
+            )
 
-            new_characters.extend(practiced_characters)
+            new_characters.extend(result.scalars().all())
 
         return new_characters
 
     @staticmethod
-    def record_attempt(
-        db: Session,
+    async def record_attempt(
+        db: AsyncSession,
         user: User,
         word_id: int,
         accuracy_score: float,
@@ -61,25 +81,28 @@ class WritingService:
         """
         Record a writing practice attempt and update progress
         """
-        # Get or create progress record
-        progress = db.query(WritingProgress).filter(
+        # Get or create progress record, locked so concurrent attempts on the
+        # word apply their stats deltas one after the other
+        locked = select(WritingProgress).where(
             and_(
                 WritingProgress.user_id == user.id,
                 WritingProgress.word_id == word_id
             )
-        ).first()
+        ).with_for_update()
+        progress = (await db.execute(locked)).scalars().first()
 
         if not progress:
-            progress = WritingProgress(
-                user_id=user.id,
-                word_id=word_id,
-                total_attempts=0,
-                successful_attempts=0,
-                accuracy_score=0.0,
-                average_time=0.0,
-                mastery_level=0
+            # A concurrent first attempt may insert the row too; ON CONFLICT
+            # DO NOTHING leaves it to whichever insert wins
+            created = await db.execute(
+                upsert_insert(db)(WritingProgress).values(
+                    user_id=user.id, word_id=word_id, **NEW_PROGRESS
+                ).on_conflict_do_nothing(index_elements=[WritingProgress.user_id, WritingProgress.word_id])
             )
-            db.add(progress)
+            progress = (await db.execute(locked)).scalars().one()
+            before = None if created.rowcount else {field: getattr(progress, field) for field in STATS_FIELDS}
+        else:
+            before = {field: getattr(progress, field) for field in STATS_FIELDS}
 
         # Update attempt counts
         progress.total_attempts += 1
@@ -119,8 +142,10 @@ class WritingService:
         # Update last practiced timestamp
         progress.last_practiced = datetime.utcnow()
 
-        db.commit()
-        db.refresh(progress)
+        after = {field: getattr(progress, field) for field in STATS_FIELDS}
+        await StatsService.apply_writing_changes(db, user.id, [(word_id, writing_delta(before, after))])
+        await db.commit()
+        await db.refresh(progress)
 
         return progress
 
@@ -163,46 +188,39 @@ class WritingService:
         return int(base_level)
 
     @staticmethod
-    def get_user_progress(
-        db: Session,
+    async def get_user_progress(
+        db: AsyncSession,
         user: User,
         hsk_level: Optional[int] = None
     ) -> List[WritingProgress]:
         """
         Get all writing progress for a user, optionally filtered by HSK level
         """
-        query = db.query(WritingProgress).filter(
+        query = select(WritingProgress).where(
             WritingProgress.user_id == user.id
         )
 
         if hsk_level:
-            query = query.join(HanziWord).filter(
+            query = query.join(HanziWord).where(
                 HanziWord.hsk_level == hsk_level
             )
 
-        return query.all()
+        return (await db.execute(query)).scalars().all()
 
     @staticmethod
-    def get_statistics(
-        db: Session,
+    async def get_statistics(
+        db: AsyncSession,
         user: User,
         hsk_level: Optional[int] = None
     ) -> Dict:
         """
         Get writing practice statistics for a user
+        Read from the materialized user_writing_stats rows
         """
-        query = db.query(WritingProgress).filter(
-            WritingProgress.user_id == user.id
-        )
+        rows = await StatsService.get_writing_rows(db, user.id, hsk_level)
+        totals = sum_rows(rows, WRITING_COUNTERS)
 
-        if hsk_level:
-            query = query.join(HanziWord).filter(
-                HanziWord.hsk_level == hsk_level
-            )
-
-        all_progress = query.all()
-
-        if not all_progress:
+        if not totals["characters_practiced"]:
             return {
                 "total_characters_practiced": 0,
                 "total_attempts": 0,
@@ -212,35 +230,30 @@ class WritingService:
                 "new_characters": 0
             }
 
-        total_attempts = sum(p.total_attempts for p in all_progress)
-        avg_accuracy = sum(p.accuracy_score for p in all_progress) / len(all_progress)
-
-        # Count by mastery level
-        mastered = sum(1 for p in all_progress if p.mastery_level >= 8)
-        in_progress = sum(1 for p in all_progress if 3 <= p.mastery_level < 8)
-        new = sum(1 for p in all_progress if p.mastery_level < 3)
-
         return {
-            "total_characters_practiced": len(all_progress),
-            "total_attempts": total_attempts,
-            "average_accuracy": round(avg_accuracy, 2),
-            "mastered_characters": mastered,
-            "characters_in_progress": in_progress,
-            "new_characters": new
+            "total_characters_practiced": totals["characters_practiced"],
+            "total_attempts": totals["attempts_total"],
+            "average_accuracy": round(totals["accuracy_total"] / totals["characters_practiced"], 2),
+            "mastered_characters": totals["mastered_characters"],
+            "characters_in_progress": totals["characters_in_progress"],
+            "new_characters": totals["new_characters"]
         }
 
     @staticmethod
-    def get_progress_by_character(
-        db: Session,
+    async def get_progress_by_character(
+        db: AsyncSession,
         user: User,
         word_id: int
     ) -> Optional[WritingProgress]:
         """
         Get writing progress for a specific character
         """
-        return db.query(WritingProgress).filter(
-            and_(
-                WritingProgress.user_id == user.id,
-                WritingProgress.word_id == word_id
+        result = await db.execute(
+            select(WritingProgress).where(
+                and_(
+                    WritingProgress.user_id == user.id,
+                    WritingProgress.word_id == word_id
+                )
             )
-        ).first()
+        )
+        return result.scalars().first()
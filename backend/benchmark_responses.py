@@ -0,0 +1,94 @@
+"""
+Benchmark response size and CPU cost of the largest list endpoints
+Run against a seeded database: python benchmark_responses.py [requests]
+
+For each endpoint it prints:
+- bytes on the wire without compression, with gzip and (if installed) brotli
+- serialization CPU per response: the response_model path (validate every
+  row, dump it, json.dumps) against trusted_response
+- CPU per full request through the app, uncompressed and gzip
+
+Logs in as BENCHMARK_USERNAME / BENCHMARK_PASSWORD (default: the admin user
+created by seed_data.py).
+"""
+import json
+import os
+import sys
+import time
+from typing import List
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from app import models, schemas
+from app.compression import ENCODINGS
+from app.database import SessionLocal
+from app.main import app
+from app.responses import trusted_response
+from app.services.vocabulary_catalog import vocabulary_catalog
+
+
+def cpu_ms(fn, repeat: int) -> float:
+    """Average process CPU time of fn() in milliseconds"""
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat * 1000
+
+
+def response_model_body(rows, schema) -> bytes:
+    """What FastAPI did with a response_model and the stdlib JSONResponse"""
+    adapter = TypeAdapter(List[schema])
+    content = adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    username = os.getenv("BENCHMARK_USERNAME", "admin")
+    password = os.getenv("BENCHMARK_PASSWORD", "admin123")
+
+    db = SessionLocal()
+    user = db.query(models.User).filter(models.User.username == username).first()
+    if user is None:
+        print(f"User {username!r} not found; seed the database or set BENCHMARK_USERNAME")
+        return
+    progress = db.query(models.UserProgress).filter(models.UserProgress.user_id == user.id).all()
+    writing = db.query(models.WritingProgress).filter(models.WritingProgress.user_id == user.id).all()
+    db.close()
+
+    endpoints = [
+        (f"/vocabulary/hsk/{level}", vocabulary_catalog.words_for_level(level), schemas.HanziWord)
+        for level in range(1, 7) if vocabulary_catalog.words_for_level(level)
+    ]
+    endpoints.append(("/progress/", progress, schemas.UserProgress))
+    endpoints.append(("/writing/progress", writing, schemas.WritingProgress))
+
+    with TestClient(app) as client:
+        token = client.post("/auth/login", data={"username": username, "password": password})
+        if token.status_code != 200:
+            print(f"Login as {username!r} failed: {token.status_code}")
+            return
+        auth = {"Authorization": f"Bearer {token.json()['access_token']}"}
+
+        print(f"\n{'='*100}")
+        print(f"Response benchmark ({repeat} requests each)")
+        print(f"{'='*100}")
+        print(f"{'endpoint':22s} {'rows':>5s} {'identity':>9s} {'gzip':>7s} {'br':>7s}"
+              f" {'model ms':>9s} {'trusted ms':>10s} {'req ms':>7s} {'req gzip ms':>11s}")
+
+        for path, rows, schema in endpoints:
+            sizes = {}
+            for encoding in ("identity",) + ENCODINGS:
+                response = client.get(path, headers={**auth, "Accept-Encoding": encoding})
+                sizes[encoding] = response.num_bytes_downloaded
+
+            model_ms = cpu_ms(lambda: response_model_body(rows, schema), repeat)
+            trusted_ms = cpu_ms(lambda: trusted_response(rows, schema).body, repeat)
+            request_ms = cpu_ms(lambda: client.get(path, headers={**auth, "Accept-Encoding": "identity"}), repeat)
+            gzip_ms = cpu_ms(lambda: client.get(path, headers={**auth, "Accept-Encoding": "gzip"}), repeat)
+
+            print(f"{path:22s} {len(rows):5d} {sizes['identity']:9d} {sizes['gzip']:7d} {sizes.get('br', 0) or '-':>7}"
+                  f" {model_ms:9.3f} {trusted_ms:10.3f} {request_ms:7.3f} {gzip_ms:11.3f}")
+
+
+if __name__ == "__main__":
+    main()
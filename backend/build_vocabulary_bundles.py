@@ -0,0 +1,23 @@
+"""
+Build the precompressed HSK vocabulary bundles
+Run after changing vocabulary: python build_vocabulary_bundles.py [directory]
+Writes to VOCABULARY_BUNDLE_DIR unless a directory is given
+"""
+import sys
+from app.config import settings
+from app.services.vocabulary_bundles import write_bundles
+
+
+def build_vocabulary_bundles(directory=None):
+    directory = directory or settings.VOCABULARY_BUNDLE_DIR
+    if not directory:
+        print("VOCABULARY_BUNDLE_DIR is not set; the API builds bundles in memory")
+        return 0
+
+    count = write_bundles(directory)
+    print(f"Wrote {count} vocabulary bundles to {directory}")
+    return count
+
+
+if __name__ == "__main__":
+    build_vocabulary_bundles(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,49 @@
+"""
+Import HSK vocabulary from CSV or JSONL files
+Run: python import_vocabulary.py [files...] [--hsk-level N] [--dry-run]
+Without files, imports the bundled word lists in data/vocabulary/
+
+Rows are upserted on (simplified, hsk_level), so the import can be re-run
+at any time; see app/services/vocabulary_import.py for the file format.
+"""
+import argparse
+import glob
+import os
+from app.database import SessionLocal
+from app.services.vocabulary_import import import_vocabulary
+from build_vocabulary_bundles import build_vocabulary_bundles
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "vocabulary")
+
+
+def default_files():
+    return sorted(glob.glob(os.path.join(DATA_DIR, "*.jsonl")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import HSK vocabulary from CSV or JSONL files")
+    parser.add_argument("files", nargs="*", help="CSV or JSONL files (default: data/vocabulary/*.jsonl)")
+    parser.add_argument("--hsk-level", type=int, help="HSK level for rows without an hsk_level column")
+    parser.add_argument("--batch-size", type=int, default=1000, help="rows per INSERT ... ON CONFLICT statement")
+    parser.add_argument("--dry-run", action="store_true", help="report the counts without writing")
+    args = parser.parse_args()
+
+    files = args.files or default_files()
+    db = SessionLocal()
+    try:
+        report = import_vocabulary(db, files, args.hsk_level, args.batch_size, args.dry_run)
+    finally:
+        db.close()
+
+    for error in report.errors:
+        print(f"[INVALID] {error}")
+    if report.invalid > len(report.errors):
+        print(f"[INVALID] ... and {report.invalid - len(report.errors)} more")
+    print(f"{'[DRY RUN] ' if args.dry_run else ''}Imported {len(files)} file(s): {report.summary()}")
+
+    if not args.dry_run and (report.added or report.updated):
+        build_vocabulary_bundles()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The app reads DATABASE_URL at import time; the tests build their own engines
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
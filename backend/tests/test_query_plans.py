@@ -0,0 +1,99 @@
+"""
+Query plan regression tests for the due-review queue
+
+The queries behind /learning/review, /learning/review-count and the stats
+endpoint must keep using ix_user_progress_user_next_review. The SQLite
+checks always run; the PostgreSQL checks run against TEST_POSTGRES_URL, a
+scratch database whose tables are created and dropped by the test.
+"""
+import json
+import os
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine, text
+from app.database import Base
+from app.services.learning_service import due_count_query, due_reviews_query
+
+INDEX = "ix_user_progress_user_next_review"
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def explain(conn, statement, prefix):
+    compiled = statement.compile(bind=conn)
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+    return conn.exec_driver_sql(f"{prefix} {compiled.string}", params).all()
+
+
+@pytest.fixture
+def sqlite_conn():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        yield conn
+    engine.dispose()
+
+
+def sqlite_plan(conn, statement) -> str:
+    return "\n".join(row[-1] for row in explain(conn, statement, "EXPLAIN QUERY PLAN"))
+
+
+def test_sqlite_due_count_uses_covering_index(sqlite_conn):
+    plan = sqlite_plan(sqlite_conn, due_count_query(1, NOW))
+    assert f"USING COVERING INDEX {INDEX}" in plan
+
+
+def test_sqlite_due_list_walks_index_in_order(sqlite_conn):
+    plan = sqlite_plan(sqlite_conn, due_reviews_query(1, NOW).limit(50))
+    assert f"USING INDEX {INDEX}" in plan
+    assert "TEMP B-TREE" not in plan  # no sort step
+
+
+@pytest.fixture
+def postgres_conn():
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO users (id, username, email, hashed_password) "
+                "SELECT g, 'user' || g, 'user' || g || '@example.com', 'x' FROM generate_series(1, 200) g"
+            ))
+            conn.execute(text(
+                "INSERT INTO hanzi_words (id, simplified, traditional, pinyin, english, hsk_level) "
+                "SELECT g, 'w' || g, 'w' || g, 'pin', 'word', 1 + g % 6 FROM generate_series(1, 500) g"
+            ))
+            conn.execute(text(
+                "INSERT INTO user_progress (user_id, word_id, next_review) "
+                "SELECT u, w, :now + (w - 250) * interval '1 day' "
+                "FROM generate_series(1, 200) u, generate_series(1, 500) w"
+            ), {"now": NOW})
+        # VACUUM sets the visibility map an index-only scan relies on
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM ANALYZE user_progress")
+            yield conn
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def postgres_plan(conn, statement) -> str:
+    (plan,), = explain(conn, statement, "EXPLAIN (FORMAT JSON)")
+    return json.dumps(plan)
+
+
+def test_postgres_due_count_is_index_only(postgres_conn):
+    plan = postgres_plan(postgres_conn, due_count_query(1, NOW))
+    assert '"Index Only Scan"' in plan
+    assert f'"{INDEX}"' in plan
+
+
+def test_postgres_due_list_walks_index_in_order(postgres_conn):
+    plan = postgres_plan(postgres_conn, due_reviews_query(1, NOW + timedelta(days=1)).limit(50))
+    assert f'"{INDEX}"' in plan
+    assert '"Sort"' not in plan
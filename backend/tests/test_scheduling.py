@@ -0,0 +1,44 @@
+"""
+The Python and NumPy scheduler paths must give identical results, also for
+states outside the ranges the schedulers themselves produce
+"""
+import itertools
+import pytest
+from app.services.scheduling import SCHEDULERS
+
+np = pytest.importorskip("numpy")
+
+QUALITIES = range(6)
+
+EDGE_STATES = {
+    "sm2": [
+        {},
+        {"correct_count": 0, "incorrect_count": 0, "easiness_factor": 1.3, "interval": 0, "repetitions": 0},
+        {"correct_count": 3, "incorrect_count": 7, "easiness_factor": 1.0, "interval": 1, "repetitions": 1},
+        {"correct_count": 40, "incorrect_count": 2, "easiness_factor": 3.5, "interval": 400, "repetitions": 30},
+    ],
+    "fsrs": [
+        {},
+        {"stability": 0.0, "difficulty": 0.0, "elapsed_days": 0.0},
+        {"stability": 2.0, "difficulty": 0.0, "elapsed_days": 1.0},
+        {"stability": 2.0, "difficulty": -3.0, "elapsed_days": 5.0},
+        {"stability": 0.01, "difficulty": 1.0, "elapsed_days": 0.0},
+        {"stability": 365.0, "difficulty": 10.0, "elapsed_days": 1000.0},
+        {"stability": 5.0, "difficulty": 12.0, "elapsed_days": 5.0, "repetitions": 4, "correct_count": 4},
+    ],
+}
+
+
+@pytest.mark.parametrize("name", sorted(EDGE_STATES))
+def test_python_and_numpy_paths_agree(name):
+    scheduler = SCHEDULERS[name]
+    cases = list(itertools.product(EDGE_STATES[name], QUALITIES))
+    fields = scheduler.state_defaults
+    states = {field: [state.get(field) for state, _ in cases] for field in fields}
+    quality = [quality for _, quality in cases]
+
+    vectorized = scheduler.schedule(states, quality, as_arrays=True)
+    for i, (state, grade) in enumerate(cases):
+        expected = scheduler.schedule_one(state, grade)
+        for field, value in expected.items():
+            assert vectorized[field][i] == pytest.approx(value), (state, grade, field)
@@ -51,6 +51,11 @@ export default function Navbar() {
         }
       }
 
+      // The server pushes the count when it changes; poll only without EventSource
+      if (typeof EventSource !== 'undefined') {
+        return learningApi.subscribeReviewCount(setReviewCount)
+      }
+
       fetchReviewCount()
 
       // Refresh count every 5 minutes
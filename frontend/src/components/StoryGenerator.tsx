@@ -40,6 +40,7 @@ export default function StoryGenerator() {
   const [loading, setLoading] = useState(false)
   const [generatedStory, setGeneratedStory] = useState<GeneratedStory | null>(null)
   const [generatedStoryId, setGeneratedStoryId] = useState<number | null>(null)
+  const [draft, setDraft] = useState({ title: '', content: '' })
   const [usageStats, setUsageStats] = useState<UsageStats | null>(null)
   const [error, setError] = useState<string | null>(null)
 
@@ -48,6 +49,7 @@ export default function StoryGenerator() {
     setError(null)
     setGeneratedStory(null)
     setGeneratedStoryId(null)
+    setDraft({ title: '', content: '' })
 
     try {
       const characterNamesArray = characterNames
@@ -55,12 +57,15 @@ export default function StoryGenerator() {
         .map(name => name.trim())
         .filter(name => name.length > 0)
 
-      const response: GenerateResponse = await storiesApi.generateStory({
-        hsk_level: hskLevel,
-        topic: topic || undefined,
-        character_names: characterNamesArray.length > 0 ? characterNamesArray : undefined,
-        length
-      })
+      const response: GenerateResponse = await storiesApi.generateStoryStream(
+        {
+          hsk_level: hskLevel,
+          topic: topic || undefined,
+          character_names: characterNamesArray.length > 0 ? characterNamesArray : undefined,
+          length
+        },
+        (field, text) => setDraft(prev => ({ ...prev, [field]: prev[field] + text }))
+      )
 
       setGeneratedStory(response.story)
       setGeneratedStoryId(response.story_id)
@@ -265,6 +270,18 @@ export default function StoryGenerator() {
         </motion.div>
       )}
 
+      {/* Story being written */}
+      {loading && (draft.title || draft.content) && (
+        <Card className="bg-gradient-to-br from-primary-50 to-purple-50">
+          <h2 className="text-2xl font-bold text-gray-900 mb-4">{draft.title}</h2>
+          <div className="bg-white rounded-lg p-6">
+            <p className="text-gray-800 leading-relaxed text-lg whitespace-pre-wrap">
+              {draft.content}
+            </p>
+          </div>
+        </Card>
+      )}
+
       {/* Generated Story */}
       {generatedStory && (
         <motion.div
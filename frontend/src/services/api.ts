@@ -84,6 +84,61 @@ export const storiesApi = {
     return response.data
   },
 
+  // Same result as generateStory, with the title and content passed to
+  // onDelta piece by piece while the story is being written
+  generateStoryStream: async (
+    request: {
+      hsk_level: number
+      topic?: string
+      character_names?: string[]
+      length?: 'short' | 'medium' | 'long'
+    },
+    onDelta: (field: 'title' | 'content', text: string) => void
+  ) => {
+    const token = localStorage.getItem('access_token')
+    const response = await fetch(`${API_URL}/stories/generate/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(token && { Authorization: `Bearer ${token}` }),
+      },
+      body: JSON.stringify(request),
+    })
+    if (!response.ok || !response.body) {
+      // Same shape as an axios error, so callers handle both alike
+      const data = await response.json().catch(() => ({}))
+      throw { response: { status: response.status, data } }
+    }
+
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ''
+    for (;;) {
+      const { done, value } = await reader.read()
+      if (done) break
+      buffer += decoder.decode(value, { stream: true })
+
+      let end
+      while ((end = buffer.indexOf('\n\n')) !== -1) {
+        const block = buffer.slice(0, end)
+        buffer = buffer.slice(end + 2)
+        const event = block.match(/^event: (.*)$/m)?.[1]
+        const data = block.match(/^data: (.*)$/m)?.[1]
+        if (!event || data === undefined) continue
+
+        const payload = JSON.parse(data)
+        if (event === 'title' || event === 'content') {
+          onDelta(event, payload.delta)
+        } else if (event === 'done') {
+          return payload
+        } else if (event === 'error') {
+          throw { response: { status: 500, data: payload } }
+        }
+      }
+    }
+    throw { response: { status: 500, data: { detail: 'Story stream ended unexpectedly' } } }
+  },
+
   getAIUsageStats: async () => {
     const response = await api.get('/stories/ai-usage-stats')
     return response.data
@@ -103,8 +158,9 @@ export const vocabularyApi = {
   },
 
   getByHSKLevel: async (level: number, category?: string): Promise<HanziWord[]> => {
+    // Redirects to a precompressed bundle cached by the browser until the vocabulary changes
     const params = category ? { category } : {}
-    const response = await api.get(`/vocabulary/hsk/${level}`, { params })
+    const response = await api.get(`/vocabulary/bundles/hsk/${level}`, { params })
     return response.data
   },
 
@@ -235,6 +291,18 @@ export const learningApi = {
     const response = await api.get('/learning/review-count')
     return response.data
   },
+
+  // Push updates of the review count (server-sent events); returns an unsubscribe function
+  subscribeReviewCount: (onCount: (count: number) => void) => {
+    const token = localStorage.getItem('access_token') ?? ''
+    const source = new EventSource(
+      `${API_URL}/learning/review-count/stream?token=${encodeURIComponent(token)}`
+    )
+    source.addEventListener('review-count', (event) => {
+      onCount(JSON.parse((event as MessageEvent).data).count)
+    })
+    return () => source.close()
+  },
 }
 
 // Quiz API
@@ -19,7 +19,9 @@ export interface HanziWord {
 export interface Story {
   id: number
   title: string
+  title_pinyin?: string
   content: string
+  content_pinyin?: string
   english_translation?: string
   hsk_level: number
   author_id: number
@@ -2,40 +2,58 @@
 Migration script to update old progress records to use SRS system
 This will add next_review dates to existing UserProgress records
 """
-from backend.app.database import SessionLocal
-from backend.app.models import UserProgress
-from datetime import datetime, timedelta
-
-db = SessionLocal()
-
-try:
-    # Get all progress records with null next_review
-    old_progress = db.query(UserProgress).filter(
-        UserProgress.next_review == None
-    ).all()
-
-    print(f'Found {len(old_progress)} old progress records to migrate')
-
-    for progress in old_progress:
-        # Set default values for SRS fields
-        progress.mastery_level = 1  # Starting mastery level
-        progress.easiness_factor = 2.5  # Default SM-2 easiness factor
-        progress.interval = 1  # Start with 1 day interval
-        progress.repetitions = 1  # They've seen it at least once
-
-        # Set next review to tomorrow (so they appear in review queue)
-        progress.next_review = datetime.utcnow() + timedelta(days=1)
-        progress.last_reviewed = datetime.utcnow()
-
-        print(f'  Migrated: User {progress.user_id}, Word {progress.word_id}')
-
-    db.commit()
-    print(f'\n✅ Successfully migrated {len(old_progress)} records!')
-    print('These words will be available for review starting tomorrow.')
-
-except Exception as e:
-    print(f'❌ Error during migration: {e}')
-    db.rollback()
-
-finally:
-    db.close()
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import update
+
+# The services import the backend as the top-level `app` package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+from app.database import AsyncSessionLocal
+from app.models import UserProgress
+from app.services.stats_service import StatsService
+
+
+async def migrate():
+    now = datetime.now(timezone.utc)
+
+    async with AsyncSessionLocal() as db:
+        try:
+            # One UPDATE for all progress records with null next_review
+            result = await db.execute(
+                update(UserProgress)
+                .where(UserProgress.next_review.is_(None))
+                .values(
+                    mastery_level=1,  # Starting mastery level
+                    easiness_factor=2.5,  # Default SM-2 easiness factor
+                    interval=1,  # Start with 1 day interval
+                    repetitions=1,  # They've seen it at least once
+                    # Set next review to tomorrow (so they appear in review queue)
+                    next_review=now + timedelta(days=1),
+                    last_reviewed=now
+                )
+                .returning(UserProgress.user_id, UserProgress.word_id)
+            )
+            migrated = result.all()
+            print(f'Found {len(migrated)} old progress records to migrate')
+            for user_id, word_id in migrated:
+                print(f'  Migrated: User {user_id}, Word {word_id}')
+
+            # mastery_level changed outside LearningService: recompute the
+            # materialized stats of the affected users
+            for user_id in sorted({user_id for user_id, _ in migrated}):
+                await StatsService.rebuild_learning_stats(db, user_id)
+
+            await db.commit()
+            print(f'\n✅ Successfully migrated {len(migrated)} records!')
+            print('These words will be available for review starting tomorrow.')
+
+        except Exception as e:
+            print(f'❌ Error during migration: {e}')
+            await db.rollback()
+
+
+if __name__ == '__main__':
+    asyncio.run(migrate())